@@ -0,0 +1,121 @@
+"""
+Проверки точности физических генераторов и таблиц ослабления
+
+Выборки углов рассеяния сравниваются критерием хи-квадрат с плотностями,
+из которых они должны выбираться: Клейн-Нишина с функцией некогерентного
+рассеяния для комптоновского рассеяния и (1 + cos^2) с квадратом формфактора
+для рэлеевского. Интервалы равновероятны по эталонной плотности.
+Линейная интерполяция ЛКО сравнивается с таблицами NIST в узлах и
+с логарифмической интерполяцией между узлами
+"""
+from typing import Any, Callable, Dict
+
+import numpy as np
+import hepunits as units
+from numpy.typing import NDArray
+
+from core.other.typing_definitions import Float
+
+# Порог хи-квадрат на степень свободы: 5 стандартных отклонений от 1
+SIGMAS = 5
+
+
+def klein_nishina_density(energy: Float, Z: int) -> Callable[[NDArray[Float]], NDArray[Float]]:
+    """ Ненормированная плотность 1 - cos(theta) комптоновского рассеяния """
+    from core.physics.g4compton import compute_scattering_function, electron_mass_c2
+
+    wavelength = units.h_Planck*units.c_light/energy
+    e0m = energy/electron_mass_c2
+
+    def density(t: NDArray[Float]) -> NDArray[Float]:
+        epsilon = 1/(1 + e0m*t)
+        sin_sq = t*(2 - t)
+        x = np.sqrt(t/2)*units.cm/wavelength
+        return epsilon**2*(epsilon + 1/epsilon - sin_sq)*compute_scattering_function(x, np.full(t.shape, Z, dtype=np.int64))
+    return density
+
+
+def rayleigh_density(energy: Float, Z: int) -> Callable[[NDArray[Float]], NDArray[Float]]:
+    """ Ненормированная плотность 1 - cos(theta) рэлеевского рассеяния """
+    from core.physics.g4coherent import form_factor_squared
+
+    def density(t: NDArray[Float]) -> NDArray[Float]:
+        cost = 1 - t
+        return (1 + cost**2)*form_factor_squared(energy, cost, np.full(t.shape, Z, dtype=np.int64))
+    return density
+
+
+def chi_square(theta: NDArray[Float], density: Callable[[NDArray[Float]], NDArray[Float]], bins: int = 50) -> Dict[str, Any]:
+    """ Хи-квадрат выборки углов против плотности по t = 1 - cos(theta) в равновероятных интервалах """
+    t = np.geomspace(1e-12, 2., 200001)
+    values = density(t)
+    cdf = np.concatenate(([0.], np.cumsum((values[1:] + values[:-1])/2*np.diff(t))))
+    cdf /= cdf[-1]
+    edges = np.interp(np.linspace(0., 1., bins + 1), cdf, t)
+    edges[0], edges[-1] = 0., 2.
+    observed, _ = np.histogram(1 - np.cos(theta), edges)
+    expected = theta.size/bins
+    value = Float(np.sum((observed - expected)**2/expected))
+    degrees = bins - 1
+    reduced = value/degrees
+    return {
+        'chi2_per_dof': reduced,
+        'dof': degrees,
+        'passed': bool(reduced < 1 + SIGMAS*np.sqrt(2/degrees))
+    }
+
+
+def check_sampler(name: str, size: int = 10**6, energy: Float = Float(140.5*units.keV), Z: int = 8, seed: int = 42) -> Dict[str, Any]:
+    """ Хи-квадрат генератора угла compton или rayleigh """
+    import core.physics.g4coherent as g4coherent
+    import core.physics.g4compton as g4compton
+
+    module, density = {
+        'compton': (g4compton, klein_nishina_density),
+        'rayleigh': (g4coherent, rayleigh_density)
+    }[name]
+    theta_generator = module.initialize(np.random.default_rng(seed))
+    theta = theta_generator(np.full(size, energy), np.full(size, Z, dtype=np.int64))
+    return {'energy_keV': energy/units.keV, 'Z': Z, 'size': size, **chi_square(theta, density(energy, Z))}
+
+
+def interpolation_error(energy_range: tuple = (20*units.keV, 200*units.keV)) -> Dict[str, Any]:
+    """
+    Ошибки интерполяции ЛКО всех материалов и процессов
+
+    node_error - относительное отклонение от таблицы в её узлах (должно быть 0),
+    loglog_error - отклонение линейной интерполяции от логарифмической
+    в серединах интервалов таблицы внутри energy_range
+    """
+    from settings.database_setting import attenuation_database
+    import settings.processes_settings as processes_settings
+
+    node_error = Float(0.)
+    loglog_error: Dict[str, Float] = {}
+    for process_class in processes_settings.processes_list:
+        process = process_class(attenuation_database)
+        worst = Float(0.)
+        for material, (energy, coefficient) in process.attenuation_function.items():
+            if np.any(coefficient <= 0):
+                continue
+            node_error = max(node_error, Float(np.max(np.abs(process.attenuation_function(material, energy)/coefficient - 1))))
+            inside = (energy[:-1] >= energy_range[0]) & (energy[1:] <= energy_range[1]) & (energy[1:] > energy[:-1]*1.001)
+            if not inside.any():
+                continue
+            lower, upper = energy[:-1][inside], energy[1:][inside]
+            middle = np.sqrt(lower*upper)
+            reference = np.exp(np.interp(np.log(middle), np.log(energy), np.log(coefficient)))
+            worst = max(worst, Float(np.max(np.abs(process.attenuation_function(material, middle)/reference - 1))))
+        loglog_error[process.name] = worst
+    return {'node_error': node_error, 'loglog_error': loglog_error, 'passed': bool(node_error < 1e-12)}
+
+
+def run_checks(size: int = 10**6, seed: int = 42) -> Dict[str, Any]:
+    """ Все проверки точности """
+    return {
+        'compton_water': check_sampler('compton', size, Z=8, seed=seed),
+        'compton_lead': check_sampler('compton', size, Z=82, seed=seed),
+        'rayleigh_water': check_sampler('rayleigh', size, Z=8, seed=seed),
+        'rayleigh_lead': check_sampler('rayleigh', size, Z=82, seed=seed),
+        'attenuation_interpolation': interpolation_error()
+    }
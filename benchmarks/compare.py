@@ -0,0 +1,61 @@
+"""
+Сравнение двух запусков benchmarks.run
+
+    python -m benchmarks.compare benchmarks/results/<base>.json benchmarks/results/<new>.json [--threshold 0.05]
+
+Скорости (*_per_second) должны не падать, пиковая память - не расти больше
+чем на threshold. Код возврата 1, если найдено ухудшение
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+LOWER_IS_BETTER = ('peak_rss_mb', )
+
+
+def compared_metrics(result: Dict[str, Any]) -> List[str]:
+    return [metric for metric in result if metric.endswith('_per_second') or metric in LOWER_IS_BETTER]
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> Tuple[List[str], List[str]]:
+    """ Строки таблицы сравнения и список ухудшений """
+    lines = [f'{"scenario":<18} {"metric":<28} {"base":>12} {"new":>12} {"change":>8}']
+    regressions = []
+    for name, new_result in new['scenarios'].items():
+        base_result = base['scenarios'].get(name)
+        if base_result is None or 'error' in base_result or 'error' in new_result:
+            lines.append(f'{name:<18} {"skipped":<28}')
+            continue
+        for metric in compared_metrics(new_result):
+            if metric not in base_result or base_result[metric] == 0:
+                continue
+            change = new_result[metric]/base_result[metric] - 1
+            worse = change > threshold if metric in LOWER_IS_BETTER else change < -threshold
+            mark = ' !' if worse else ''
+            lines.append(f'{name:<18} {metric:<28} {base_result[metric]:>12.4g} {new_result[metric]:>12.4g} {change:>+8.1%}{mark}')
+            if worse:
+                regressions.append(f'{name} {metric} {change:+.1%}')
+    return lines, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Сравнение результатов замеров производительности')
+    parser.add_argument('base', type=Path)
+    parser.add_argument('new', type=Path)
+    parser.add_argument('--threshold', type=float, default=0.05, help='допустимое относительное ухудшение')
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text(encoding='utf-8'))
+    new = json.loads(args.new.read_text(encoding='utf-8'))
+    print(f'base {base["environment"]["commit"][:12]}, new {new["environment"]["commit"][:12]}')
+    lines, regressions = compare(base, new, args.threshold)
+    print('\n'.join(lines))
+    if regressions:
+        print(f'Regressions: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
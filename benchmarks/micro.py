@@ -0,0 +1,167 @@
+"""
+Микрозамеры горячих функций переноса и проверки их точности
+
+Для каждой функции и размера пакета (по умолчанию 10^3 - 10^7) берётся лучшее
+время из повторов после прогрева и пересчитывается в нс на частицу.
+Результат в формате benchmarks.run (сравнивается через benchmarks.compare)
+дополняется проверками benchmarks.accuracy
+
+    python -m benchmarks.micro [--targets compton_theta cast_path] [--sizes 1000 1000000]
+"""
+import argparse
+import json
+import logging
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import hepunits as units
+
+from benchmarks.accuracy import run_checks
+from benchmarks.run import RESULTS, environment
+
+_logger = logging.getLogger(__name__)
+
+Prepare = Callable[[np.random.Generator, int], Callable[[], Any]]
+
+
+def _directions(rng: np.random.Generator, size: int) -> np.ndarray:
+    direction = rng.normal(size=(size, 3))
+    return direction/np.linalg.norm(direction, axis=1)[:, np.newaxis]
+
+
+def attenuation(rng: np.random.Generator, size: int) -> Callable[[], Any]:
+    """ AttenuationFunction.__call__ для смеси материалов тела """
+    from core.materials.materials import MaterialArray
+    from core.physics.processes import ComptonScattering
+    from settings.database_setting import attenuation_database, material_database
+
+    process = ComptonScattering(attenuation_database, rng)
+    materials = [material_database[name] for name in ('Lung', 'Adipose Tissue (ICRU-44)', 'Tissue, Soft (ICRU-44)', 'Bone, Cortical (ICRU-44)')]
+    material = MaterialArray.from_indices(rng.integers(0, len(materials), size), materials)
+    energy = rng.uniform(20*units.keV, 140.5*units.keV, size)
+    return lambda: process.attenuation_function(material, energy)
+
+
+def compton_theta(rng: np.random.Generator, size: int) -> Callable[[], Any]:
+    """ Угол комптоновского рассеяния в воде при 140.5 кэВ """
+    import core.physics.g4compton as g4compton
+
+    theta_generator = g4compton.initialize(rng)
+    energy, Z = np.full(size, 140.5*units.keV), np.full(size, 8, dtype=np.int64)
+    return lambda: theta_generator(energy, Z)
+
+
+def rayleigh_theta(rng: np.random.Generator, size: int) -> Callable[[], Any]:
+    """ Угол рэлеевского рассеяния в воде при 140.5 кэВ """
+    import core.physics.g4coherent as g4coherent
+
+    theta_generator = g4coherent.initialize(rng)
+    energy, Z = np.full(size, 140.5*units.keV), np.full(size, 8, dtype=np.int64)
+    return lambda: theta_generator(energy, Z)
+
+
+def source(rng: np.random.Generator, size: int) -> Callable[[], Any]:
+    """ Source.generate_particles из распределения 128^3 """
+    from core.source.sources import Source
+
+    source = Source(distribution=rng.random((128, 128, 128)), activity=300*units.MBq, voxel_size=4*units.mm, rng=rng)
+    return lambda: source.generate_particles(size)
+
+
+def box_ray_casting(rng: np.random.Generator, size: int) -> Callable[[], Any]:
+    """ Box.ray_casting из точек внутри и снаружи коробки """
+    from core.geometry.geometries import Box
+
+    box = Box(30*units.cm, 30*units.cm, 30*units.cm)
+    position = rng.uniform(-30*units.cm, 30*units.cm, (size, 3))
+    direction = _directions(rng, size)
+    return lambda: box.ray_casting(position, direction)
+
+
+def cast_path(rng: np.random.Generator, size: int) -> Callable[[], Any]:
+    """ VolumeWithChilds.cast_path в сцене из водного фантома и двух головок """
+    from core.transport.studies import build_gamma_cameras, read_study_config
+    from core.geometry.geometries import Box
+    from core.geometry.volumes import TransformableVolume, VolumeWithChilds
+    from settings.database_setting import material_database
+
+    simulation_volume = VolumeWithChilds(
+        geometry=Box(120*units.cm, 120*units.cm, 80*units.cm),
+        material=material_database['Air, Dry (near sea level)'],
+        name='Simulation_volume'
+    )
+    TransformableVolume(
+        geometry=Box(30*units.cm, 20*units.cm, 40*units.cm),
+        material=material_database['Water, Liquid'],
+        name='Water box'
+    ).set_parent(simulation_volume)
+    config = read_study_config(Path(__file__).parent/'studies'/'torso.toml')
+    for gamma_camera in build_gamma_cameras(config, 0.):
+        simulation_volume.add_child(gamma_camera)
+    position = rng.uniform(-20*units.cm, 20*units.cm, (size, 3))
+    direction = _directions(rng, size)
+    return lambda: simulation_volume.cast_path(position, direction)
+
+
+TARGETS: Dict[str, Prepare] = {
+    'attenuation': attenuation,
+    'compton_theta': compton_theta,
+    'rayleigh_theta': rayleigh_theta,
+    'source': source,
+    'box_ray_casting': box_ray_casting,
+    'cast_path': cast_path
+}
+
+
+def measure(call: Callable[[], Any], size: int, min_time: float = 0.2, min_repeats: int = 3) -> Dict[str, float]:
+    """ Лучшее время вызова после прогрева """
+    call()
+    times: List[float] = []
+    while len(times) < min_repeats or sum(times) < min_time:
+        start = perf_counter()
+        call()
+        times.append(perf_counter() - start)
+    best = min(times)
+    return {
+        'ns_per_particle': best/size*1e9,
+        'particles_per_second': size/best,
+        'repeats': len(times)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Микрозамеры и проверки точности')
+    parser.add_argument('--targets', nargs='+', choices=sorted(TARGETS), default=list(TARGETS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10**3, 10**4, 10**5, 10**6, 10**7])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--accuracy-size', type=int, default=10**6, help='размер выборок проверки точности (0 - без проверки)')
+    parser.add_argument('--output', type=Path, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(format='[%(asctime)s: %(levelname)s] %(message)s', level=logging.INFO)
+
+    report: Dict[str, Any] = {
+        'environment': environment(),
+        'parameters': {'seed': args.seed, 'sizes': args.sizes},
+        'scenarios': {}
+    }
+    for target in args.targets:
+        for size in args.sizes:
+            result = measure(TARGETS[target](np.random.default_rng(args.seed), size), size)
+            report['scenarios'][f'{target} {size}'] = result
+            _logger.info(f'{target} {size}: {result["ns_per_particle"]:.1f} ns/particle')
+    if args.accuracy_size > 0:
+        report['accuracy'] = run_checks(args.accuracy_size, args.seed)
+        for name, check in report['accuracy'].items():
+            _logger.log(logging.INFO if check['passed'] else logging.ERROR, f'{name}: {"passed" if check["passed"] else "FAILED"}')
+
+    output = RESULTS/f'micro {report["environment"]["commit"][:12]}.json' if args.output is None else args.output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, default=float), encoding='utf-8')
+    _logger.info(f'Results saved to {output}')
+
+
+if __name__ == '__main__':
+    main()
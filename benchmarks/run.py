@@ -0,0 +1,110 @@
+"""
+Замеры производительности переноса на сценариях с фиксированным зерном
+
+Каждый повтор сценария выполняется в отдельном процессе, чтобы пиковая
+память и компиляция numba не зависели от других сценариев. Результат
+сохраняется в JSON (по умолчанию benchmarks/results/<коммит>.json)
+и сравнивается с другим запуском через benchmarks.compare
+
+    python -m benchmarks.run [--scenarios water_box torso_2_heads] [--repeats 3]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numba
+import numpy as np
+
+from benchmarks.scenarios import SCENARIOS
+
+_logger = logging.getLogger(__name__)
+
+RESULTS = Path(__file__).parent/'results'
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(['git', *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def environment() -> Dict[str, Any]:
+    """ Коммит и окружение, в котором сделаны замеры """
+    return {
+        'commit': _git('rev-parse', 'HEAD') or 'unknown',
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'numba': numba.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def _run_scenario(name: str, seed: int, particles_number: int, steps: int, warmup_steps: int) -> Dict[str, float]:
+    logging.disable(logging.INFO)
+    return {metric: float(value) for metric, value in SCENARIOS[name](seed, particles_number, steps, warmup_steps).items()}
+
+
+def run_scenario(name: str, repeats: int, seed: int, particles_number: int, steps: int, warmup_steps: int) -> Dict[str, Any]:
+    """ Повторы сценария в отдельных процессах, медиана по повторам (пиковая память - максимум) """
+    runs: List[Dict[str, Any]] = []
+    for _ in range(repeats):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            runs.append(executor.submit(_run_scenario, name, seed, particles_number, steps, warmup_steps).result())
+    metrics = [metric for metric in runs[0] if all(metric in run for run in runs)]
+    result: Dict[str, Any] = {metric: float(np.median([run[metric] for run in runs])) for metric in metrics}
+    result['peak_rss_mb'] = max(run['peak_rss_mb'] for run in runs)
+    result['runs'] = runs
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Замеры производительности переноса')
+    parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--particles', type=int, default=10**5, help='число частиц в потоке переноса')
+    parser.add_argument('--steps', type=int, default=50, help='число замеряемых шагов')
+    parser.add_argument('--warmup', type=int, default=5, help='число шагов прогрева')
+    parser.add_argument('--output', type=Path, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(format='[%(asctime)s: %(levelname)s] %(message)s', level=logging.INFO)
+
+    report: Dict[str, Any] = {
+        'environment': environment(),
+        'parameters': {'seed': args.seed, 'particles': args.particles, 'steps': args.steps, 'warmup': args.warmup, 'repeats': args.repeats},
+        'scenarios': {}
+    }
+    for name in args.scenarios:
+        _logger.info(f'Running {name}')
+        try:
+            result = run_scenario(name, args.repeats, args.seed, args.particles, args.steps, args.warmup)
+        except Exception as error:
+            _logger.error(f'{name} failed: {error!r}')
+            report['scenarios'][name] = {'error': ''.join(traceback.format_exception_only(error)).strip()}
+            continue
+        report['scenarios'][name] = result
+        _logger.info(', '.join(f'{metric} {value:.4g}' for metric, value in result.items() if metric != 'runs'))
+
+    output = RESULTS/f'{report["environment"]["commit"][:12]}.json' if args.output is None else args.output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    _logger.info(f'Results saved to {output}')
+
+
+if __name__ == '__main__':
+    main()
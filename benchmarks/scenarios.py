@@ -0,0 +1,208 @@
+import resource
+from functools import partial
+from pathlib import Path
+from queue import Empty, Queue
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+import numpy as np
+import hepunits as units
+
+from core.data.writers import HDF5Writer
+from core.other.typing_definitions import Float
+from core.transport.simulation_managers import SimulationManager
+
+STUDIES = Path(__file__).parent/'studies'
+
+MIN_WRITTEN_EVENTS = 1000
+
+
+def peak_rss() -> Float:
+    """ Пиковый объём резидентной памяти процесса, МБ """
+    return Float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/2**10)
+
+
+def _count_emitted(source: Any) -> Dict[str, int]:
+    """ Считать частицы, выпущенные источником """
+    counter = {'photons': 0}
+    generate_particles = source.generate_particles
+
+    def counting(n: int) -> Any:
+        counter['photons'] += n
+        return generate_particles(n)
+
+    source.generate_particles = counting
+    return counter
+
+
+def water_box(seed: int, particles_number: int) -> SimulationManager:
+    """ Точечный источник 99mTc в центре водного куба 30 см """
+    from core.geometry.geometries import Box
+    from core.geometry.volumes import TransformableVolume, VolumeWithChilds
+    from core.source.sources import PointSource
+    from core.transport.propagation_managers import PropagationWithInteraction
+    from settings.database_setting import attenuation_database, material_database
+
+    rng = np.random.default_rng(seed)
+    simulation_volume = VolumeWithChilds(
+        geometry=Box(1*units.m, 1*units.m, 1*units.m),
+        material=material_database['Air, Dry (near sea level)'],
+        name='Simulation_volume'
+    )
+    water = TransformableVolume(
+        geometry=Box(30*units.cm, 30*units.cm, 30*units.cm),
+        material=material_database['Water, Liquid'],
+        name='Water box'
+    )
+    water.set_parent(simulation_volume)
+    return SimulationManager(
+        source=PointSource(activity=300*units.MBq, energy=140.5*units.keV, rng=rng),
+        simulation_volume=simulation_volume,
+        propagation_manager=PropagationWithInteraction(attenuation_database=attenuation_database, rng=rng),
+        stop_time=np.inf,
+        particles_number=particles_number
+    )
+
+
+def collimator_slab(seed: int, particles_number: int) -> SimulationManager:
+    """ Параллельный свинцовый коллиматор без детектора, точечный источник в 10 см от него """
+    from core.geometry.geometries import Box
+    from core.geometry.parametric_collimators import ParametricParallelCollimator
+    from core.geometry.volumes import VolumeWithChilds
+    from core.source.sources import PointSource
+    from core.transport.propagation_managers import PropagationWithInteraction
+    from settings.database_setting import attenuation_database, material_database
+
+    rng = np.random.default_rng(seed)
+    simulation_volume = VolumeWithChilds(
+        geometry=Box(60*units.cm, 60*units.cm, 30*units.cm),
+        material=material_database['Air, Dry (near sea level)'],
+        name='Simulation_volume'
+    )
+    collimator = ParametricParallelCollimator(
+        size=(54*units.cm, 40*units.cm, 3.5*units.cm),
+        hole_diameter=1.5*units.mm,
+        septa=0.2*units.mm,
+        material=material_database['Pb'],
+        name='Collimator'
+    )
+    collimator.set_parent(simulation_volume)
+    source = PointSource(activity=300*units.MBq, energy=140.5*units.keV, rng=rng)
+    source.translate(z=-10*units.cm)
+    return SimulationManager(
+        source=source,
+        simulation_volume=simulation_volume,
+        propagation_manager=PropagationWithInteraction(attenuation_database=attenuation_database, rng=rng),
+        stop_time=np.inf,
+        particles_number=particles_number
+    )
+
+
+def study(seed: int, particles_number: int, filename: str) -> SimulationManager:
+    """ Первая проекция исследования из benchmarks/studies """
+    from core.transport.studies import build_simulation, prepare_scene, read_study_config
+
+    config = read_study_config(STUDIES/filename)
+    config.data['particles_number'] = particles_number
+    prepare_scene(config)
+    simulation_manager, _ = build_simulation(config, config.angles[0], (Float(0.), Float(np.inf)), seed)
+    return simulation_manager
+
+
+def measure_transport(simulation_manager: SimulationManager, steps: int, warmup_steps: int) -> Dict[str, Float]:
+    """
+    Выполнить шаги переноса в текущем потоке и записать события в HDF5
+
+    Шаги прогрева (компиляция numba, заполнение кэшей) в замер не входят,
+    время записи вычитается из времени переноса
+    """
+    counter = _count_emitted(simulation_manager.source)
+    simulation_manager.queue = Queue()
+    simulation_manager.particles = simulation_manager.source.generate_particles(simulation_manager.particles_number)
+
+    def drain(writer: Any = None) -> int:
+        events = 0
+        while True:
+            try:
+                data = simulation_manager.queue.get_nowait()
+            except Empty:
+                return events
+            events += data.size
+            if writer is not None:
+                writer.write('interaction_data', data)
+
+    start = perf_counter()
+    for _ in range(warmup_steps):
+        simulation_manager.next_step()
+        drain()
+    warmup_time = perf_counter() - start
+
+    counter['photons'] = 0
+    particle_steps = 0
+    events = 0
+    with TemporaryDirectory() as directory, HDF5Writer(Path(directory)/'events.hdf') as writer:
+        start = perf_counter()
+        for _ in range(steps):
+            particle_steps += simulation_manager.particles.size
+            simulation_manager.next_step()
+            events += drain(writer)
+        elapsed = perf_counter() - start
+        transport_time = elapsed - writer.metrics.write_time
+        events_per_second = writer.metrics.events_per_second
+    result = {
+        'photons': counter['photons'],
+        'particle_steps': particle_steps,
+        'events': events,
+        'warmup_time': warmup_time,
+        'wall_time': elapsed,
+        'photons_per_second': counter['photons']/transport_time,
+        'steps_per_second': particle_steps/transport_time,
+        'peak_rss_mb': peak_rss()
+    }
+    # Скорость записи по нескольким событиям слишком шумная для сравнения
+    if events >= MIN_WRITTEN_EVENTS:
+        result['events_per_second_written'] = events_per_second
+    return result
+
+
+def measure_source(seed: int, particles_number: int, steps: int, warmup_steps: int) -> Dict[str, Float]:
+    """ Выборка частиц из воксельного распределения 128^3 со случайной активностью """
+    from core.source.sources import Source
+
+    rng = np.random.default_rng(seed)
+    source = Source(
+        distribution=rng.random((128, 128, 128)),
+        activity=300*units.MBq,
+        voxel_size=4*units.mm,
+        rng=rng
+    )
+    start = perf_counter()
+    for _ in range(warmup_steps):
+        source.generate_particles(particles_number)
+    warmup_time = perf_counter() - start
+    start = perf_counter()
+    for _ in range(steps):
+        source.generate_particles(particles_number)
+    elapsed = perf_counter() - start
+    return {
+        'photons': particles_number*steps,
+        'warmup_time': warmup_time,
+        'wall_time': elapsed,
+        'photons_per_second': particles_number*steps/elapsed,
+        'peak_rss_mb': peak_rss()
+    }
+
+
+def _transport(build: Callable[..., SimulationManager], seed: int, particles_number: int, steps: int, warmup_steps: int) -> Dict[str, Float]:
+    return measure_transport(build(seed, particles_number), steps, warmup_steps)
+
+
+SCENARIOS: Dict[str, Callable[[int, int, int, int], Dict[str, Float]]] = {
+    'water_box': partial(_transport, water_box),
+    'torso_2_heads': partial(_transport, partial(study, filename='torso.toml')),
+    'torso_4_heads': partial(_transport, partial(study, filename='torso_4heads.toml')),
+    'brain_2_heads': partial(_transport, partial(study, filename='brain.toml')),
+    'collimator_slab': partial(_transport, collimator_slab),
+    'source_sampling': measure_source
+}
@@ -0,0 +1,4 @@
+"""
+Корень тестов: каталог репозитория добавляется в sys.path, поэтому
+пакеты core и settings импортируются при запуске pytest из любого каталога
+"""
@@ -5,18 +5,36 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 import h5py
 import numpy as np
 import hepunits as units
+from numpy.typing import NDArray
 
-from core.data.interaction_data import InteractionArray
+from core.data.detector_response import DetectorResponse
+from core.data.interaction_data import InteractionArray, get_interaction_dtype
+from core.data.projections import ProjectionAccumulator
+from core.data.writers import HDF5Writer
 from core.geometry.volumes import ElementaryVolume, TransformableVolume
 from core.other.typing_definitions import Float
 
 _logger = logging.getLogger(__name__)
-_logger.setLevel(logging.DEBUG)
+
+
+def read_source_timer(filename: Path) -> Optional[Float]:
+    """ Прочитать время источника, до которого данные в файле сохранены полностью """
+    try:
+        with h5py.File(filename, 'r') as file:
+            if 'Source timer' not in file:
+                return None
+            return Float(np.array(file['Source timer']))
+    except Exception:
+        return None
 
 
 class SimulationDataManager:
     """ 
     Основной класс менеджера данных получаемых при моделировании
+
+    События распределяются по чувствительным объёмам по записанному при переносе
+    volume_id. Матрицы перехода в локальные координаты кэшируются при создании,
+    объёмы не должны перемещаться во время моделирования
     """
     filename: Path
     sensitive_volumes: List[ElementaryVolume]
@@ -25,6 +43,16 @@ class SimulationDataManager:
     save_dose_distribution: bool
     distribution_voxel_size: Float
     interaction_buffer_size: int
+    save_events: bool
+    projection_accumulator: Optional[ProjectionAccumulator]
+    compression: Optional[str]
+    compression_opts: Optional[int]
+    shuffle: bool
+    writer: HDF5Writer
+    _dtype: np.dtype
+    _local_matrices: NDArray[Float]
+    _volume_index: NDArray[np.int64]
+    _responses: List[Optional[DetectorResponse]]
     _buffered_interaction_number: int
     interaction_data: Dict[str, List[InteractionArray]]
 
@@ -38,17 +66,47 @@ class SimulationDataManager:
         self.distribution_voxel_size = Float(4. * units.mm)
         self.clear_interaction_data()
         self.interaction_buffer_size = int(10**3)
+        self.save_events = True
+        self.projection_accumulator = None
+        self.compression = 'lzf'
+        self.compression_opts = None
+        self.shuffle = True
         self._buffered_interaction_number = 0
         self.args = [
             'save_emission_distribution',
             'save_dose_distribution',
             'distribution_voxel_size',
-            'interaction_buffer_size'
+            'interaction_buffer_size',
+            'save_events',
+            'projection_accumulator',
+            'compression',
+            'compression_opts',
+            'shuffle'
             ]
 
+        unknown = sorted(set(kwds) - set(self.args))
+        if unknown:
+            raise TypeError(f'{self.__class__.__name__} получил неизвестные аргументы: {", ".join(unknown)}')
         for arg in self.args:
             if arg in kwds:
                 setattr(self, arg, kwds[arg])
+        self._dtype = get_interaction_dtype()
+        self._local_matrices = np.stack([
+            volume.total_transformation_matrix if isinstance(volume, TransformableVolume) else np.eye(4, dtype=Float)
+            for volume in self.sensitive_volumes
+        ]) if self.sensitive_volumes else np.empty((0, 4, 4), dtype=Float)
+        self._responses = [getattr(volume, 'response', None) for volume in self.sensitive_volumes]
+        self._volume_index = np.full(max((volume.ID for volume in self.sensitive_volumes), default=0) + 1, -1, dtype=np.int64)
+        for index, volume in enumerate(self.sensitive_volumes):
+            self._volume_index[volume.ID] = index
+        self.writer = HDF5Writer(
+            self.filename,
+            chunk_size=self.interaction_buffer_size,
+            compression=self.compression,
+            compression_opts=self.compression_opts,
+            shuffle=self.shuffle,
+            lock=self.lock
+        )
 
     def check_progress_in_file(self) -> Tuple[Optional[Float], Optional[Any]]:
         try:
@@ -73,30 +131,76 @@ class SimulationDataManager:
             print(f'\tSource timer: {last_time}')
             return last_time, state
 
+    @property
+    def required_fields(self) -> Optional[List[str]]:
+        """ Поля взаимодействий, необходимые менеджеру (None - все поля) """
+        if self.save_events or self.projection_accumulator is None:
+            return None
+        fields = list(self.projection_accumulator.required_fields)
+        for response in self._responses:
+            if response is not None:
+                fields += [field for field in response.required_fields if field not in fields]
+        return fields
+
+    def _classify(self, interaction_data: InteractionArray) -> NDArray[np.int64]:
+        """ Индекс чувствительного объёма каждого события, -1 вне чувствительных объёмов """
+        if 'volume_id' in (interaction_data.dtype.names or ()):
+            volume_id = interaction_data['volume_id'].astype(np.int64)
+            volume_index = np.full(volume_id.shape[0], -1, dtype=np.int64)
+            known = volume_id < self._volume_index.size
+            volume_index[known] = self._volume_index[volume_id[known]]
+            return volume_index
+        volume_index = np.full(interaction_data.shape[0], -1, dtype=np.int64)
+        for index, (volume, matrix) in enumerate(zip(self.sensitive_volumes, self._local_matrices)):
+            inside = volume.geometry.check_inside(interaction_data['global_position']@matrix[:3, :3].T + matrix[:3, 3])
+            volume_index[inside & (volume_index < 0)] = index
+        return volume_index
+
     def add_interaction_data(self, interaction_data: InteractionArray) -> None:
-        for volume in self.sensitive_volumes:
-            in_volume = volume.check_inside(interaction_data.position)
-            interaction_data_in_volume = cast(InteractionArray, interaction_data[in_volume])
-            if interaction_data_in_volume.size > 0:
-                interaction_data_for_save = InteractionArray(interaction_data_in_volume.shape)
-
-                interaction_data_for_save.global_position = interaction_data_in_volume.position
-                interaction_data_for_save.global_direction = interaction_data_in_volume.direction
-                if isinstance(volume, TransformableVolume):
-                    interaction_data_for_save.local_position = volume.convert_to_local_position(interaction_data_in_volume.position, as_parent=False)
-                    interaction_data_for_save.local_direction = volume.convert_to_local_direction(interaction_data_in_volume.direction, as_parent=False)
-
-                if interaction_data_in_volume.dtype.names is not None and interaction_data_for_save.dtype.names is not None:
-                    for field in interaction_data_in_volume.dtype.names:
-                        if field in interaction_data_for_save.dtype.names and field not in ['global_position', 'global_direction', 'local_position', 'local_direction']:
-                            interaction_data_for_save[field] = interaction_data_in_volume[field]
-
-                self.interaction_data[volume.name].append(interaction_data_for_save)
-                self._buffered_interaction_number += interaction_data_for_save.size
+        volume_index = self._classify(interaction_data)
+        classified = (volume_index >= 0).nonzero()[0]
+        if classified.size > 0:
+            order = classified[np.argsort(volume_index[classified], kind='stable')]
+            bounds = np.cumsum(np.bincount(volume_index[classified], minlength=len(self.sensitive_volumes)))
+            if interaction_data.dtype == self._dtype:
+                interaction_data_for_save = cast(InteractionArray, interaction_data[order].view(InteractionArray))
+            else:
+                interaction_data_for_save = np.zeros(order.size, dtype=self._dtype).view(InteractionArray)
+                for field in interaction_data.dtype.names or ():
+                    if field in self._dtype.names:
+                        interaction_data_for_save[field] = interaction_data[field][order]
+                interaction_data_for_save.volume_id = [self.sensitive_volumes[index].ID for index in volume_index[order]]
+            for index, volume in enumerate(self.sensitive_volumes):
+                group_start = bounds[index - 1] if index > 0 else 0
+                group = cast(InteractionArray, interaction_data_for_save[group_start:bounds[index]])
+                if group.size == 0:
+                    continue
+                matrix = self._local_matrices[index]
+                group.local_position = group.global_position@matrix[:3, :3].T + matrix[:3, 3]
+                group.local_direction = group.global_direction@matrix[:3, :3].T
+                if self._responses[index] is not None:
+                    group = self._responses[index](group)
+                self._store(volume, group)
         if self._buffered_interaction_number > self.interaction_buffer_size:
             self.save_interaction_data()
             self._buffered_interaction_number = 0
 
+    def _store(self, volume: ElementaryVolume, group: InteractionArray) -> None:
+        if group.size == 0:
+            return
+        if self.projection_accumulator is not None:
+            self.projection_accumulator.add(volume.name, group)
+        if not self.save_events:
+            return
+        self.interaction_data[volume.name].append(group)
+        self._buffered_interaction_number += group.size
+
+    def flush_detector_responses(self) -> None:
+        """ Завершить ожидающие события откликов детекторов в конце моделирования """
+        for volume, response in zip(self.sensitive_volumes, self._responses):
+            if response is not None:
+                self._store(volume, response.flush())
+
     def concatenate_interaction_data(self) -> None:
         for volume in self.sensitive_volumes:
             volume_name = volume.name
@@ -107,50 +211,55 @@ class SimulationDataManager:
         self.interaction_data = {volume.name: [] for volume in self.sensitive_volumes}
 
     def save_interaction_data(self) -> None:
-        if self.lock is None:
-            self._save_interaction_data()
-        else:
-            with self.lock:
-                self._save_interaction_data()
+        self._save_interaction_data()
+
+    def save_progress(self, timer: Float) -> None:
+        """ Отметить в файле, что данные до времени источника timer сохранены полностью """
+        self._save_progress(timer)
+
+    def _save_progress(self, timer: Float) -> None:
+        with self.writer.opened() as file:
+            if 'Source timer' in file:
+                file['Source timer'][()] = timer
+            else:
+                file.create_dataset('Source timer', data=Float(timer))
+            if 'interaction_data' in file:
+                for volume_group in file['interaction_data'].values():
+                    for dataset in volume_group.values():
+                        dataset.attrs['committed_size'] = dataset.shape[0]
+            file.flush()
+
+    def restore_progress(self) -> Optional[Float]:
+        """ Удалить из файла данные, записанные после последней отметки прогресса """
+        return self._restore_progress()
+
+    def _restore_progress(self) -> Optional[Float]:
+        if not self.filename.exists():
+            return None
+        with self.writer.opened() as file:
+            last_time = Float(np.array(file['Source timer'])) if 'Source timer' in file else None
+            if 'interaction_data' in file:
+                for volume_name, volume_group in file['interaction_data'].items():
+                    removed = 0
+                    for dataset in volume_group.values():
+                        committed_size = int(dataset.attrs.get('committed_size', 0)) if last_time is not None else 0
+                        if dataset.shape[0] > committed_size:
+                            removed = dataset.shape[0] - committed_size
+                            dataset.resize(committed_size, axis=0)
+                    if removed > 0:
+                        _logger.warning(f'{removed} uncommitted events of {volume_name} removed from {self.filename}')
+        return last_time
 
     def _save_interaction_data(self) -> None:
         self.concatenate_interaction_data()
-        try:
-            file = h5py.File(self.filename, 'a')
-        except Exception:
-            _logger.exception(f'Не удалось сохранить данные в {self.filename}!')
-        else:
-            if 'interaction_data' not in file:
-                group = file.create_group('interaction_data')
-                for volume_name, interaction_data_list in self.interaction_data.items():
-                    if not interaction_data_list:
-                        continue
-                    interaction_data = interaction_data_list[0]
-                    volume_group = group.create_group(volume_name)
-                    if interaction_data.dtype.fields is not None:
-                        for field in interaction_data.dtype.fields:
-                            maxshape = list(interaction_data[field].shape)
-                            maxshape[0] = None
-                            volume_group.create_dataset(
-                                field,
-                                data=interaction_data[field],
-                                compression="gzip",
-                                chunks=True,
-                                maxshape=maxshape
-                                )
-            else:
-                group = file['interaction_data']
-                for volume_name, interaction_data_list in self.interaction_data.items():
-                    if not interaction_data_list:
-                        continue
-                    interaction_data = interaction_data_list[0]
-                    volume_group = group[volume_name]
-                    for key in volume_group.keys():
-                        volume_group[key].resize(
-                            (volume_group[key].shape[0] + interaction_data[key].shape[0]),
-                            axis=0
-                            )
-                        volume_group[key][-interaction_data[key].shape[0]:] = interaction_data[key]
-            _logger.info(f'{self._buffered_interaction_number} events saved to {self.filename}')
-            file.close()
+        data = {volume_name: data_list[0] for volume_name, data_list in self.interaction_data.items() if data_list}
+        if not data:
+            return
+        # Ошибка записи не перехватывается: иначе данные были бы удалены, а прогресс отмечен как сохранённый
+        self.writer.write_dict(data, 'interaction_data')
+        _logger.info('%d events saved to %s', self._buffered_interaction_number, self.filename)
         self.clear_interaction_data()
+
+    def close(self) -> None:
+        """ Закрыть файл и вывести статистику записи """
+        self.writer.close()
@@ -1,9 +1,15 @@
 import numpy as np
 from pathlib import Path
+from numpy.typing import NDArray
 from typing import List, Any, Optional, Dict, Tuple, Union
 from core.geometry.volumes import ElementaryVolume
 from core.other.typing_definitions import Float
+from core.data.detector_response import DetectorResponse
 from core.data.interaction_data import InteractionArray
+from core.data.projections import ProjectionAccumulator
+from core.data.writers import HDF5Writer
+
+def read_source_timer(filename: Path) -> Optional[Float]: ...
 
 class SimulationDataManager:
     filename: Path
@@ -13,14 +19,34 @@ class SimulationDataManager:
     save_dose_distribution: bool
     distribution_voxel_size: Float
     interaction_buffer_size: int
+    save_events: bool
+    projection_accumulator: Optional[ProjectionAccumulator]
+    compression: Optional[str]
+    compression_opts: Optional[int]
+    shuffle: bool
+    writer: HDF5Writer
+    _dtype: np.dtype
+    _local_matrices: NDArray[Float]
+    _volume_index: NDArray[np.int64]
+    _responses: List[Optional[DetectorResponse]]
     _buffered_interaction_number: int
     interaction_data: Dict[str, Union[List[InteractionArray], InteractionArray]]
     args: List[str]
 
     def __init__(self, filename: str, sensitive_volumes: List[ElementaryVolume] = ..., lock: Optional[Any] = None, **kwds: Any) -> None: ...
     def check_progress_in_file(self) -> Tuple[Optional[Float], Optional[Any]]: ...
+    @property
+    def required_fields(self) -> Optional[List[str]]: ...
+    def _classify(self, interaction_data: InteractionArray) -> NDArray[np.int64]: ...
     def add_interaction_data(self, interaction_data: InteractionArray) -> None: ...
+    def _store(self, volume: ElementaryVolume, group: InteractionArray) -> None: ...
+    def flush_detector_responses(self) -> None: ...
     def concatenate_interaction_data(self) -> None: ...
     def clear_interaction_data(self) -> None: ...
     def save_interaction_data(self) -> None: ...
+    def save_progress(self, timer: Float) -> None: ...
+    def _save_progress(self, timer: Float) -> None: ...
+    def restore_progress(self) -> Optional[Float]: ...
+    def _restore_progress(self) -> Optional[Float]: ...
     def _save_interaction_data(self) -> None: ...
+    def close(self) -> None: ...
@@ -0,0 +1,87 @@
+from typing import Optional
+
+import numpy as np
+import hepunits as units
+from numpy.typing import NDArray
+
+from core.data.interaction_data import InteractionArray
+from core.other.typing_definitions import Energy, Float, Length, Time
+
+FWHM_TO_SIGMA = 1/(2*np.sqrt(2*np.log(2)))
+
+
+class DetectorResponse:
+    """
+    Отклик детектора гамма-камеры
+
+    Энерговыделения одной частицы в пределах окна совпадений суммируются
+    в одно событие камеры с координатой в энергетически взвешенном центре,
+    после чего энергия и локальные координаты (x, y) размываются по Гауссу.
+    События частиц, взаимодействовавших в последней порции данных, остаются
+    в ожидании следующей порции, события с нулевым энерговыделением отбрасываются
+
+    [energy_resolution] - относительное FWHM при reference_energy, FWHM ∝ √E
+
+    [reference_energy] = units.keV
+
+    [intrinsic_resolution, coincidence_window] = units.mm, units.ns
+    """
+    energy_resolution: Float
+    reference_energy: Energy
+    intrinsic_resolution: Length
+    coincidence_window: Time
+    rng: np.random.Generator
+
+    required_fields = ('global_position', 'particle_ID', 'energy_deposit', 'emission_time', 'distance_traveled')
+
+    def __init__(self, energy_resolution: Float = Float(0.099), reference_energy: Energy = Float(140.5*units.keV), intrinsic_resolution: Length = Float(3.6*units.mm), coincidence_window: Time = Float(10*units.ns), rng: Optional[np.random.Generator] = None) -> None:
+        self.energy_resolution = energy_resolution
+        self.reference_energy = reference_energy
+        self.intrinsic_resolution = intrinsic_resolution
+        self.coincidence_window = coincidence_window
+        self.rng = np.random.default_rng() if rng is None else rng
+        self._pending: Optional[InteractionArray] = None
+
+    def _sum(self, interaction_data: InteractionArray) -> InteractionArray:
+        """ Суммировать энерговыделения каждой частицы в пределах окна совпадений """
+        time = interaction_data.emission_time + interaction_data.distance_traveled/units.c_light
+        order = np.lexsort((time, interaction_data.particle_ID))
+        interaction_data = interaction_data[order]
+        time = time[order]
+        new_event = np.ones(interaction_data.size, dtype=np.bool_)
+        new_event[1:] = (interaction_data.particle_ID[1:] != interaction_data.particle_ID[:-1]) | (np.diff(time) > self.coincidence_window)
+        event_index = np.cumsum(new_event) - 1
+        energy = interaction_data.energy_deposit
+        energy_sum = np.bincount(event_index, weights=energy)
+        weight = np.divide(1., energy_sum, out=np.zeros_like(energy_sum), where=energy_sum > 0)
+        events = interaction_data[new_event]
+        for field in ('local_position', 'global_position'):
+            position = interaction_data[field]
+            centroid = np.stack([np.bincount(event_index, weights=position[:, axis]*energy) for axis in range(3)], axis=1)
+            events[field] = np.where(energy_sum[:, np.newaxis] > 0, centroid*weight[:, np.newaxis], events[field])
+        events.energy_deposit = energy_sum
+        return events
+
+    def _blur(self, events: InteractionArray) -> InteractionArray:
+        """ Размытие энергии (без отрицательных значений для малых энерговыделений) и внутреннее пространственное размытие """
+        sigma = self.energy_resolution*np.sqrt(events.energy_deposit*self.reference_energy)*FWHM_TO_SIGMA
+        events.energy_deposit = np.maximum(events.energy_deposit + self.rng.normal(0., 1., events.size)*sigma, 0.)
+        events.local_position[:, :2] += self.rng.normal(0., self.intrinsic_resolution*FWHM_TO_SIGMA, (events.size, 2))
+        return events
+
+    def __call__(self, interaction_data: InteractionArray) -> InteractionArray:
+        """ События камеры из локальных взаимодействий в детекторе """
+        data = interaction_data if self._pending is None else np.concatenate([self._pending, interaction_data]).view(InteractionArray)
+        events = self._sum(data)
+        pending = np.isin(events.particle_ID, interaction_data.particle_ID)
+        self._pending = events[pending] if pending.any() else None
+        events = events[~pending]
+        return self._blur(events[events.energy_deposit > 0])
+
+    def flush(self) -> InteractionArray:
+        """ Завершить ожидающие события """
+        if self._pending is None:
+            return InteractionArray(0)
+        events = self._pending
+        self._pending = None
+        return self._blur(events[events.energy_deposit > 0])
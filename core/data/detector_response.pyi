@@ -0,0 +1,20 @@
+import numpy as np
+from typing import Optional, Tuple
+from core.data.interaction_data import InteractionArray
+from core.other.typing_definitions import Energy, Float, Length, Time
+
+FWHM_TO_SIGMA: float
+
+class DetectorResponse:
+    energy_resolution: Float
+    reference_energy: Energy
+    intrinsic_resolution: Length
+    coincidence_window: Time
+    rng: np.random.Generator
+    required_fields: Tuple[str, ...]
+    _pending: Optional[InteractionArray]
+    def __init__(self, energy_resolution: Float = ..., reference_energy: Energy = ..., intrinsic_resolution: Length = ..., coincidence_window: Time = ..., rng: Optional[np.random.Generator] = None) -> None: ...
+    def _sum(self, interaction_data: InteractionArray) -> InteractionArray: ...
+    def _blur(self, events: InteractionArray) -> InteractionArray: ...
+    def __call__(self, interaction_data: InteractionArray) -> InteractionArray: ...
+    def flush(self) -> InteractionArray: ...
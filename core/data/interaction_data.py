@@ -3,7 +3,7 @@ from typing import Tuple, Union, cast
 import numpy as np
 from numpy.typing import NDArray
 
-from core.other.typing_definitions import Float, ID
+from core.other.typing_definitions import Float, ID, MaterialID, ScatterOrder, SourceID, VolumeID
 
 def get_interaction_dtype() -> np.dtype:
     """ Генерирует dtype для данных взаимодействия """
@@ -15,7 +15,11 @@ def get_interaction_dtype() -> np.dtype:
         ('process_name', 'S30'),
         ('particle_type', 'S30'),
         ('particle_ID', ID),
+        ('scatter_order', ScatterOrder),
+        ('source_ID', SourceID),
         ('energy_deposit', Float),
+        ('volume_id', VolumeID),
+        ('material_id', MaterialID),
         ('material_density', Float),
         ('scattering_angles', (Float, 2)),
         ('emission_time', Float),
@@ -1,7 +1,7 @@
 import numpy as np
 from typing import Optional, Any, Union, Tuple
 from numpy.typing import NDArray
-from core.other.typing_definitions import Float, ID
+from core.other.typing_definitions import Float, ID, MaterialID, ScatterOrder, SourceID, VolumeID
 
 class InteractionArray(np.recarray):
     def __new__(cls, shape: Union[int, Tuple[int, ...]]) -> 'InteractionArray': ...
@@ -50,12 +50,30 @@ class InteractionArray(np.recarray):
     def particle_ID(self) -> NDArray[ID]: ...
     @particle_ID.setter
     def particle_ID(self, value: Union[NDArray[ID], ID]) -> None: ...
+    @property
+    def scatter_order(self) -> NDArray[ScatterOrder]: ...
+    @scatter_order.setter
+    def scatter_order(self, value: Union[NDArray[ScatterOrder], int]) -> None: ...
+    @property
+    def source_ID(self) -> NDArray[SourceID]: ...
+    @source_ID.setter
+    def source_ID(self, value: Union[NDArray[SourceID], int]) -> None: ...
 
     @property
     def energy_deposit(self) -> NDArray[Float]: ...
     @energy_deposit.setter
     def energy_deposit(self, value: Union[NDArray[Float], Float]) -> None: ...
 
+    @property
+    def volume_id(self) -> NDArray[VolumeID]: ...
+    @volume_id.setter
+    def volume_id(self, value: Union[NDArray[VolumeID], int]) -> None: ...
+
+    @property
+    def material_id(self) -> NDArray[MaterialID]: ...
+    @material_id.setter
+    def material_id(self, value: Union[NDArray[MaterialID], int]) -> None: ...
+
     @property
     def material_density(self) -> NDArray[Float]: ...
     @material_density.setter
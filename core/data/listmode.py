@@ -0,0 +1,181 @@
+import argparse
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import h5py
+import numpy as np
+import hepunits as units
+from numpy.typing import NDArray
+
+from core.data.projections import ProjectionAccumulator, merge_projections
+from core.data.writers import committed_size
+from core.other.typing_definitions import Energy, Float, Length, Time
+
+_logger = logging.getLogger(__name__)
+
+Chunk = Tuple[str, str, int, int]
+
+_angle_pattern = re.compile(r'at (-?\d+(?:\.\d+)?) deg')
+
+
+def volume_angle(name: str) -> Float:
+    """ Угол головки из имени объёма вида "Detector at 90.0 deg" """
+    match = _angle_pattern.search(name)
+    if match is None:
+        raise ValueError(f'В имени объёма {name} нет угла')
+    return Float(float(match.group(1))*units.degree)
+
+
+def list_chunks(filename: Union[str, Path], chunk_size: int = 10**6) -> Iterator[Chunk]:
+    """
+    Порции (файл, объём, начало, конец) событий файла, записанного SimulationDataManager
+
+    Читаются только записанные строки (committed_size): строки после них
+    в файле прерванного моделирования могут быть неполными
+    """
+    with h5py.File(filename, 'r') as file:
+        if 'interaction_data' not in file:
+            return
+        for volume_name, volume_group in file['interaction_data'].items():
+            size = min(committed_size(dataset) for dataset in volume_group.values())
+            for start in range(0, size, chunk_size):
+                yield str(filename), volume_name, start, min(start + chunk_size, size)
+
+
+def bin_chunk(chunk: Chunk, size: Sequence[Length], pixel_size: Length, energy_windows: Sequence[Tuple[Energy, Energy]], component: Optional[str] = None, frames: Optional[Sequence[Time]] = None, source_ID: Optional[int] = None) -> Dict[str, NDArray[Float]]:
+    """
+    Проекция одной порции событий, читаются только нужные поля и строки
+
+    [component] = None | 'primary' | 'scatter' - отбор по порядку рассеяния фотона
+
+    [frames] = units.ns - границы временных кадров по моменту испускания
+
+    [source_ID] = None | int - отбор по номеру компоненты составного источника
+    """
+    filename, volume_name, start, stop = chunk
+    dtype = [('local_position', (Float, 3)), ('energy_deposit', Float)]
+    if frames is not None:
+        dtype.append(('emission_time', Float))
+    with h5py.File(filename, 'r') as file:
+        volume_group = file['interaction_data'][volume_name]
+        interaction_data = np.recarray(stop - start, dtype=dtype)
+        for name, _ in dtype:
+            interaction_data[name] = volume_group[name][start:stop]
+        selected = np.ones(stop - start, dtype=np.bool_)
+        if component is not None:
+            primary = volume_group['scatter_order'][start:stop] == 0
+            selected &= primary if component == 'primary' else ~primary
+        if source_ID is not None:
+            selected &= volume_group['source_ID'][start:stop] == source_ID
+        interaction_data = interaction_data[selected]
+    accumulator = ProjectionAccumulator(size, pixel_size, energy_windows, frames)
+    accumulator.add(volume_name, interaction_data)
+    return accumulator.projections
+
+
+def projections_from_listmode(filenames: Sequence[Union[str, Path]], size: Sequence[Length], pixel_size: Length = Float(4*units.mm), energy_windows: Sequence[Tuple[Energy, Energy]] = ((Float(126*units.keV), Float(154*units.keV)), ), chunk_size: int = 10**6, processes: Optional[int] = None, component: Optional[str] = None, frames: Optional[Sequence[Time]] = None, source_ID: Optional[int] = None) -> Dict[str, NDArray[Float]]:
+    """
+    Проекции по объёмам из файлов событий
+
+    Датасеты читаются порциями по chunk_size строк, порции всех файлов
+    обрабатываются пулом процессов, поэтому размер файлов не ограничен памятью
+    """
+    chunks = [chunk for filename in filenames for chunk in list_chunks(filename, chunk_size)]
+    _logger.info(f'{len(chunks)} chunks in {len(filenames)} files')
+    projections: Dict[str, NDArray[Float]] = {}
+    if processes == 1:
+        for chunk in chunks:
+            merge_projections(projections, bin_chunk(chunk, size, pixel_size, energy_windows, component, frames, source_ID))
+        return projections
+    with ProcessPoolExecutor(processes) as executor:
+        futures = [executor.submit(bin_chunk, chunk, size, pixel_size, energy_windows, component, frames, source_ID) for chunk in chunks]
+        for future in futures:
+            merge_projections(projections, future.result())
+    return projections
+
+
+def projection_stack(projections: Dict[str, NDArray[Float]]) -> Tuple[NDArray[Float], NDArray[Float], List[str]]:
+    """ Проекции, упорядоченные по углу: (угол, окно, y, x) или (угол, кадр, окно, y, x), углы и имена объёмов """
+    names = sorted(projections, key=volume_angle)
+    angles = np.array([volume_angle(name) for name in names], dtype=Float)
+    return np.stack([projections[name] for name in names]), angles, names
+
+
+def sinograms(stack: NDArray[Float]) -> NDArray[Float]:
+    """ Синограммы из стека проекций: (окно, y, угол, x) """
+    return stack.transpose(1, 2, 0, 3)
+
+
+def save_projections(filename: Union[str, Path], projections: Dict[str, NDArray[Float]], pixel_size: Length, energy_windows: Sequence[Tuple[Energy, Energy]], components: Optional[Dict[str, Dict[str, NDArray[Float]]]] = None, frames: Optional[Sequence[Time]] = None) -> None:
+    """
+    Сохранить стек проекций с углами, именами объёмов и параметрами бинирования
+
+    components - составляющие проекций ({'primary': ..., 'scatter': ...}),
+    сохраняются стеками с тем же порядком углов. frames - границы временных кадров
+    """
+    stack, angles, names = projection_stack(projections)
+    component_stacks = {
+        component: np.stack([component_projections[name] for name in names])
+        for component, component_projections in ({} if components is None else components).items()
+    }
+    np.savez_compressed(
+        filename,
+        projections=stack,
+        angles=angles,
+        names=np.array(names),
+        pixel_size=pixel_size,
+        energy_windows=np.asarray(energy_windows, dtype=Float),
+        **({} if frames is None else {'frames': np.asarray(frames, dtype=Float)}),
+        **component_stacks
+    )
+
+
+if __name__ == '__main__':
+    from core.transport.studies import acquisition_frames, quantity, read_study_config
+
+    parser = argparse.ArgumentParser(description='Проекции из файлов событий')
+    parser.add_argument('output', type=Path, help='npz-файл для стека проекций')
+    parser.add_argument('files', type=Path, nargs='*', help='hdf-файлы событий')
+    parser.add_argument('--study', type=Path, default=None, help='TOML-файл исследования: файлы, размер детектора, пиксель и окна')
+    parser.add_argument('--size', nargs=2, default=None, help='размер детектора, например "54 cm" "40 cm"')
+    parser.add_argument('--pixel-size', default=None)
+    parser.add_argument('--window', nargs=2, action='append', default=None, help='энергетическое окно, например "126 keV" "154 keV"')
+    parser.add_argument('--chunk-size', type=int, default=10**6)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--component', choices=['primary', 'scatter'], default=None, help='только первичные или только рассеянные фотоны')
+    parser.add_argument('--source-id', type=int, default=None, help='только фотоны компоненты составного источника с этим номером')
+    parser.add_argument('--frames', nargs='+', default=None, help='границы временных кадров, например "0 s" "60 s" "120 s"')
+    args = parser.parse_args()
+
+    logging.basicConfig(format='[%(asctime)s: %(levelname)s] %(message)s', level=logging.INFO)
+
+    files: List[Path] = list(args.files)
+    size = pixel_size = energy_windows = frames = None
+    if args.study is not None:
+        config = read_study_config(args.study)
+        settings = config.data.get('projections', {})
+        size = [quantity(value) for value in config.data['gamma_camera']['detector_size'][:2]]
+        pixel_size = quantity(settings.get('pixel_size', '4 mm'))
+        energy_windows = [(quantity(energy_min), quantity(energy_max)) for energy_min, energy_max in settings.get('energy_windows', [['126 keV', '154 keV']])]
+        frames = acquisition_frames(config)
+        if not files:
+            files = sorted(Path(f'output data/{config.output_directory}').glob('*.hdf'))
+    if args.size is not None:
+        size = [quantity(value) for value in args.size]
+    if args.pixel_size is not None:
+        pixel_size = quantity(args.pixel_size)
+    if args.window is not None:
+        energy_windows = [(quantity(energy_min), quantity(energy_max)) for energy_min, energy_max in args.window]
+    if args.frames is not None:
+        frames = [quantity(time) for time in args.frames]
+    if size is None or not files:
+        parser.error('нужны файлы событий и размер детектора (--size или --study)')
+    pixel_size = Float(4*units.mm) if pixel_size is None else pixel_size
+    energy_windows = [(Float(126*units.keV), Float(154*units.keV))] if energy_windows is None else energy_windows
+
+    projections = projections_from_listmode(files, size, pixel_size, energy_windows, args.chunk_size, args.processes, args.component, frames, args.source_id)
+    save_projections(args.output, projections, pixel_size, energy_windows, frames=frames)
+    _logger.info(f'{len(projections)} projections saved to {args.output}')
@@ -0,0 +1,15 @@
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from numpy.typing import NDArray
+from core.other.typing_definitions import Energy, Float, Length, Time
+
+Chunk = Tuple[str, str, int, int]
+
+def volume_angle(name: str) -> Float: ...
+def list_chunks(filename: Union[str, Path], chunk_size: int = ...) -> Iterator[Chunk]: ...
+def bin_chunk(chunk: Chunk, size: Sequence[Length], pixel_size: Length, energy_windows: Sequence[Tuple[Energy, Energy]], component: Optional[str] = None, frames: Optional[Sequence[Time]] = None, source_ID: Optional[int] = None) -> Dict[str, NDArray[Float]]: ...
+def projections_from_listmode(filenames: Sequence[Union[str, Path]], size: Sequence[Length], pixel_size: Length = ..., energy_windows: Sequence[Tuple[Energy, Energy]] = ..., chunk_size: int = ..., processes: Optional[int] = None, component: Optional[str] = None, frames: Optional[Sequence[Time]] = None, source_ID: Optional[int] = None) -> Dict[str, NDArray[Float]]: ...
+def projection_stack(projections: Dict[str, NDArray[Float]]) -> Tuple[NDArray[Float], NDArray[Float], List[str]]: ...
+def sinograms(stack: NDArray[Float]) -> NDArray[Float]: ...
+def save_projections(filename: Union[str, Path], projections: Dict[str, NDArray[Float]], pixel_size: Length, energy_windows: Sequence[Tuple[Energy, Energy]], components: Optional[Dict[str, Dict[str, NDArray[Float]]]] = None, frames: Optional[Sequence[Time]] = None) -> None: ...
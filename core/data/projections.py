@@ -0,0 +1,95 @@
+import io
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import hepunits as units
+from numpy.typing import NDArray
+
+from core.data.interaction_data import InteractionArray
+from core.other.typing_definitions import Energy, Float, Length, Time
+
+
+class ProjectionAccumulator:
+    """
+    Накопитель проекций: гистограммы локальных координат взаимодействий
+    в чувствительных объёмах по энергетическим окнам
+
+    [size = (dx, dy), pixel_size] = units.mm
+
+    [energy_windows = ((E_min, E_max), ...)] = units.keV
+
+    [frames = (t_0, t_1, ...)] = units.ns - границы временных кадров по моменту испускания,
+    проекции с кадрами имеют форму (кадр, окно, y, x)
+    """
+    size: NDArray[Float]
+    pixel_size: Length
+    energy_windows: NDArray[Float]
+    frames: Optional[NDArray[Float]]
+    projections: Dict[str, NDArray[Float]]
+
+    required_fields: Tuple[str, ...] = ('global_position', 'energy_deposit', 'volume_id')
+
+    def __init__(self, size: Sequence[Length], pixel_size: Length = Float(4 * units.mm), energy_windows: Sequence[Tuple[Energy, Energy]] = ((Float(126 * units.keV), Float(154 * units.keV)), ), frames: Optional[Sequence[Time]] = None) -> None:
+        self.size = np.asarray(size[:2], dtype=Float)
+        self.pixel_size = pixel_size
+        self.energy_windows = np.asarray(energy_windows, dtype=Float).reshape(-1, 2)
+        self.frames = None if frames is None else np.asarray(frames, dtype=Float)
+        if self.frames is not None:
+            self.required_fields = (*self.required_fields, 'emission_time')
+        self.projections = {}
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """ Форма проекций: (окно, y, x) или (кадр, окно, y, x) """
+        nx, ny = np.round(self.size/self.pixel_size).astype(int)
+        shape = (self.energy_windows.shape[0], int(ny), int(nx))
+        return shape if self.frames is None else (self.frames.size - 1, *shape)
+
+    def add(self, name: str, interaction_data: InteractionArray) -> None:
+        """ Добавить взаимодействия в проекцию объёма name """
+        ny, nx = self.shape[-2:]
+        projection = self.projections.setdefault(name, np.zeros(self.shape, dtype=Float))
+        position = interaction_data.local_position
+        ix = np.floor((position[:, 0] + self.size[0]/2)/self.pixel_size).astype(np.int64)
+        iy = np.floor((position[:, 1] + self.size[1]/2)/self.pixel_size).astype(np.int64)
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        pixel = iy*nx + ix
+        if self.frames is not None:
+            frame = np.searchsorted(self.frames, interaction_data.emission_time, side='right') - 1
+            inside &= (frame >= 0) & (frame < self.frames.size - 1)
+            pixel = frame*ny*nx + pixel
+        energy = interaction_data.energy_deposit
+        frame_number = 1 if self.frames is None else self.frames.size - 1
+        for window, (energy_min, energy_max) in enumerate(self.energy_windows):
+            in_window = inside & (energy >= energy_min) & (energy < energy_max)
+            counts = np.bincount(pixel[in_window], minlength=frame_number*ny*nx).reshape(frame_number, ny, nx)
+            if self.frames is None:
+                projection[window] += counts[0]
+            else:
+                projection[:, window] += counts
+
+    def merge(self, projections: Mapping[str, NDArray[Float]]) -> None:
+        """ Сложить с частичными проекциями другого накопителя """
+        merge_projections(self.projections, projections)
+
+
+def merge_projections(target: Dict[str, NDArray[Float]], projections: Mapping[str, NDArray[Float]]) -> None:
+    """ Сложить частичные проекции с накопленными """
+    for name, projection in projections.items():
+        if name in target:
+            target[name] += projection
+        else:
+            target[name] = np.array(projection, dtype=Float)
+
+
+def projections_to_bytes(projections: Mapping[str, NDArray[Float]]) -> bytes:
+    """ Упаковать проекции в компактный npz-блок """
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **projections)
+    return buffer.getvalue()
+
+
+def projections_from_bytes(data: bytes) -> Dict[str, NDArray[Float]]:
+    """ Распаковать проекции из npz-блока """
+    with np.load(io.BytesIO(data)) as file:
+        return {name: file[name] for name in file.files}
@@ -0,0 +1,22 @@
+import numpy as np
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+from numpy.typing import NDArray
+from core.data.interaction_data import InteractionArray
+from core.other.typing_definitions import Energy, Float, Length, Time
+
+class ProjectionAccumulator:
+    size: NDArray[Float]
+    pixel_size: Length
+    energy_windows: NDArray[Float]
+    frames: Optional[NDArray[Float]]
+    projections: Dict[str, NDArray[Float]]
+    required_fields: Tuple[str, ...]
+    def __init__(self, size: Sequence[Length], pixel_size: Length = ..., energy_windows: Sequence[Tuple[Energy, Energy]] = ..., frames: Optional[Sequence[Time]] = None) -> None: ...
+    @property
+    def shape(self) -> Tuple[int, ...]: ...
+    def add(self, name: str, interaction_data: InteractionArray) -> None: ...
+    def merge(self, projections: Mapping[str, NDArray[Float]]) -> None: ...
+
+def merge_projections(target: Dict[str, NDArray[Float]], projections: Mapping[str, NDArray[Float]]) -> None: ...
+def projections_to_bytes(projections: Mapping[str, NDArray[Float]]) -> bytes: ...
+def projections_from_bytes(data: bytes) -> Dict[str, NDArray[Float]]: ...
@@ -0,0 +1,219 @@
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import h5py
+import numpy as np
+from numpy.typing import NDArray
+
+from core.other.typing_definitions import Float
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriterMetrics:
+    """ Статистика записи """
+    flushes: int = 0
+    events: int = 0
+    bytes: int = 0
+    write_time: Float = Float(0.)
+
+    @property
+    def throughput(self) -> Float:
+        """ Скорость записи, МБ/с """
+        return Float(self.bytes/2**20/self.write_time) if self.write_time > 0 else Float(0.)
+
+    @property
+    def events_per_second(self) -> Float:
+        return Float(self.events/self.write_time) if self.write_time > 0 else Float(0.)
+
+
+class HDF5Writer:
+    """
+    Потоковая запись структурированных массивов в HDF5
+
+    Файл держится открытым между сбросами (если не задан lock), строки чанков
+    согласованы с размером сброса, все поля сброса записываются за один проход
+
+    [compression] = 'lzf' | 'gzip' | None
+
+    [compression_opts] = уровень gzip
+    """
+    filename: Path
+    chunk_size: int
+    compression: Optional[str]
+    compression_opts: Optional[int]
+    shuffle: bool
+    lock: Optional[Any]
+    metrics: WriterMetrics
+
+    max_chunk_bytes = 2**20
+
+    def __init__(self, filename: Path, chunk_size: int = 10**4, compression: Optional[str] = 'lzf', compression_opts: Optional[int] = None, shuffle: bool = True, lock: Optional[Any] = None) -> None:
+        if compression not in ('lzf', 'gzip', None):
+            raise ValueError(f'Неподдерживаемый фильтр сжатия: {compression}')
+        self.filename = Path(filename)
+        self.chunk_size = max(int(chunk_size), 1)
+        self.compression = compression
+        self.compression_opts = compression_opts if compression == 'gzip' else None
+        self.shuffle = shuffle if compression is not None else False
+        self.lock = lock
+        self.metrics = WriterMetrics()
+        self._file: Optional[h5py.File] = None
+
+    @property
+    def persistent(self) -> bool:
+        """ Держать файл открытым можно, только если в него не пишут другие процессы """
+        return self.lock is None
+
+    @contextmanager
+    def opened(self) -> Iterator[h5py.File]:
+        """ Открытый на запись файл (с блокировкой, если она задана) """
+        if self.lock is not None:
+            with self.lock, h5py.File(self.filename, 'a') as file:
+                yield file
+            return
+        if self._file is None:
+            self._file = h5py.File(self.filename, 'a')
+        yield self._file
+
+    def _chunks(self, dtype: np.dtype) -> tuple:
+        rows = max(min(self.chunk_size, self.max_chunk_bytes//max(dtype.itemsize, 1)), 1)
+        return (rows, ) + dtype.shape
+
+    def _create_datasets(self, group: h5py.Group, data: NDArray[Any]) -> None:
+        assert data.dtype.fields is not None
+        for field, (dtype, _) in data.dtype.fields.items():
+            if field in group:
+                continue
+            group.create_dataset(
+                field,
+                shape=(0, ) + dtype.shape,
+                dtype=dtype.base,
+                maxshape=(None, ) + dtype.shape,
+                chunks=self._chunks(dtype),
+                compression=self.compression,
+                compression_opts=self.compression_opts,
+                shuffle=self.shuffle
+            )
+
+    def write(self, path: str, data: NDArray[Any]) -> None:
+        """ Дописать структурированный массив в группу path, по датасету на поле """
+        if data.size == 0:
+            return
+        start = perf_counter()
+        with self.opened() as file:
+            group = file.require_group(path)
+            self._create_datasets(group, data)
+            size = group[data.dtype.names[0]].shape[0]
+            for field in data.dtype.names:
+                dataset = group[field]
+                dataset.resize(size + data.shape[0], axis=0)
+                dataset[size:] = data[field]
+        self.metrics.write_time += perf_counter() - start
+        self.metrics.events += data.shape[0]
+        self.metrics.bytes += data.nbytes
+
+    def write_dict(self, data: Dict[str, NDArray[Any]], path: str = '') -> None:
+        """ Записать за один проход массивы нескольких групп """
+        self.metrics.flushes += 1
+        for name, group_data in data.items():
+            self.write(f'{path}/{name}' if path else name, group_data)
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.metrics.flushes > 0:
+            _logger.info(
+                f'{self.metrics.events} events written to {self.filename} in {self.metrics.flushes} flushes, '
+                f'{self.metrics.throughput:.1f} MB/s, {self.metrics.events_per_second:.3g} events/s'
+            )
+
+    def __enter__(self) -> 'HDF5Writer':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def committed_size(dataset: h5py.Dataset) -> int:
+    """ Число записанных строк датасета: атрибут committed_size, для файлов без него - размер датасета """
+    return int(dataset.attrs.get('committed_size', dataset.shape[0]))
+
+
+def merge_shards(shards: Sequence[Path], filename: Path, virtual: bool = True, chunk_size: int = 10**6, **writer_kwds: Any) -> Optional[Float]:
+    """
+    Объединить файлы фрагментов в порядке временных отрезков
+
+    Объединяются завершённые фрагменты до первого незавершённого. При virtual
+    создаются виртуальные датасеты HDF5, ссылающиеся на фрагменты (фрагменты
+    должны сохраняться), иначе данные копируются порциями по chunk_size строк.
+    Возвращает время источника, до которого данные объединены
+    """
+    filename = Path(filename)
+    complete: List[Path] = []
+    last_time = None
+    for shard in map(Path, shards):
+        timer = None
+        if shard.exists():
+            with h5py.File(shard, 'r') as file:
+                timer = Float(np.array(file['Source timer'])) if 'Source timer' in file else None
+        if timer is None:
+            break
+        complete.append(shard)
+        last_time = timer
+    if last_time is None:
+        return None
+
+    filename.unlink(missing_ok=True)
+    if virtual:
+        sources: Dict[Tuple[str, str], List[Tuple[Path, h5py.Dataset, int]]] = {}
+        files = [h5py.File(shard, 'r') for shard in complete]
+        try:
+            for shard, file in zip(complete, files):
+                for volume_name, volume_group in file.get('interaction_data', {}).items():
+                    for field, dataset in volume_group.items():
+                        sources.setdefault((volume_name, field), []).append((shard, dataset, committed_size(dataset)))
+            with h5py.File(filename, 'w') as file:
+                for (volume_name, field), field_sources in sources.items():
+                    dataset = field_sources[0][1]
+                    layout = h5py.VirtualLayout(shape=(sum(size for *_, size in field_sources), ) + dataset.shape[1:], dtype=dataset.dtype)
+                    start = 0
+                    for shard, dataset, size in field_sources:
+                        source = h5py.VirtualSource(os.path.relpath(shard, filename.parent), dataset.name, shape=dataset.shape)
+                        layout[start:start + size] = source[:size]
+                        start += size
+                    virtual_dataset = file.require_group(f'interaction_data/{volume_name}').create_virtual_dataset(field, layout)
+                    virtual_dataset.attrs['committed_size'] = start
+                file.create_dataset('Source timer', data=last_time)
+        finally:
+            for file in files:
+                file.close()
+        return last_time
+
+    with HDF5Writer(filename, chunk_size=chunk_size, **writer_kwds) as writer:
+        for shard in complete:
+            with h5py.File(shard, 'r') as file:
+                for volume_name, volume_group in file.get('interaction_data', {}).items():
+                    datasets = dict(volume_group.items())
+                    dtype = np.dtype([(field, dataset.dtype, dataset.shape[1:]) for field, dataset in datasets.items()])
+                    size = min(committed_size(dataset) for dataset in datasets.values())
+                    for start in range(0, size, chunk_size):
+                        data = np.empty(min(chunk_size, size - start), dtype=dtype)
+                        for field, dataset in datasets.items():
+                            data[field] = dataset[start:start + data.shape[0]]
+                        writer.write(f'interaction_data/{volume_name}', data)
+        with writer.opened() as file:
+            for volume_group in file.get('interaction_data', {}).values():
+                for dataset in volume_group.values():
+                    dataset.attrs['committed_size'] = dataset.shape[0]
+            file.create_dataset('Source timer', data=last_time)
+    return last_time
@@ -0,0 +1,44 @@
+import h5py
+import numpy as np
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from numpy.typing import NDArray
+from core.other.typing_definitions import Float
+
+@dataclass
+class WriterMetrics:
+    flushes: int = ...
+    events: int = ...
+    bytes: int = ...
+    write_time: Float = ...
+    @property
+    def throughput(self) -> Float: ...
+    @property
+    def events_per_second(self) -> Float: ...
+
+class HDF5Writer:
+    filename: Path
+    chunk_size: int
+    compression: Optional[str]
+    compression_opts: Optional[int]
+    shuffle: bool
+    lock: Optional[Any]
+    metrics: WriterMetrics
+    max_chunk_bytes: int
+    def __init__(self, filename: Path, chunk_size: int = ..., compression: Optional[str] = ..., compression_opts: Optional[int] = None, shuffle: bool = True, lock: Optional[Any] = None) -> None: ...
+    @property
+    def persistent(self) -> bool: ...
+    @contextmanager
+    def opened(self) -> Iterator[h5py.File]: ...
+    def _chunks(self, dtype: np.dtype) -> tuple: ...
+    def _create_datasets(self, group: h5py.Group, data: NDArray[Any]) -> None: ...
+    def write(self, path: str, data: NDArray[Any]) -> None: ...
+    def write_dict(self, data: Dict[str, NDArray[Any]], path: str = '') -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> 'HDF5Writer': ...
+    def __exit__(self, *args: Any) -> None: ...
+
+def committed_size(dataset: h5py.Dataset) -> int: ...
+def merge_shards(shards: Sequence[Path], filename: Path, virtual: bool = True, chunk_size: int = ..., **writer_kwds: Any) -> Optional[Float]: ...
@@ -5,6 +5,7 @@ from core.other.typing_definitions import Float
 import hepunits as units
 
 import settings.database_setting as database_setting
+from core.data.detector_response import DetectorResponse
 from core.geometry.geometries import Box
 from core.geometry.volumes import (TransformableVolume,
                                    TransformableVolumeWithChild)
@@ -12,7 +13,7 @@ from core.geometry.volumes import (TransformableVolume,
 
 class GammaCamera(TransformableVolumeWithChild):
 
-    def __init__(self, collimator: TransformableVolume, detector: TransformableVolume, gap: Float = Float(1 * units.mm), shielding_thickness: Float = Float(2 * units.cm), glass_backend_thickness: Float = Float(5 * units.cm), name: Optional[str] = None) -> None:
+    def __init__(self, collimator: TransformableVolume, detector: TransformableVolume, gap: Float = Float(1 * units.mm), shielding_thickness: Float = Float(2 * units.cm), glass_backend_thickness: Float = Float(5 * units.cm), name: Optional[str] = None, response: Optional[DetectorResponse] = None) -> None:
         detector_box_size = np.where(collimator.size > detector.size, collimator.size, detector.size)
         detector_box_size[2] = collimator.size[2] + gap + detector.size[2] + glass_backend_thickness
         material_database = database_setting.material_database
@@ -37,6 +38,7 @@ class GammaCamera(TransformableVolumeWithChild):
         detector_box.set_parent(self)
         collimator.translate(z=(detector_box_size[2]/2 - collimator.size[2]/2))
         detector_box.add_child(collimator)
+        detector.response = response
         detector.translate(z=(detector_box_size[2]/2 - collimator.size[2] - detector.size[2]/2 - gap))
         detector_box.add_child(detector)
         glass_backend.translate(z=(glass_backend.size[2]/2 - detector_box_size[2]/2))
@@ -54,3 +56,7 @@ class GammaCamera(TransformableVolumeWithChild):
     def detector(self):
         return self.detector_box.childs[1]
 
+    @property
+    def response(self) -> Optional[DetectorResponse]:
+        """ Отклик детектора, применяемый менеджером данных к событиям в детекторе """
+        return self.detector.response
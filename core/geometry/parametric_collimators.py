@@ -30,7 +30,18 @@ class ParametricParallelCollimator(WoodcockParameticVolume):
         self._septa = septa
         self._vacuum = settings.material_database['Vacuum']
         self._compute_constants()
-    
+
+    # Коэффициент формы канала в формуле геометрической эффективности
+    shape_factor = 0.26
+
+    @property
+    def hole_diameter(self) -> Float:
+        return self._hole_diameter
+
+    @property
+    def septa(self) -> Float:
+        return self._septa
+
     def _compute_constants(self) -> None:
         x_period = self._hole_diameter + self._septa
         y_period = np.sqrt(3) * x_period
@@ -72,6 +83,16 @@ class ParametricParallelSquareCollimator(WoodcockParameticVolume):
         self._vacuum = settings.material_database["Vacuum"]
         self._compute_constants()
 
+    shape_factor = 0.28
+
+    @property
+    def hole_diameter(self) -> Float:
+        return self._hole_width
+
+    @property
+    def septa(self) -> Float:
+        return self._septa
+
     def _compute_constants(self) -> None:
         self._period = self._hole_width + self._septa
         self._half_period = 0.5 * self._period
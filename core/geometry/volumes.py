@@ -9,7 +9,10 @@ import core.other.utils as utils
 from core.geometry.geometries import Geometry
 from core.materials.materials import Material, MaterialArray
 from core.other.nonunique_array import NonuniqueArray
-from core.other.typing_definitions import Float, Vector3D
+from core.other.typing_definitions import Float, Vector3D, VolumeID
+
+
+_volume_ID_counter = count(1)
 
 
 class ElementaryVolume:
@@ -20,12 +23,14 @@ class ElementaryVolume:
     geometry: Geometry
     material: Material
     name: str
+    ID: int
 
     def __init__(self, geometry: Geometry, material: Material, name: Optional[str] = None) -> None:
         """ Конструктор объёма """
         self.geometry = geometry
         self.material = material
         self.name = f'{self.__class__.__name__}{next(self._counter)}' if name is None else name
+        self.ID = next(_volume_ID_counter)
         self._dublicate_counter = count(1)
 
     def __init_subclass__(cls):
@@ -45,6 +50,7 @@ class ElementaryVolume:
     def dublicate(self):
         result = deepcopy(self)
         result.name = f'{self.name}.{next(self._dublicate_counter)}'
+        result.ID = next(_volume_ID_counter)
         return result
 
     def check_inside(self, position: Vector3D) -> Union[bool, NDArray[np.bool_]]:
@@ -155,8 +161,9 @@ class TransformableVolume(ElementaryVolume):
 
     @property
     def total_transformation_matrix(self) -> NDArray[Float]:
+        """ Матрица перехода из глобальных координат в локальные с учётом всех родителей """
         if isinstance(self.parent, TransformableVolume):
-            return self.parent.total_transformation_matrix@self.transformation_matrix
+            return self.transformation_matrix@self.parent.total_transformation_matrix
         return self.transformation_matrix
 
     def convert_to_local_position(self, position: Vector3D, as_parent: bool = True) -> Vector3D:
@@ -246,3 +253,9 @@ class VolumeArray(NonuniqueArray):
                 continue
             material[indices] = volume.material
         return material
+
+    @property
+    def ID(self) -> NDArray[VolumeID]:
+        """ Идентификаторы объёмов, 0 - вне объёмов """
+        IDs = np.array([0 if volume is None else volume.ID for volume in self.element_list], dtype=VolumeID)
+        return IDs[self.view(np.ndarray)]
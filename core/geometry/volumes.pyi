@@ -4,7 +4,7 @@ from numpy.typing import NDArray
 from core.geometry.geometries import Geometry
 from core.materials.materials import Material, MaterialArray
 from core.other.nonunique_array import NonuniqueArray
-from core.other.typing_definitions import Vector3D, Length, Float
+from core.other.typing_definitions import Vector3D, Length, Float, VolumeID
 
 T = TypeVar('T')
 
@@ -12,6 +12,7 @@ class ElementaryVolume:
     geometry: Geometry
     material: Material
     name: str
+    ID: int
     def __init__(self, geometry: Geometry, material: Material, name: Optional[str] = None) -> None: ...
     @property
     def size(self) -> Vector3D: ...
@@ -46,4 +47,6 @@ class VolumeArray(NonuniqueArray):
     element_list: List[Optional[ElementaryVolume]]
     @property
     def material(self) -> MaterialArray: ...
+    @property
+    def ID(self) -> NDArray[VolumeID]: ...
     def type_matching(self, type: Type[T]) -> NDArray[np.bool_]: ...
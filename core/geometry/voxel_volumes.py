@@ -1,36 +1,127 @@
+import logging
 from functools import cache
-from typing import Optional, Tuple, cast
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
+from numba import njit
+from numpy.typing import NDArray
 
 from core.geometry.geometries import Box
-from core.geometry.woodcoock_volumes import WoodcockParameticVolume
+from core.geometry.volumes import ElementaryVolume, VolumeArray
+from core.geometry.woodcoock_volumes import WoodcockParameticVolume, WoodcockVolume
 from core.materials.materials import Material, MaterialArray
 from core.other.typing_definitions import Float, Length, Vector3D
 
+_logger = logging.getLogger(__name__)
+
+
+@njit(cache=True)
+def voxel_material_indices(position: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], labels: NDArray[np.uint8], lut: NDArray[np.int64]) -> NDArray[np.int64]:
+    """ Индексы материалов по локальным координатам: позиция -> воксель (с ограничением по границам) -> метка -> материал """
+    nx, ny, nz = labels.shape
+    indices = np.empty(position.shape[0], dtype=np.int64)
+    for i in range(position.shape[0]):
+        ix = min(max(int(np.floor((position[i, 0] + size[0]/2)/voxel_size[0])), 0), nx - 1)
+        iy = min(max(int(np.floor((position[i, 1] + size[1]/2)/voxel_size[1])), 0), ny - 1)
+        iz = min(max(int(np.floor((position[i, 2] + size[2]/2)/voxel_size[2])), 0), nz - 1)
+        indices[i] = lut[labels[ix, iy, iz]]
+    return indices
+
+
+@njit(cache=True)
+def brick_material_indices(position: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], shape: NDArray[np.int64], brick_size: int, brick_map: NDArray[np.int32], brick_pool: NDArray[np.uint8]) -> NDArray[np.int64]:
+    """ Индексы материалов по локальным координатам для блочного представления """
+    indices = np.empty(position.shape[0], dtype=np.int64)
+    for i in range(position.shape[0]):
+        ix = min(max(int(np.floor((position[i, 0] + size[0]/2)/voxel_size[0])), 0), shape[0] - 1)
+        iy = min(max(int(np.floor((position[i, 1] + size[1]/2)/voxel_size[1])), 0), shape[1] - 1)
+        iz = min(max(int(np.floor((position[i, 2] + size[2]/2)/voxel_size[2])), 0), shape[2] - 1)
+        brick = brick_map[ix//brick_size, iy//brick_size, iz//brick_size]
+        if brick < 0:
+            indices[i] = -brick - 1
+        else:
+            indices[i] = brick_pool[brick, ix % brick_size, iy % brick_size, iz % brick_size]
+    return indices
+
+
+@njit(cache=True)
+def brick_traverse(position: NDArray[Float], direction: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], shape: NDArray[np.int64], brick_size: int, brick_proxy: NDArray[np.int32]) -> Tuple[NDArray[Float], NDArray[np.int64]]:
+    """ Расстояние до границы текущего блока и индекс его представителя """
+    n = position.shape[0]
+    distance = np.empty(n, dtype=Float)
+    proxy = np.empty(n, dtype=np.int64)
+    brick_index = np.empty(3, dtype=np.int64)
+    for i in range(n):
+        distance[i] = np.inf
+        for axis in range(3):
+            index = min(max(int(np.floor((position[i, axis] + size[axis]/2)/voxel_size[axis])), 0), shape[axis] - 1)
+            brick_index[axis] = index//brick_size
+            brick_length = brick_size*voxel_size[axis]
+            lower = brick_index[axis]*brick_length - size[axis]/2
+            if direction[i, axis] > 0:
+                distance[i] = min(distance[i], (lower + brick_length - position[i, axis])/direction[i, axis])
+            elif direction[i, axis] < 0:
+                distance[i] = min(distance[i], (lower - position[i, axis])/direction[i, axis])
+        distance[i] = max(distance[i], 0.)
+        proxy[i] = brick_proxy[brick_index[0], brick_index[1], brick_index[2]]
+    return distance, proxy
+
 
 class WoodcockVoxelVolume(WoodcockParameticVolume):
     """
     Класс воксельного Woodcock объёма
-    
+
+    Распределение задаётся MaterialArray или картой меток (массив или путь к .npy)
+    с отображением material_mapping метка -> материал. Метки хранятся
+    C-непрерывным массивом uint8, файл может отображаться в память (mmap).
+    У WoodcockBrickVolume label_distribution равно None: метки хранятся в блоках
+
     [coordinates = (x, y, z)] = units.cm\n
     [material] = uint[:,:,:]\n
     [voxel_size] = units.cm
     """
 
-    material_distribution: MaterialArray
+    label_distribution: Optional[NDArray[np.uint8]]
+    material_list: List[Material]
+    _material_lut: NDArray[np.int64]
     _voxel_size_ratio: Vector3D
 
-    def __init__(self, voxel_size: Length, material_distribution: MaterialArray, name: Optional[str] = None) -> None:
-        size = np.asarray(material_distribution.shape)*voxel_size
+    def __init__(self, voxel_size: Length, material_distribution: Union[MaterialArray, NDArray[np.integer], str, Path], name: Optional[str] = None, material_mapping: Optional[Mapping[int, Material]] = None, mmap: bool = False) -> None:
+        if isinstance(material_distribution, MaterialArray):
+            labels = material_distribution.view(np.ndarray)
+            material_mapping = dict(enumerate(material_distribution.material_list))
+        elif isinstance(material_distribution, (str, Path)):
+            labels = np.load(material_distribution, mmap_mode='r' if mmap else None)
+        else:
+            labels = np.asarray(material_distribution)
+        if material_mapping is None:
+            raise ValueError('Для карты меток необходимо отображение material_mapping')
+        self.label_distribution = self._as_labels(labels)
+        self.material_list = [Material(), ]
+        self._material_lut = np.zeros(256, dtype=np.int64)
+        for label, label_material in material_mapping.items():
+            if not 0 <= int(label) < 256:
+                raise ValueError(f'Метка {label} вне диапазона uint8')
+            if label_material not in self.material_list:
+                self.material_list.append(label_material)
+            self._material_lut[int(label)] = self.material_list.index(label_material)
+        size = np.asarray(self.label_distribution.shape)*voxel_size
         super().__init__(
             geometry=Box(size[0], size[1], size[2]),
             material=Material(),
             name=name
             )
-        self.material_distribution = material_distribution
         self._voxel_size_ratio = voxel_size/self.size
 
+    @staticmethod
+    def _as_labels(labels: NDArray[np.generic]) -> NDArray[np.uint8]:
+        if labels.dtype == np.uint8 and labels.flags.c_contiguous:
+            return labels
+        if labels.size > 0 and (labels.min() < 0 or labels.max() > 255 or np.any(labels != np.round(labels))):
+            raise ValueError('Метки воксельного объёма должны быть целыми числами от 0 до 255')
+        return np.ascontiguousarray(labels, dtype=np.uint8)
+
     @property
     def voxel_size(self) -> Vector3D:
         return self.size*self._voxel_size_ratio
@@ -39,17 +130,156 @@ class WoodcockVoxelVolume(WoodcockParameticVolume):
     def voxel_size(self, value: Vector3D) -> None:
         self._voxel_size_ratio = value/self.size
 
+    @property
+    def material_lut(self) -> NDArray[np.int64]:
+        """ Отображение метка -> индекс в material_list """
+        return self._material_lut
+
+    @property
+    def material_distribution(self) -> MaterialArray:
+        """ Полное распределение материалов (строится по запросу) """
+        return MaterialArray.from_indices(self._material_lut[self.label_distribution], self.material_list)
+
     @property
     @cache
     def material(self) -> Material:
-        material_list = self.material_distribution.material_list
-        return max(material_list)
+        return max(self.material_list)
 
     @material.setter
     def material(self, value: Material) -> None:
         pass
 
     def _parametric_function(self, position: Vector3D) -> Tuple[np.ndarray, MaterialArray]:
-        indices = ((position + (self.size / 2 - self.voxel_size / 2)) / self.voxel_size).astype(int)
-        material = self.material_distribution[indices[:, 0], indices[:, 1], indices[:, 2]]
-        return np.ones_like(material, dtype=bool), material
+        indices = voxel_material_indices(
+            np.ascontiguousarray(position, dtype=Float),
+            np.asarray(self.size, dtype=Float),
+            np.asarray(self.voxel_size, dtype=Float),
+            np.asarray(self.label_distribution),
+            self._material_lut
+        )
+        material = MaterialArray.from_indices(indices, self.material_list)
+        return np.ones_like(indices, dtype=bool), material
+
+
+class WoodcockBrickVolume(WoodcockVoxelVolume):
+    """
+    Класс воксельного Woodcock объёма с блочным представлением
+
+    Объём делится на блоки brick_size^3 вокселей. Однородные блоки хранят только
+    материал, неоднородные - индексы материалов в общем пуле блоков. Внутри блока
+    частица движется с локальным мажорантом до его границы, в однородных блоках
+    фиктивных взаимодействий нет. Плотная карта меток после построения блоков
+    не хранится (label_distribution = None), методы, читающие её, переопределены
+
+    [brick_size] = количество вокселей
+    """
+
+    brick_size: int
+    brick_map: NDArray[np.int32]
+    brick_pool: NDArray[np.uint8]
+    brick_proxy: NDArray[np.int32]
+    proxy_list: List[ElementaryVolume]
+    _shape: NDArray[np.int64]
+
+    def __init__(self, voxel_size: Length, material_distribution: Union[MaterialArray, NDArray[np.integer], str, Path], name: Optional[str] = None, material_mapping: Optional[Mapping[int, Material]] = None, mmap: bool = False, brick_size: int = 8) -> None:
+        super().__init__(voxel_size, material_distribution, name, material_mapping, mmap)
+        self.brick_size = brick_size
+        self._shape = np.asarray(self.label_distribution.shape, dtype=np.int64)
+        self._build_bricks()
+        self.label_distribution = None
+        _logger.info(f'{self.name}: {self.statistics}')
+
+    def _build_bricks(self) -> None:
+        b = self.brick_size
+        rank = np.empty(len(self.material_list), dtype=np.uint8)
+        rank[sorted(range(len(self.material_list)), key=lambda index: self.material_list[index])] = np.arange(len(self.material_list))
+        order = np.argsort(rank)
+        bricks_shape = -(-self._shape//b)
+        self.brick_map = np.empty(bricks_shape, dtype=np.int32)
+        brick_majorant = np.empty(bricks_shape, dtype=np.int64)
+        pool = []
+        pool_size = 0
+        for bx in range(bricks_shape[0]):
+            slab = self._material_lut[self.label_distribution[bx*b:(bx + 1)*b]].astype(np.uint8)
+            slab = np.pad(slab, [(0, b*n - s) for n, s in zip((1, *bricks_shape[1:]), slab.shape)], mode='edge')
+            bricks = slab.reshape(b, bricks_shape[1], b, bricks_shape[2], b).transpose(1, 3, 0, 2, 4).reshape(bricks_shape[1], bricks_shape[2], b, b, b)
+            brick_rank = rank[bricks]
+            rank_max = brick_rank.max(axis=(2, 3, 4))
+            uniform = rank_max == brick_rank.min(axis=(2, 3, 4))
+            brick_majorant[bx] = order[rank_max]
+            heterogeneous = (~uniform).nonzero()
+            self.brick_map[bx][uniform] = -brick_majorant[bx][uniform] - 1
+            self.brick_map[bx][heterogeneous] = pool_size + np.arange(heterogeneous[0].size)
+            pool_size += heterogeneous[0].size
+            pool.append(bricks[heterogeneous])
+        self.brick_pool = np.ascontiguousarray(np.concatenate(pool)) if pool_size > 0 else np.zeros((1, b, b, b), dtype=np.uint8)
+
+        keys, brick_proxy = np.unique(brick_majorant*2 + (self.brick_map < 0), return_inverse=True)
+        self.brick_proxy = brick_proxy.reshape(bricks_shape).astype(np.int32)
+        self.proxy_list = [self._make_proxy(int(key)//2, bool(key % 2)) for key in keys]
+
+    def _make_proxy(self, material_index: int, uniform: bool) -> ElementaryVolume:
+        material = self.material_list[material_index]
+        if uniform:
+            return ElementaryVolume(self.geometry, material, f'{self.name} uniform {material.name}')
+        return WoodcockVolume(self.geometry, material, f'{self.name} majorant {material.name}')
+
+    @property
+    def statistics(self) -> Dict[str, Float]:
+        """ Память и доля однородных блоков в сравнении с плотным представлением """
+        dense_bytes = int(np.prod(self._shape))
+        brick_bytes = self.brick_map.nbytes + self.brick_proxy.nbytes + self.brick_pool.nbytes
+        return {
+            'dense_bytes': dense_bytes,
+            'brick_bytes': brick_bytes,
+            'compression': dense_bytes/brick_bytes,
+            'uniform_bricks': float(np.mean(self.brick_map < 0)),
+            'proxies': len(self.proxy_list)
+        }
+
+    @property
+    def material_distribution(self) -> MaterialArray:
+        """ Полное распределение материалов (строится по запросу) """
+        b = self.brick_size
+        indices = np.empty(tuple(self.brick_map.shape) + (b, b, b), dtype=np.uint8)
+        uniform = self.brick_map < 0
+        indices[uniform] = (-self.brick_map[uniform] - 1)[:, None, None, None]
+        indices[~uniform] = self.brick_pool[self.brick_map[~uniform]]
+        indices = indices.transpose(0, 3, 1, 4, 2, 5).reshape(self.brick_map.shape[0]*b, self.brick_map.shape[1]*b, self.brick_map.shape[2]*b)
+        nx, ny, nz = self._shape
+        return MaterialArray.from_indices(indices[:nx, :ny, :nz], self.material_list)
+
+    def cast_path(self, position: Vector3D, direction: Vector3D, local: bool = False, as_parent: bool = True) -> Tuple[NDArray[Float], VolumeArray]:
+        if not local:
+            position = self.convert_to_local_position(position, as_parent)
+            direction = self.convert_to_local_direction(direction, as_parent)
+        distance, current_volume = super().cast_path(position, direction, True)
+        inside = (current_volume != 0).nonzero()[0]
+        if inside.size == 0:
+            return distance, current_volume
+        brick_distance, proxy = brick_traverse(
+            np.ascontiguousarray(position[inside], dtype=Float),
+            np.ascontiguousarray(direction[inside], dtype=Float),
+            np.asarray(self.size, dtype=Float),
+            np.asarray(self.voxel_size, dtype=Float),
+            self._shape,
+            self.brick_size,
+            self.brick_proxy
+        )
+        distance[inside] = np.minimum(distance[inside], brick_distance + self.geometry.distance_epsilon)
+        indices = np.zeros(current_volume.shape, dtype=np.int64)
+        indices[inside] = proxy + 1
+        return distance, VolumeArray.from_indices(indices, [None, *self.proxy_list])
+
+    def _parametric_function(self, position: Vector3D) -> Tuple[np.ndarray, MaterialArray]:
+        indices = brick_material_indices(
+            np.ascontiguousarray(position, dtype=Float),
+            np.asarray(self.size, dtype=Float),
+            np.asarray(self.voxel_size, dtype=Float),
+            self._shape,
+            self.brick_size,
+            self.brick_map,
+            self.brick_pool
+        )
+        material = MaterialArray.from_indices(indices, self.material_list)
+        return np.ones_like(indices, dtype=bool), material
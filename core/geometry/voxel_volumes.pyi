@@ -1,19 +1,51 @@
 import numpy as np
-from typing import Optional, Tuple, Any
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+from numpy.typing import NDArray
+from core.geometry.volumes import ElementaryVolume, VolumeArray
 from core.geometry.woodcoock_volumes import WoodcockParameticVolume
 from core.materials.materials import Material, MaterialArray
 from core.other.typing_definitions import Length, Vector3D, Float
 
+def voxel_material_indices(position: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], labels: NDArray[np.uint8], lut: NDArray[np.int64]) -> NDArray[np.int64]: ...
+def brick_material_indices(position: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], shape: NDArray[np.int64], brick_size: int, brick_map: NDArray[np.int32], brick_pool: NDArray[np.uint8]) -> NDArray[np.int64]: ...
+def brick_traverse(position: NDArray[Float], direction: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], shape: NDArray[np.int64], brick_size: int, brick_proxy: NDArray[np.int32]) -> Tuple[NDArray[Float], NDArray[np.int64]]: ...
+
 class WoodcockVoxelVolume(WoodcockParameticVolume):
-    material_distribution: MaterialArray
-    _voxel_size_ratio: Length
-    def __init__(self, voxel_size: Length, material_distribution: MaterialArray, name: Optional[str] = None) -> None: ...
+    label_distribution: Optional[NDArray[np.uint8]]
+    material_list: List[Material]
+    _material_lut: NDArray[np.int64]
+    _voxel_size_ratio: Vector3D
+    def __init__(self, voxel_size: Length, material_distribution: Union[MaterialArray, NDArray[np.integer], str, Path], name: Optional[str] = None, material_mapping: Optional[Mapping[int, Material]] = None, mmap: bool = False) -> None: ...
+    @staticmethod
+    def _as_labels(labels: NDArray[np.generic]) -> NDArray[np.uint8]: ...
     @property
     def voxel_size(self) -> Vector3D: ...
     @voxel_size.setter
     def voxel_size(self, value: Vector3D) -> None: ...
     @property
+    def material_lut(self) -> NDArray[np.int64]: ...
+    @property
+    def material_distribution(self) -> MaterialArray: ...
+    @property
     def material(self) -> Material: ...
     @material.setter
     def material(self, value: Material) -> None: ...
-    def _parametric_function(self, position: Vector3D) -> Tuple[np.ndarray, Any]: ...
+    def _parametric_function(self, position: Vector3D) -> Tuple[np.ndarray, MaterialArray]: ...
+
+class WoodcockBrickVolume(WoodcockVoxelVolume):
+    brick_size: int
+    brick_map: NDArray[np.int32]
+    brick_pool: NDArray[np.uint8]
+    brick_proxy: NDArray[np.int32]
+    proxy_list: List[ElementaryVolume]
+    _shape: NDArray[np.int64]
+    def __init__(self, voxel_size: Length, material_distribution: Union[MaterialArray, NDArray[np.integer], str, Path], name: Optional[str] = None, material_mapping: Optional[Mapping[int, Material]] = None, mmap: bool = False, brick_size: int = 8) -> None: ...
+    def _build_bricks(self) -> None: ...
+    def _make_proxy(self, material_index: int, uniform: bool) -> ElementaryVolume: ...
+    @property
+    def statistics(self) -> Dict[str, Float]: ...
+    @property
+    def material_distribution(self) -> MaterialArray: ...
+    def cast_path(self, position: Vector3D, direction: Vector3D, local: bool = False, as_parent: bool = True) -> Tuple[NDArray[Float], VolumeArray]: ...
+    def _parametric_function(self, position: Vector3D) -> Tuple[np.ndarray, MaterialArray]: ...
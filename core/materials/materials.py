@@ -9,7 +9,7 @@ from numpy.typing import NDArray
 
 from core.materials.atomic_properties import atomic_number
 from core.other.nonunique_array import NonuniqueArray
-from core.other.typing_definitions import Float
+from core.other.typing_definitions import Float, MaterialID
 
 
 Composition = namedtuple('Composition', ['H'])
@@ -76,7 +76,7 @@ class MaterialArray(NonuniqueArray):
         obj = super().__new__(cls, shape)
         obj.element_list = [Material(), ]
         return obj
-    
+
     @property
     def material_list(self) -> List[Material]:
         return self.element_list
@@ -90,8 +90,11 @@ class MaterialArray(NonuniqueArray):
 
     @property
     def density(self) -> NDArray[Float]:
-        density = np.zeros_like(self, dtype=Float)
-        for material, indices in self.inverse_indices.items():
-            density[indices] = material.density
-        return density
+        density = np.array([material.density for material in self.element_list], dtype=Float)
+        return density[self.view(np.ndarray)]
+
+    @property
+    def ID(self) -> NDArray[MaterialID]:
+        IDs = np.array([material.ID for material in self.element_list], dtype=MaterialID)
+        return IDs[self.view(np.ndarray)]
 
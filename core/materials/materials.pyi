@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Any, Tuple, Optional
 from numpy.typing import NDArray
 from core.other.nonunique_array import NonuniqueArray
-from core.other.typing_definitions import Float
+from core.other.typing_definitions import Float, MaterialID
 
 class Composition(Tuple[Float, ...]):
     def _asdict(self) -> Dict[str, Float]: ...
@@ -29,9 +29,13 @@ class Material:
 
 class MaterialArray(NonuniqueArray):
     def __new__(cls, shape: Tuple[int, ...]) -> 'MaterialArray': ...
+    @classmethod
+    def from_indices(cls, indices: NDArray[np.integer], element_list: List[Any]) -> 'MaterialArray': ...
     @property
     def material_list(self) -> List[Material]: ...
     @property
     def Zeff(self) -> NDArray[Float]: ...
     @property
     def density(self) -> NDArray[Float]: ...
+    @property
+    def ID(self) -> NDArray[MaterialID]: ...
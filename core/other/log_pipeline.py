@@ -0,0 +1,143 @@
+import logging
+import logging.handlers
+import multiprocessing as mp
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+FORMAT = '[%(asctime)s: %(levelname)s] %(message)s'
+
+# Отметка записей о ходе работы (extra=PROGRESS): уровень INFO, но такие записи
+# проходят через ProgressFilter обработчиков консоли и Telegram
+PROGRESS = {'progress': True}
+
+_unit = ''
+
+
+def configure_levels(level: Union[int, str] = logging.INFO, levels: Optional[Mapping[str, Union[int, str]]] = None) -> None:
+    """ Уровень логгеров пакета core и уровни отдельных модулей (имя логгера: уровень) """
+    logging.getLogger('core').setLevel(level)
+    for name, module_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(module_level)
+
+
+def set_unit(unit: str) -> None:
+    """ Единица работы процесса, записи лога которой попадут в файл <unit>.log """
+    global _unit
+    _unit = unit
+
+
+class UnitFilter(logging.Filter):
+    """ Добавляет к записи единицу работы процесса """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'unit'):
+            record.unit = _unit
+        return True
+
+
+class ProgressFilter(logging.Filter):
+    """ Пропускает записи не ниже уровня level и записи о ходе работы """
+    level: int
+
+    def __init__(self, level: Union[int, str] = logging.WARNING) -> None:
+        super().__init__()
+        self.level = level if isinstance(level, int) else logging.getLevelName(level.upper())
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.level or getattr(record, 'progress', False)
+
+
+class UnitFileHandler(logging.Handler):
+    """ Запись логов в файлы <directory>/<unit>.log, записи вне единиц работы - в <default>.log """
+    directory: Path
+    default: str
+
+    def __init__(self, directory: Union[str, Path], default: str = 'study') -> None:
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.default = default
+        self._handlers: Dict[str, logging.FileHandler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        unit = getattr(record, 'unit', '') or self.default
+        handler = self._handlers.get(unit)
+        if handler is None:
+            handler = logging.FileHandler(self.directory/f'{unit}.log', encoding='utf-8')
+            handler.setFormatter(self.formatter)
+            self._handlers[unit] = handler
+        handler.emit(record)
+
+    def close(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
+        self._handlers.clear()
+        super().close()
+
+
+def attach_queue(queue: Any, level: Union[int, str] = logging.INFO, levels: Optional[Mapping[str, Union[int, str]]] = None) -> None:
+    """
+    Направить логи процесса в очередь слушателя LogPipeline
+
+    Инициализатор процессов пула: обработчики корневого логгера заменяются
+    на QueueHandler, запись в файлы и отправка в Telegram остаются родительскому процессу
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    handler = logging.handlers.QueueHandler(queue)
+    handler.addFilter(UnitFilter())
+    root.addHandler(handler)
+    configure_levels(level, levels)
+
+
+class LogPipeline:
+    """
+    Неблокирующее журналирование процессов исследования
+
+    Процессы (и родительский, и процессы пула) только кладут записи в очередь,
+    поток QueueListener родительского процесса передаёт их обработчикам.
+    Медленные обработчики (файлы, Telegram) не задерживают перенос,
+    записи всех процессов собираются в одном месте
+    """
+    handlers: List[logging.Handler]
+    level: Union[int, str]
+    levels: Dict[str, Union[int, str]]
+
+    def __init__(self, handlers: Iterable[logging.Handler], level: Union[int, str] = logging.INFO, levels: Optional[Mapping[str, Union[int, str]]] = None) -> None:
+        self.handlers = list(handlers)
+        self.level = level
+        self.levels = dict(levels or {})
+        self.queue = mp.Queue()
+        self._listener = logging.handlers.QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+        self._root_handlers: List[logging.Handler] = []
+
+    @property
+    def initializer(self) -> Tuple[Any, Tuple[Any, ...]]:
+        """ Инициализатор и его аргументы для процессов пула """
+        return attach_queue, (self.queue, self.level, self.levels)
+
+    def start(self) -> None:
+        self._root_handlers = logging.getLogger().handlers[:]
+        self._listener.start()
+        attach_queue(self.queue, self.level, self.levels)
+
+    def stop(self) -> None:
+        """ Дописать оставшиеся записи, закрыть обработчики и вернуть прежние обработчики корневого логгера """
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in self._root_handlers:
+            root.addHandler(handler)
+        self._listener.stop()
+        for handler in self.handlers:
+            handler.close()
+        self.queue.close()
+        self.queue.join_thread()
+
+    def __enter__(self) -> 'LogPipeline':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
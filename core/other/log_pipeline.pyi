@@ -0,0 +1,39 @@
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+FORMAT: str
+PROGRESS: Dict[str, Any]
+
+def configure_levels(level: Union[int, str] = ..., levels: Optional[Mapping[str, Union[int, str]]] = None) -> None: ...
+def set_unit(unit: str) -> None: ...
+
+class UnitFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool: ...
+
+class ProgressFilter(logging.Filter):
+    level: int
+    def __init__(self, level: Union[int, str] = ...) -> None: ...
+    def filter(self, record: logging.LogRecord) -> bool: ...
+
+class UnitFileHandler(logging.Handler):
+    directory: Path
+    default: str
+    def __init__(self, directory: Union[str, Path], default: str = 'study') -> None: ...
+    def emit(self, record: logging.LogRecord) -> None: ...
+    def close(self) -> None: ...
+
+def attach_queue(queue: Any, level: Union[int, str] = ..., levels: Optional[Mapping[str, Union[int, str]]] = None) -> None: ...
+
+class LogPipeline:
+    handlers: List[logging.Handler]
+    level: Union[int, str]
+    levels: Dict[str, Union[int, str]]
+    queue: Any
+    def __init__(self, handlers: Iterable[logging.Handler], level: Union[int, str] = ..., levels: Optional[Mapping[str, Union[int, str]]] = None) -> None: ...
+    @property
+    def initializer(self) -> Tuple[Any, Tuple[Any, ...]]: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    def __enter__(self) -> LogPipeline: ...
+    def __exit__(self, *args: Any) -> None: ...
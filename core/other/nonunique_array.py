@@ -18,6 +18,14 @@ class NonuniqueArray(np.ndarray):
         obj.view(np.ndarray)[:] = 0
         return obj
 
+    @classmethod
+    def from_indices(cls, indices: NDArray[np.integer], element_list: List[Any]) -> 'NonuniqueArray':
+        """ Создать массив по индексам в списке элементов без поэлементных присваиваний """
+        obj = cls(indices.shape)
+        obj.element_list = list(element_list)
+        obj.view(np.ndarray)[...] = indices
+        return obj
+
     def __array_finalize__(self, obj: Any) -> None:
         if obj is None:
             return
@@ -1,24 +1,85 @@
-from logging import StreamHandler
-from typing import Any, Optional, Union
-
-from telebot import TeleBot
+import logging
+import queue
+import sys
+import threading as mt
+from time import monotonic
+from typing import Any, List, Optional, Union
 
 from settings.telegram_bot_settings import token, user_id
 
 
-class TeleBotStream(TeleBot):
-    
+class TeleBotStream:
+    """ Поток сообщений пользователю user_id, telebot импортируется при создании """
+    bot: Any
+
     def __init__(self, token: str = token, user_id: Union[int, str] = user_id) -> None:
-        super().__init__(token)
+        from telebot import TeleBot
+
+        self.bot = TeleBot(token)
         self.user_id = user_id
-    
+
     def write(self, messenge: str) -> None:
-        self.send_message(self.user_id, messenge)    
-        
-        
-class TeleBotHandler(StreamHandler):
-    
-    def __init__(self, token: str = token, user_id: Union[int, str] = user_id) -> None:
-        super().__init__(TeleBotStream(token, user_id)) # type: ignore
-    
-    
\ No newline at end of file
+        self.bot.send_message(self.user_id, messenge)
+
+
+class TeleBotHandler(logging.Handler):
+    """
+    Обработчик логов с отправкой сообщений в Telegram из фонового потока
+
+    emit только ставит отформатированную запись в очередь. Поток-отправитель
+    собирает записи, пришедшие за interval секунд (не больше batch_size),
+    в одно сообщение, ошибки отправки не влияют на моделирование.
+    Оставшиеся записи отправляются при закрытии обработчика
+    """
+    interval: float
+    batch_size: int
+
+    max_message_length = 4096
+
+    def __init__(self, token: str = token, user_id: Union[int, str] = user_id, interval: float = 5., batch_size: int = 20) -> None:
+        super().__init__()
+        self.stream = TeleBotStream(token, user_id)
+        self.interval = interval
+        self.batch_size = batch_size
+        self._queue: queue.Queue[Optional[str]] = queue.Queue()
+        self._sender = mt.Thread(target=self._send_batches, name='TeleBotSender', daemon=True)
+        self._sender.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._queue.put_nowait(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def _send(self, batch: List[str]) -> None:
+        text = '\n\n'.join(batch)
+        for start in range(0, len(text), self.max_message_length):
+            try:
+                self.stream.write(text[start:start + self.max_message_length])
+            except Exception as error:
+                sys.stderr.write(f'Telegram message not sent: {error!r}\n')
+
+    def _send_batches(self) -> None:
+        stopped = False
+        while not stopped:
+            message = self._queue.get()
+            if message is None:
+                return
+            batch = [message]
+            deadline = monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                try:
+                    message = self._queue.get(timeout=max(deadline - monotonic(), 0.))
+                except queue.Empty:
+                    break
+                if message is None:
+                    stopped = True
+                    break
+                batch.append(message)
+            self._send(batch)
+
+    def close(self) -> None:
+        if self._sender.is_alive():
+            self._queue.put(None)
+            self._sender.join(timeout=self.interval + 30)
+        super().close()
@@ -12,4 +12,8 @@ Density: TypeAlias = Float
 
 Vector3D: TypeAlias = NDArray[Float]
 ID: TypeAlias = np.uint64
+VolumeID: TypeAlias = np.uint32
+MaterialID: TypeAlias = np.uint16
 Species: TypeAlias = np.uint8
+ScatterOrder: TypeAlias = np.uint8
+SourceID: TypeAlias = np.uint8
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -33,6 +33,13 @@ def unique_with_indices(array: Sequence[Any]) -> List[Tuple[Any, NDArray[np.int6
     return [(uniqueEl, np.array([i for i, element in enumerate(array) if element is uniqueEl])) for uniqueEl in set(array)]
 
 
+def broadcast_sampler(kernel: Callable[..., NDArray[Float]], rng: np.random.Generator, energy: Any, Z: Any) -> Union[Float, NDArray[Float]]:
+    """ Вызвать ядро выборки kernel(energy, Z, rng) для плоских массивов с распространением форм, как у ufunc """
+    energy, Z = np.broadcast_arrays(np.asarray(energy, dtype=np.float64), np.asarray(Z, dtype=np.int64))
+    result = kernel(np.ascontiguousarray(energy).ravel(), np.ascontiguousarray(Z).ravel(), rng).reshape(energy.shape)
+    return result[()] if result.ndim == 0 else result
+
+
 def datetime_from_seconds(seconds: Float) -> timedelta:
     zerodatetime = datetime.fromtimestamp(0)
     nowdatetime = datetime.fromtimestamp(seconds)
@@ -3,7 +3,7 @@ from typing import Any, Optional, Union, cast, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
-from core.other.typing_definitions import Energy, Float, ID, Length, Time, Vector3D, Species
+from core.other.typing_definitions import Energy, Float, ID, Length, ScatterOrder, SourceID, Time, Vector3D, Species
 
 
 class ParticleCore:
@@ -19,6 +19,8 @@ class ParticleCore:
     emission_direction: Vector3D
     distance_traveled: Union[Length, NDArray[Length]]
     ID: Union[ID, NDArray[ID]]
+    scatter_order: Union[ScatterOrder, NDArray[ScatterOrder]]
+    source_ID: Union[SourceID, NDArray[SourceID]]
 
     def __getattr__(self, name: str) -> Any:
         try:
@@ -79,7 +81,9 @@ class ParticleCore:
             ('emission_position', (Length, 3)),
             ('emission_direction', (Length, 3)),
             ('distance_traveled', Length),
-            ('ID', ID)
+            ('ID', ID),
+            ('scatter_order', ScatterOrder),
+            ('source_ID', SourceID)
         ])
 
 
@@ -109,7 +113,8 @@ class ParticleArray(np.ndarray, ParticleCore):
         emission_time: Optional[NDArray[Time]] = None,
         emission_position: Optional[Vector3D] = None,
         emission_direction: Optional[Vector3D] = None,
-        distance_traveled: Optional[NDArray[Length]] = None
+        distance_traveled: Optional[NDArray[Length]] = None,
+        source_ID: Optional[NDArray[SourceID]] = None
     ) -> 'ParticleArray':
 
         obj = cls(shape=energy.size)
@@ -124,6 +129,8 @@ class ParticleArray(np.ndarray, ParticleCore):
         obj['emission_direction'] = direction if emission_direction is None else emission_direction
         obj['distance_traveled'] = 0 if distance_traveled is None else distance_traveled
         obj['ID'] = cls.__get_ID(obj.size)
+        obj['scatter_order'] = 0
+        obj['source_ID'] = 0 if source_ID is None else source_ID
         return obj
 
     @classmethod
@@ -1,7 +1,7 @@
 import numpy as np
 from typing import Union, overload, Any, Tuple, Optional
 from numpy.typing import NDArray
-from core.other.typing_definitions import Float, Vector3D, Energy, Time, Length, ID, Species
+from core.other.typing_definitions import Float, Vector3D, Energy, Time, Length, ID, ScatterOrder, SourceID, Species
 
 class ParticleCore:
     species: Union[Species, NDArray[Species]]
@@ -14,6 +14,8 @@ class ParticleCore:
     emission_direction: Vector3D
     distance_traveled: Union[Length, NDArray[Length]]
     ID: Union[ID, NDArray[ID]]
+    scatter_order: Union[ScatterOrder, NDArray[ScatterOrder]]
+    source_ID: Union[SourceID, NDArray[SourceID]]
 
     def move(self, distance: Union[Length, NDArray[Length]]) -> None: ...
     def rotate(self, theta: Union[Float, NDArray[Float]], phi: Union[Float, NDArray[Float]]) -> None: ...
@@ -32,6 +34,8 @@ class Particle(np.void, ParticleCore):
     emission_direction: Vector3D
     distance_traveled: Length
     ID: ID
+    scatter_order: ScatterOrder
+    source_ID: SourceID
 
 class ParticleArray(np.ndarray, ParticleCore):
     count: int
@@ -46,6 +50,8 @@ class ParticleArray(np.ndarray, ParticleCore):
     emission_direction: Vector3D
     distance_traveled: NDArray[Length]
     ID: NDArray[ID]
+    scatter_order: NDArray[ScatterOrder]
+    source_ID: NDArray[SourceID]
 
     def __new__(cls, shape: Union[int, Tuple[int, ...]]) -> 'ParticleArray': ...
 
@@ -59,6 +65,7 @@ class ParticleArray(np.ndarray, ParticleCore):
         emission_time: Optional[NDArray[Time]] = None,
         emission_position: Optional[Vector3D] = None,
         emission_direction: Optional[Vector3D] = None,
-        distance_traveled: Optional[NDArray[Length]] = None
+        distance_traveled: Optional[NDArray[Length]] = None,
+        source_ID: Optional[NDArray[SourceID]] = None
     ) -> 'ParticleArray': ...
 
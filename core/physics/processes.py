@@ -11,7 +11,7 @@ import settings.database_setting as settings
 from core.data.interaction_data import InteractionArray
 from core.materials.attenuation_functions import AttenuationFunction
 from core.materials.materials import Material, MaterialArray
-from core.other.typing_definitions import Float
+from core.other.typing_definitions import Float, ScatterOrder
 from core.particles.particles import ParticleArray
 
 
@@ -63,6 +63,8 @@ class Process(ABC):
         interaction_data.direction = particle.direction
         interaction_data.process_name = self.name
         interaction_data.particle_ID = particle.ID
+        interaction_data.scatter_order = particle.scatter_order
+        interaction_data.source_ID = particle.source_ID
         interaction_data.energy_deposit = Float(0.)
         interaction_data.scattering_angles = Float(0.)
         interaction_data.emission_time = particle.emission_time
@@ -79,7 +81,7 @@ class PhotoelectricEffect(Process):
     def __call__(self, particle: ParticleArray, material: Union[Material, MaterialArray]) -> InteractionArray:
         """ Применить фотоэффект """
         interaction_data = super().__call__(particle, material)
-        energy_deposit = particle.energy
+        energy_deposit = particle.energy.copy()
         particle.energy -= energy_deposit
         interaction_data.energy_deposit = energy_deposit
         return interaction_data
@@ -112,6 +114,8 @@ class CoherentScattering(Process):
         particle.rotate(theta, phi)
         interaction_data = super().__call__(particle, material)
         interaction_data.scattering_angles = np.column_stack((theta, phi))
+        # Насыщение вместо переполнения: после 255 рассеяний фотон не должен стать первичным
+        particle.scatter_order += particle.scatter_order < np.iinfo(ScatterOrder).max
         return interaction_data
 
 
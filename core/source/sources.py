@@ -1,4 +1,4 @@
-from typing import Any, cast, List, Optional, Sequence, Tuple, Union
+from typing import Any, cast, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import hepunits as units
@@ -6,7 +6,7 @@ from numpy.typing import NDArray
 
 import core.other.utils as utils
 from core.other.typing_definitions import (Activity, Energy, Float, Length,
-                                           Time, Vector3D)
+                                           SourceID, Species, Time, Vector3D)
 from core.particles.particles import ParticleArray
 
 
@@ -23,6 +23,11 @@ class Source:
     [energy] = units.eV
 
     [half_life] = sec
+
+    Моменты испускания - пуассоновский поток распадов: в координате накопленного
+    числа распадов N(t) распады пакета получаются упорядоченными через экспоненциальные
+    интервалы и переводятся во время обращением N(t). В окне set_time_window число
+    распадов известно заранее, после последнего распада окна таймер равен концу окна
     """
 
     distribution: NDArray[Float]
@@ -33,6 +38,8 @@ class Source:
     energy: np.ndarray
     half_life: Time
     timer: Time
+    time_stop: Optional[Time]
+    remaining_decays: Optional[int]
     transformation_matrix: NDArray[Float]
     rng: np.random.Generator
     emission_table: List[NDArray[Any]]
@@ -54,6 +61,9 @@ class Source:
         
         self.half_life = half_life
         self.timer = Float(0.)
+        self.time_stop = None
+        self.remaining_decays = None
+        self._decays = Float(0.)
         self._generate_emission_table()
         self.transformation_matrix = np.array([
             [1., 0., 0., 0.],
@@ -101,6 +111,8 @@ class Source:
         probability = self.distribution.ravel()
         indices = probability.nonzero()[0]
         self.emission_table = [position[indices], probability[indices]]
+        self._emission_cdf = np.cumsum(probability[indices])
+        self._emission_cdf /= self._emission_cdf[-1]
 
     @property
     def activity(self) -> NDArray[Float]:
@@ -110,32 +122,135 @@ class Source:
     def nuclei_number(self) -> NDArray[Float]:
         return self.activity * self.half_life / np.log(2)
 
+    @property
+    def components(self) -> List['Source']:
+        """ Источники-компоненты (для простого источника - он сам) """
+        return [self]
+
+    def activity_at(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]:
+        return self.initial_activity * 2 ** (-np.asarray(time) / self.half_life)
+
+    def decays(self, time_start: Time, time_stop: Time) -> Float:
+        """ Ожидаемое число распадов за интервал времени """
+        if np.isinf(self.half_life):
+            return Float(self.initial_activity*(time_stop - time_start))
+        return Float(-self.activity_at(time_start)*self.half_life/np.log(2)*np.expm1(-np.log(2)*(time_stop - time_start)/self.half_life))
+
+    def _decays_until(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]:
+        """ Накопленное число распадов с момента 0 """
+        if np.isinf(self.half_life):
+            return self.initial_activity*np.asarray(time)
+        mean_life = self.half_life/np.log(2)
+        return -self.initial_activity*mean_life*np.expm1(-np.asarray(time)/mean_life)
+
+    def _decay_time(self, decays: NDArray[Float]) -> NDArray[Float]:
+        """ Моменты, к которым накапливается заданное число распадов """
+        if np.isinf(self.half_life):
+            return decays/self.initial_activity
+        mean_life = self.half_life/np.log(2)
+        return -mean_life*np.log1p(-decays/(self.initial_activity*mean_life))
+
+    def _time_after(self, increments: NDArray[Float]) -> NDArray[Float]:
+        """
+        Моменты, к которым после текущего момента накапливается increments распадов
+
+        Обращение от текущего момента: активность A = A0 - N/τ без возведения
+        в степень, логарифм частиц близок к нулю и считается без потери точности момента
+        """
+        if np.isinf(self.half_life):
+            return self.timer + increments/self.initial_activity
+        mean_life = self.half_life/np.log(2)
+        remaining = (self.initial_activity - self._decays/mean_life)*mean_life
+        emission_time = increments*(-1/remaining)
+        emission_time += 1.
+        np.log(emission_time, out=emission_time)
+        emission_time *= -mean_life
+        emission_time += self.timer
+        return emission_time
+
     def set_state(self, timer: Optional[Time], rng_state: Optional[Any] = None) -> None:
         if timer is not None:
             self.timer = timer
+            self.time_stop = None
+            self.remaining_decays = None
+            self._decays = Float(self._decays_until(timer))
         if rng_state is None:
             return
         self.rng.bit_generator.state['state'] = rng_state# type: ignore 
 
+    def set_time_window(self, time_start: Time, time_stop: Time, decays: Optional[int] = None) -> None:
+        """
+        Испускать только в окне [time_start, time_stop] с числом распадов decays
+        (по умолчанию - пуассоновским с ожидаемым числом распадов окна).
+        Окно без конца и без decays - неограниченный поток распадов
+        """
+        self.set_state(time_start)
+        self.time_stop = time_stop
+        if np.isinf(time_stop) and decays is None:
+            return
+        self._window_decays = Float(self._decays_until(time_stop))
+        self.remaining_decays = int(self.rng.poisson(self._window_decays - self._decays) if decays is None else decays)
+        if self.remaining_decays == 0:
+            self.timer = time_stop
+            self._decays = self._window_decays
+
+    def _next_batch(self, n: int) -> Tuple[int, Optional[Float], bool]:
+        """
+        Число распадов следующего пакета (не более n), накопленное число распадов
+        на конце пакета (None - поток без окна) и признак того, что последний распад
+        пакета лежит на конце
+        """
+        if self.remaining_decays is None:
+            return n, None, True
+        count = min(n, self.remaining_decays)
+        if count < self.remaining_decays:
+            # Конец пакета - count-я порядковая статистика оставшихся распадов окна
+            return count, self._decays + (self._window_decays - self._decays)*self.rng.beta(count, self.remaining_decays - count + 1), True
+        return count, self._window_decays, False
+
+    def _advance(self, count: int, decays: Float, timer: Time) -> None:
+        """ Перевести таймер на конец пакета, после последнего распада окна - точно на конец окна """
+        self._decays = decays
+        if self.remaining_decays is None:
+            self.timer = timer
+            return
+        self.remaining_decays -= count
+        self.timer = self.time_stop if self.remaining_decays == 0 else timer
+
     def generate_energy(self, n: int) -> NDArray[Float]:
         energy = self.rng.choice(self.energy["energy"], n, p=self.energy["probability"])
         return energy
 
     def generate_position(self, n: int) -> Vector3D:
-        position = self.emission_table[0]
-        probability = self.emission_table[1]
-        position = self.rng.choice(position, n, p=probability)
+        # Функция распределения вокселей вычислена один раз, выборка совпадает с rng.choice(..., p=probability)
+        position = self.emission_table[0][self._emission_cdf.searchsorted(self.rng.random(n), side='right')]
         position += self.rng.uniform(0., self.voxel_size, position.shape)
         position = self.convert_to_global_position(position)
         return position
 
-    def generate_emission_time(self, n: int) -> Tuple[NDArray[Float], Float]:
-        dt = np.log((self.nuclei_number + n) / self.nuclei_number) * self.half_life / np.log(2)
-        a = 2 ** (-self.timer / self.half_life)
-        b = 2 ** (-(self.timer + dt) / self.half_life)
-        alpha = self.rng.uniform(b, a, n)
-        emission_time = -np.log(alpha) * self.half_life / np.log(2)
-        return emission_time, Float(dt)
+    def generate_position_at(self, emission_time: NDArray[Float]) -> Vector3D:
+        """ Позиции испускания в моменты emission_time """
+        return self.generate_position(emission_time.size)
+
+    def generate_emission_time(self, n: int) -> NDArray[Float]:
+        """ Упорядоченные моменты следующих распадов (не более n, меньше - в конце окна) с переводом таймера """
+        if n == 0 or self.remaining_decays == 0:
+            return np.empty(0, dtype=Float)
+        count, end, closed = self._next_batch(n)
+        increments = self.rng.standard_exponential(count + (not closed))
+        np.cumsum(increments, out=increments)
+        if end is None:
+            end = self._decays + increments[-1]
+        else:
+            # Нормированные экспоненциальные интервалы - упорядоченные равномерные точки до конца пакета
+            increments *= (end - self._decays)/increments[-1]
+        emission_time = self._time_after(increments[:count])
+        self._advance(count, end, emission_time[-1])
+        return emission_time
+
+    def sample_emission_time(self, n: int, time_start: Time, time_stop: Time) -> NDArray[Float]:
+        """ Моменты n распадов в интервале времени, таймер не меняется """
+        return self._decay_time(self.rng.uniform(self._decays_until(time_start), self._decays_until(time_stop), n))
 
     def generate_direction(self, n: int) -> Vector3D:
         a1 = self.rng.random(n)
@@ -148,16 +263,23 @@ class Source:
         return direction
 
     def generate_particles(self, n: int) -> ParticleArray:
+        emission_time = self.generate_emission_time(n)
+        n = emission_time.size
         energy = self.generate_energy(n)
         direction = self.generate_direction(n)
-        position = self.generate_position(n)
-        emission_time, dt = self.generate_emission_time(n)
-        self.timer += dt
+        position = self.generate_position_at(emission_time)
 
-        from core.other.typing_definitions import Species
         particles = ParticleArray.create(np.zeros_like(energy, dtype=Species), position, direction, energy, emission_time)
         return particles
 
+    def emit(self, n: int, time_start: Time, time_stop: Time) -> Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]:
+        """ Энергии, направления, позиции и моменты n испусканий в интервале времени, таймер не меняется """
+        emission_time = self.sample_emission_time(n, time_start, time_stop)
+        energy = self.generate_energy(n)
+        direction = self.generate_direction(n)
+        position = self.generate_position_at(emission_time)
+        return energy, direction, position, emission_time
+
 
 class PointSource(Source):
     """
@@ -194,11 +316,12 @@ class Tc99m_MIBI(Source):
     [voxel_size] = units.cm
     """
 
+    half_life = Float(6. * units.hour)
+
     def __init__(self, distribution, activity=None, voxel_size=4*units.mm):
         radiation_type = 'Gamma'
         energy = Float(140.5 * units.keV)
-        half_life = 6.*units.hour
-        super().__init__(distribution, activity, voxel_size, radiation_type, energy, half_life)
+        super().__init__(distribution, activity, voxel_size, radiation_type, energy, self.half_life)
 
 class I123(Source):
     """
@@ -213,6 +336,8 @@ class I123(Source):
     [voxel_size] = units.cm
     """
 
+    half_life = Float(13.27 * units.hour)
+
     def __init__(self, distribution, activity=None, voxel_size=4*units.mm):
         radiation_type = 'Gamma'
         energy = [
@@ -223,8 +348,267 @@ class I123(Source):
             [505.33*units.keV, 0.316],
             [346.35*units.keV, 0.126],
         ]
-        half_life = 13.27*units.hour
-        super().__init__(distribution, activity, voxel_size, radiation_type, energy, half_life)
+        super().__init__(distribution, activity, voxel_size, radiation_type, energy, self.half_life)
+
+
+class DynamicSource(Source):
+    """
+    Источник с кривыми активность-время (TAC) областей
+
+    labels - карта областей (0 - без активности), tacs[метка] = (времена, активности) -
+    кусочно-линейная полная активность области (вне узлов - значение крайнего узла),
+    физический распад должен быть учтён в кривых. distribution - необязательные веса
+    вокселей внутри областей
+
+    Моменты испускания выбираются обращением накопленного числа распадов,
+    область - по отношению активностей областей в момент испускания,
+    воксель - по функции распределения области, вычисленной один раз
+
+    [labels] = int[:,:,:]
+
+    [tacs] = {label: (units.s[:], Bq[:])}
+    """
+
+    labels: NDArray[np.int64]
+    region_labels: NDArray[np.int64]
+    tac_times: NDArray[Float]
+    tac_activity: NDArray[Float]
+    cumulative_decays: NDArray[Float]
+    region_voxels: List[NDArray[np.int64]]
+    region_cdf: List[NDArray[Float]]
+
+    half_life = Float(np.inf)
+
+    def __init__(self, labels: Any, tacs: Dict[int, Tuple[Sequence[Time], Sequence[Activity]]], distribution: Optional[Any] = None, voxel_size: Length = Float(4 * units.mm), radiation_type: str = 'Gamma', energy: Union[Float, List[List[Float]]] = Float(140.5 * units.keV), rng: Optional[np.random.Generator] = None) -> None:
+        self.labels = np.asarray(labels, dtype=np.int64)
+        self.region_labels = np.array(sorted(int(label) for label in tacs), dtype=np.int64)
+        missing = sorted(set(self.region_labels.tolist()) - set(np.unique(self.labels).tolist()))
+        if missing:
+            raise ValueError(f'Областей {missing} нет в карте меток источника')
+        weights = np.ones(self.labels.shape, dtype=Float) if distribution is None else np.asarray(distribution, dtype=Float)
+        weights = np.where(np.isin(self.labels, self.region_labels), weights, 0.)
+        super().__init__(weights, None, voxel_size, radiation_type, energy, self.half_life, rng)
+
+        self.tac_times = np.unique(np.concatenate([np.asarray(times, dtype=Float) for times, _ in tacs.values()]))
+        self.tac_activity = np.array([
+            np.interp(self.tac_times, np.asarray(tacs[label][0], dtype=Float), np.asarray(tacs[label][1], dtype=Float))
+            for label in self.region_labels
+        ])
+        if np.any(self.tac_activity < 0):
+            raise ValueError('Активность областей должна быть неотрицательной')
+        total = self.tac_activity.sum(axis=0)
+        self.cumulative_decays = np.concatenate(([0.], np.cumsum((total[1:] + total[:-1])/2*np.diff(self.tac_times))))
+
+        voxel_labels = self.labels.ravel()[self.distribution.ravel().nonzero()[0]]
+        self.region_voxels = []
+        self.region_cdf = []
+        for label in self.region_labels:
+            voxels = (voxel_labels == label).nonzero()[0]
+            self.region_voxels.append(voxels)
+            self.region_cdf.append(np.cumsum(self.emission_table[1][voxels]))
+        self.initial_activity = self.activity_at(self.timer)
+        self.set_state(self.timer)
+
+    def region_activity(self, time: NDArray[Float]) -> NDArray[Float]:
+        """ Активности областей в моменты time: (время, область) """
+        return np.column_stack([np.interp(time, self.tac_times, activity) for activity in self.tac_activity])
+
+    def activity_at(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]:
+        return np.interp(time, self.tac_times, self.tac_activity.sum(axis=0))
+
+    @property
+    def activity(self) -> Float:
+        return Float(self.activity_at(self.timer))
+
+    @property
+    def nuclei_number(self) -> Float:
+        """ Число распадов от текущего момента до конца кривых """
+        return Float(self.decays(self.timer, self.tac_times[-1]))
+
+    def _decays_until(self, time: NDArray[Float]) -> NDArray[Float]:
+        """ Накопленное число распадов с первого узла кривых """
+        time = np.asarray(time, dtype=Float)
+        index = np.clip(np.searchsorted(self.tac_times, time, side='right') - 1, 0, self.tac_times.size - 1)
+        start = self.tac_times[index]
+        return self.cumulative_decays[index] + (self.activity_at(start) + self.activity_at(time))/2*(time - start)
+
+    def decays(self, time_start: Time, time_stop: Time) -> Float:
+        """ Ожидаемое число распадов за интервал времени """
+        return Float(self._decays_until(time_stop) - self._decays_until(time_start))
+
+    def _decay_time(self, decays: NDArray[Float]) -> NDArray[Float]:
+        """ Моменты, к которым накапливается заданное число распадов (обращение кусочно-квадратичной функции) """
+        index = np.clip(np.searchsorted(self.cumulative_decays, decays, side='left') - 1, 0, self.tac_times.size - 1)
+        start = self.tac_times[index]
+        activity = self.activity_at(start)
+        slope = np.zeros_like(start)
+        inner = index < self.tac_times.size - 1
+        slope[inner] = (self.activity_at(self.tac_times[index[inner] + 1]) - activity[inner])/np.diff(self.tac_times)[index[inner]]
+        remaining = decays - self.cumulative_decays[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tau = 2*remaining/(activity + np.sqrt(np.maximum(activity**2 + 2*slope*remaining, 0.)))
+        return start + np.where(remaining > 0, tau, 0.)
+
+    def _time_after(self, increments: NDArray[Float]) -> NDArray[Float]:
+        return self._decay_time(self._decays + increments)
+
+    def generate_position_at(self, emission_time: NDArray[Float]) -> Vector3D:
+        """ Позиции испускания по активностям областей в моменты emission_time """
+        n = emission_time.size
+        cumulative_activity = np.cumsum(self.region_activity(emission_time), axis=1)
+        threshold = self.rng.random(n)*cumulative_activity[:, -1]
+        region = np.minimum(np.sum(cumulative_activity <= threshold[:, np.newaxis], axis=1), self.region_labels.size - 1)
+        voxel = np.empty(n, dtype=np.int64)
+        for index, (voxels, cdf) in enumerate(zip(self.region_voxels, self.region_cdf)):
+            selected = (region == index).nonzero()[0]
+            if selected.size > 0:
+                voxel[selected] = voxels[np.searchsorted(cdf, self.rng.random(selected.size)*cdf[-1], side='right').clip(0, cdf.size - 1)]
+        position = self.emission_table[0][voxel] + self.rng.uniform(0., self.voxel_size, (n, 3))
+        return self.convert_to_global_position(position)
+
+
+class CompositeSource(Source):
+    """
+    Смесь источников с общим переносом (несколько изотопов, двухэнергетические протоколы)
+
+    Каждая компонента - источник со своим распределением, спектром и периодом
+    полураспада. Пакет распадов строится по суммарному накопленному числу распадов,
+    распады пакета делятся между компонентами полиномиально по ожидаемому числу
+    распадов каждой компоненты в интервале пакета. Поле source_ID частиц
+    и взаимодействий - номер компоненты
+
+    [sources] = Source[:]
+    """
+
+    sources: List[Source]
+
+    def __init__(self, sources: Sequence[Source], rng: Optional[np.random.Generator] = None) -> None:
+        self.sources = list(sources)
+        if not 0 < len(self.sources) <= np.iinfo(SourceID).max + 1:
+            raise ValueError(f'Число компонент источника должно быть от 1 до {np.iinfo(SourceID).max + 1}')
+        self.radiation_type = self.sources[0].radiation_type
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.set_state(Float(0.))
+
+    @property
+    def rng(self) -> np.random.Generator:
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None:
+        self._rng = rng
+        for source in self.sources:
+            source.rng = rng
+
+    @property
+    def components(self) -> List[Source]:
+        return list(self.sources)
+
+    @property
+    def initial_activity(self) -> Float:
+        return Float(sum(source.initial_activity for source in self.sources))
+
+    @property
+    def activity(self) -> Float:
+        return Float(self.activity_at(self.timer))
+
+    @property
+    def nuclei_number(self) -> Float:
+        return Float(sum(source.nuclei_number for source in self.sources))
+
+    def activity_at(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]:
+        return sum(source.activity_at(time) for source in self.sources)
+
+    def decays(self, time_start: Time, time_stop: Time) -> Float:
+        return Float(sum(source.decays(time_start, time_stop) for source in self.sources))
+
+    def _decays_until(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]:
+        return sum(source._decays_until(time) for source in self.sources)
+
+    def _decay_time(self, decays: NDArray[Float]) -> NDArray[Float]:
+        """ Обращение суммарного накопленного числа распадов методом Ньютона с откатом к делению пополам """
+        decays = np.asarray(decays, dtype=Float)
+        activity = self.activity_at(self.timer)
+        lower = np.full(decays.shape, self.timer, dtype=Float)
+        upper = lower + np.maximum(np.maximum(decays - self._decays, 0.)/activity if activity > 0 else 0., units.ns)
+        for _ in range(64):
+            short = self._decays_until(upper) < decays
+            if not short.any():
+                break
+            upper = np.where(short, lower + 2*(upper - lower), upper)
+        tolerance = 1e-9*np.maximum(decays - self._decays, 1.) + 4*np.finfo(Float).eps*np.abs(decays)
+        time = upper
+        for _ in range(100):
+            excess = self._decays_until(time) - decays
+            done = np.abs(excess) <= tolerance
+            if done.all():
+                break
+            upper = np.where(excess > 0, time, upper)
+            lower = np.where(excess > 0, lower, time)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = time - excess/self.activity_at(time)
+            time = np.where(done, time, np.where((lower < newton) & (newton < upper), newton, (lower + upper)/2))
+        return time
+
+    def translate(self, x: Float = Float(0.), y: Float = Float(0.), z: Float = Float(0.), in_local: bool = False) -> None:
+        for source in self.sources:
+            source.translate(x, y, z, in_local)
+
+    def rotate(self, alpha: Float = Float(0.), beta: Float = Float(0.), gamma: Float = Float(0.), rotation_center: Sequence[Float] = (Float(0.), Float(0.), Float(0.)), in_local: bool = False) -> None:
+        for source in self.sources:
+            source.rotate(alpha, beta, gamma, rotation_center, in_local)
+
+    def set_state(self, timer: Optional[Time], rng_state: Optional[Any] = None) -> None:
+        super().set_state(timer, rng_state)
+        for source in self.sources:
+            source.set_state(self.timer)
+
+    def emit_components(self, n: int, time_start: Time, time_stop: Time) -> Tuple[NDArray[SourceID], List[Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]]]:
+        """ Номера компонент n испусканий в интервале времени и испускания компонент """
+        if n == 0:
+            return np.empty(0, dtype=SourceID), []
+        decays = np.array([source.decays(time_start, time_stop) for source in self.sources])
+        counts = self.rng.multinomial(n, decays/decays.sum())
+        emissions = [source.emit(count, time_start, time_stop) for source, count in zip(self.sources, counts) if count > 0]
+        return np.repeat(np.arange(len(self.sources), dtype=SourceID), counts), emissions
+
+    def emit(self, n: int, time_start: Time, time_stop: Time) -> Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]:
+        return _concatenate_emissions(self.emit_components(n, time_start, time_stop)[1])
+
+    def generate_emission_time(self, n: int) -> NDArray[Float]:
+        return self.generate_particles(n).emission_time
+
+    def generate_particles(self, n: int) -> ParticleArray:
+        if n == 0 or self.remaining_decays == 0:
+            return ParticleArray(0)
+        time_start = self.timer
+        count, end, closed = self._next_batch(n)
+        if end is None:
+            end = self._decays + self.rng.gamma(count)
+        time_stop = self._decay_time(np.array([end]))[0] if closed else self.time_stop
+        source_ID, emissions = self.emit_components(count - closed, time_start, time_stop)
+        if closed:
+            # Последний распад пакета - на его конце, компонента выбирается по активностям в этот момент
+            activity = np.array([source.activity_at(time_stop) for source in self.sources], dtype=Float)
+            last = self.rng.choice(len(self.sources), p=activity/activity.sum())
+            energy, direction, position, _ = self.sources[last].emit(1, time_stop, time_stop)
+            emissions.append((energy, direction, position, np.full(1, time_stop, dtype=Float)))
+            source_ID = np.append(source_ID, SourceID(last))
+        energy, direction, position, emission_time = _concatenate_emissions(emissions)
+        self._advance(count, end, time_stop)
+        for source in self.sources:
+            source.timer = self.timer
+
+        order = np.argsort(emission_time, kind='stable')
+        particles = ParticleArray.create(np.zeros_like(energy, dtype=Species), position[order], direction[order], energy[order], emission_time[order], source_ID=source_ID[order])
+        return particles
+
+
+def _concatenate_emissions(emissions: List[Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]]) -> Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]:
+    if not emissions:
+        return np.empty(0, dtype=Float), np.empty((0, 3), dtype=Float), np.empty((0, 3), dtype=Float), np.empty(0, dtype=Float)
+    energy, direction, position, emission_time = (np.concatenate(field) for field in zip(*emissions))
+    return energy, direction, position, emission_time
 
 
 class SourcePhantom(Tc99m_MIBI):
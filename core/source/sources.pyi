@@ -1,8 +1,8 @@
 import numpy as np
-from typing import List, Optional, Any, Union, Tuple, Sequence
+from typing import Dict, List, Optional, Any, Union, Tuple, Sequence
 from numpy.typing import NDArray
 from core.particles.particles import ParticleArray
-from core.other.typing_definitions import Length, Activity, Energy, Time, Vector3D, Float
+from core.other.typing_definitions import Length, Activity, Energy, SourceID, Time, Vector3D, Float
 
 class Source:
     distribution: NDArray[Float]
@@ -13,6 +13,8 @@ class Source:
     energy: np.ndarray
     half_life: Time
     timer: Time
+    time_stop: Optional[Time]
+    remaining_decays: Optional[int]
     transformation_matrix: NDArray[Float]
     rng: np.random.Generator
     emission_table: List[NDArray[Any]]
@@ -26,12 +28,25 @@ class Source:
     def activity(self) -> Float: ...
     @property
     def nuclei_number(self) -> Float: ...
+    @property
+    def components(self) -> List[Source]: ...
+    def activity_at(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]: ...
+    def decays(self, time_start: Time, time_stop: Time) -> Float: ...
+    def _decays_until(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]: ...
+    def _decay_time(self, decays: NDArray[Float]) -> NDArray[Float]: ...
     def set_state(self, timer: Optional[Time], rng_state: Optional[Any] = None) -> None: ...
+    def set_time_window(self, time_start: Time, time_stop: Time, decays: Optional[int] = None) -> None: ...
+    def _time_after(self, increments: NDArray[Float]) -> NDArray[Float]: ...
+    def _next_batch(self, n: int) -> Tuple[int, Optional[Float], bool]: ...
+    def _advance(self, count: int, decays: Float, timer: Time) -> None: ...
     def generate_energy(self, n: int) -> NDArray[Float]: ...
     def generate_position(self, n: int) -> Vector3D: ...
-    def generate_emission_time(self, n: int) -> Tuple[NDArray[Float], Float]: ...
+    def generate_position_at(self, emission_time: NDArray[Float]) -> Vector3D: ...
+    def generate_emission_time(self, n: int) -> NDArray[Float]: ...
+    def sample_emission_time(self, n: int, time_start: Time, time_stop: Time) -> NDArray[Float]: ...
     def generate_direction(self, n: int) -> Vector3D: ...
     def generate_particles(self, n: int) -> ParticleArray: ...
+    def emit(self, n: int, time_start: Time, time_stop: Time) -> Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]: ...
 
 class PointSource(Source):
     def __init__(self, activity: Float, energy: Float, size: Length = ..., half_life: Time = ..., rng: Optional[np.random.Generator] = None) -> None: ...
@@ -42,6 +57,38 @@ class Tc99m_MIBI(Source):
 class I123(Source):
     def __init__(self, distribution: Any, activity: Optional[Any] = None, voxel_size: Length = ...) -> None: ...
 
+class DynamicSource(Source):
+    labels: NDArray[np.int64]
+    region_labels: NDArray[np.int64]
+    tac_times: NDArray[Float]
+    tac_activity: NDArray[Float]
+    cumulative_decays: NDArray[Float]
+    region_voxels: List[NDArray[np.int64]]
+    region_cdf: List[NDArray[Float]]
+
+    def __init__(self, labels: Any, tacs: Dict[int, Tuple[Sequence[Time], Sequence[Activity]]], distribution: Optional[Any] = None, voxel_size: Length = ..., radiation_type: str = 'Gamma', energy: Union[Float, List[List[Float]]] = ..., rng: Optional[np.random.Generator] = None) -> None: ...
+    def region_activity(self, time: NDArray[Float]) -> NDArray[Float]: ...
+    def activity_at(self, time: Union[Time, NDArray[Float]]) -> Union[Float, NDArray[Float]]: ...
+    def _decays_until(self, time: NDArray[Float]) -> NDArray[Float]: ...
+    def decays(self, time_start: Time, time_stop: Time) -> Float: ...
+    def _decay_time(self, decays: NDArray[Float]) -> NDArray[Float]: ...
+    def _time_after(self, increments: NDArray[Float]) -> NDArray[Float]: ...
+    def generate_position_at(self, emission_time: NDArray[Float]) -> Vector3D: ...
+
+class CompositeSource(Source):
+    sources: List[Source]
+
+    def __init__(self, sources: Sequence[Source], rng: Optional[np.random.Generator] = None) -> None: ...
+    @property
+    def rng(self) -> np.random.Generator: ...
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None: ...
+    @property
+    def initial_activity(self) -> Float: ...
+    def emit_components(self, n: int, time_start: Time, time_stop: Time) -> Tuple[NDArray[SourceID], List[Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]]]: ...
+
+def _concatenate_emissions(emissions: List[Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]]) -> Tuple[NDArray[Float], Vector3D, Vector3D, NDArray[Float]]: ...
+
 class SourcePhantom(Tc99m_MIBI):
     def __init__(self, phantom_name: str, activity: Optional[Any] = None, voxel_size: Length = ...) -> None: ...
 
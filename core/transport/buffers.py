@@ -0,0 +1,108 @@
+import threading as mt
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.other.typing_definitions import Float
+
+
+@dataclass
+class HandoffMetrics:
+    """ Статистика передачи данных между потоком переноса и потребителем """
+    puts: int = 0
+    gets: int = 0
+    reallocations: int = 0
+    producer_blocked_time: Float = Float(0.)
+    consumer_blocked_time: Float = Float(0.)
+
+
+class InteractionBufferRing:
+    """
+    Кольцо заранее выделенных буферов взаимодействий
+
+    Замена queue.Queue(maxsize=1) с тем же протоколом put/get. Производитель
+    копирует данные в свободный буфер и блокируется, только если все буферы
+    заняты. Буфер, возвращённый get, действителен до следующего вызова get,
+    после чего возвращается в кольцо. Строковые сигналы ('stop') передаются
+    без буферов и не блокируют производителя
+
+    [buffer_count] - число буферов, задаёт глубину очереди
+
+    [buffer_size] - начальное число строк буфера, буфер увеличивается при необходимости
+    """
+    buffer_count: int
+    buffer_size: int
+    metrics: HandoffMetrics
+
+    def __init__(self, buffer_count: int = 2, buffer_size: int = 10**4) -> None:
+        if buffer_count < 1:
+            raise ValueError('Число буферов должно быть положительным')
+        self.buffer_count = int(buffer_count)
+        self.buffer_size = int(buffer_size)
+        self.metrics = HandoffMetrics()
+        self._buffers: List[Optional[NDArray[Any]]] = [None]*self.buffer_count
+        self._free: Deque[int] = deque(range(self.buffer_count))
+        self._filled: Deque[Union[Tuple[int, int], str]] = deque()
+        self._current: Optional[int] = None
+        self._condition = mt.Condition()
+
+    def _buffer(self, index: int, data: NDArray[Any]) -> NDArray[Any]:
+        buffer = self._buffers[index]
+        if buffer is None or buffer.dtype != data.dtype or type(buffer) is not type(data) or buffer.shape[0] < data.shape[0]:
+            if buffer is not None:
+                self.metrics.reallocations += 1
+            size = max(data.shape[0], self.buffer_size, 0 if buffer is None else buffer.shape[0])
+            buffer = np.empty((size, ) + data.shape[1:], dtype=data.dtype).view(type(data))
+            self._buffers[index] = buffer
+        return buffer
+
+    @property
+    def depth(self) -> int:
+        """ Число переданных, но ещё не полученных потребителем массивов и сигналов """
+        with self._condition:
+            return len(self._filled)
+
+    def put(self, data: Union[NDArray[Any], str]) -> None:
+        """ Передать массив потребителю (с копированием в свободный буфер) или строковый сигнал """
+        if isinstance(data, str):
+            with self._condition:
+                self._filled.append(data)
+                self._condition.notify_all()
+            return
+        start = perf_counter()
+        with self._condition:
+            while not self._free:
+                self._condition.wait()
+            index = self._free.popleft()
+        self.metrics.producer_blocked_time += perf_counter() - start
+        size = data.shape[0]
+        self._buffer(index, data)[:size] = data
+        with self._condition:
+            self._filled.append((index, size))
+            self.metrics.puts += 1
+            self._condition.notify_all()
+
+    def get(self) -> Union[NDArray[Any], str]:
+        """ Получить следующий массив или сигнал, предыдущий буфер возвращается в кольцо """
+        start = perf_counter()
+        with self._condition:
+            if self._current is not None:
+                self._free.append(self._current)
+                self._current = None
+                self._condition.notify_all()
+            while not self._filled:
+                self._condition.wait()
+            item = self._filled.popleft()
+        self.metrics.consumer_blocked_time += perf_counter() - start
+        if isinstance(item, str):
+            return item
+        index, size = item
+        self._current = index
+        self.metrics.gets += 1
+        buffer = self._buffers[index]
+        assert buffer is not None
+        return buffer[:size]
@@ -0,0 +1,30 @@
+import numpy as np
+import threading as mt
+from dataclasses import dataclass
+from typing import Any, Deque, List, Optional, Tuple, Union
+from numpy.typing import NDArray
+from core.other.typing_definitions import Float
+
+@dataclass
+class HandoffMetrics:
+    puts: int = ...
+    gets: int = ...
+    reallocations: int = ...
+    producer_blocked_time: Float = ...
+    consumer_blocked_time: Float = ...
+
+class InteractionBufferRing:
+    buffer_count: int
+    buffer_size: int
+    metrics: HandoffMetrics
+    _buffers: List[Optional[NDArray[Any]]]
+    _free: Deque[int]
+    _filled: Deque[Union[Tuple[int, int], str]]
+    _current: Optional[int]
+    _condition: mt.Condition
+    def __init__(self, buffer_count: int = ..., buffer_size: int = ...) -> None: ...
+    def _buffer(self, index: int, data: NDArray[Any]) -> NDArray[Any]: ...
+    @property
+    def depth(self) -> int: ...
+    def put(self, data: Union[NDArray[Any], str]) -> None: ...
+    def get(self) -> Union[NDArray[Any], str]: ...
@@ -0,0 +1,264 @@
+import argparse
+import importlib
+import json
+import logging
+import os
+import secrets
+import socket
+import threading as mt
+import traceback
+from collections import deque
+from multiprocessing import AuthenticationError, Process
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from numpy.typing import NDArray
+
+from core.data.projections import merge_projections, projections_from_bytes, projections_to_bytes
+from core.other.typing_definitions import Float
+from core.transport.schedulers import WorkUnit
+from core.transport.warmup import warmup
+
+_logger = logging.getLogger(__name__)
+
+Address = Tuple[str, int]
+
+# Переменная окружения с общим ключом аутентификации координатора и исполнителей
+AUTHKEY_VARIABLE = 'NMSIM_AUTHKEY'
+
+# Задачи, которые исполнитель выполняет по имени из сообщения координатора
+TASKS = (
+    'core.transport.studies:projection',
+    'core.transport.studies:analytic_projection'
+)
+
+
+def resolve_task(name: str) -> Callable[..., Dict[str, NDArray[Float]]]:
+    """ Найти задачу по имени вида "module:function", допускаются только задачи из TASKS """
+    if name not in TASKS:
+        raise ValueError(f'Задача "{name}" не входит в список разрешённых задач {TASKS}')
+    module_name, function_name = name.split(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def resolve_authkey(authkey: Optional[bytes] = None) -> bytes:
+    """ Ключ аутентификации: переданный явно или из переменной окружения AUTHKEY_VARIABLE """
+    if authkey is None:
+        authkey = os.environ.get(AUTHKEY_VARIABLE, '').encode()
+    if not authkey:
+        raise RuntimeError(f'Не задан ключ аутентификации распределённого запуска: задайте переменную окружения {AUTHKEY_VARIABLE}')
+    return authkey
+
+
+def parse_address(address: str) -> Address:
+    host, port = address.rsplit(':', 1)
+    return host, int(port)
+
+
+def load_study(path: Path) -> List[WorkUnit]:
+    """
+    Прочитать единицы работы из JSON-файла исследования
+
+    {"units": [{"key": "0.0 deg", "time_interval": [0, 3e9], "task": "core.transport.studies:projection", "kwargs": {...}}, ...]}
+
+    Аргументы задачи и время задаются числами в единицах hepunits
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        study = json.load(file)
+    unknown = sorted({unit['task'] for unit in study['units']} - set(TASKS))
+    if unknown:
+        raise ValueError(f'Задачи {unknown} не входят в список разрешённых задач {TASKS}')
+    return [
+        WorkUnit(
+            key=unit['key'],
+            time_interval=(Float(unit['time_interval'][0]), Float(unit['time_interval'][1])),
+            args=({'task': unit['task'], 'kwargs': unit['kwargs']}, ),
+            cost=Float(unit.get('cost', 1.))
+        )
+        for unit in study['units']
+    ]
+
+
+class Coordinator:
+    """
+    Координатор распределённого запуска
+
+    Раздаёт единицы работы подключившимся исполнителям и складывает возвращённые
+    проекции. Передаются только JSON-конфигурации и npz-блоки, единица
+    отключившегося исполнителя возвращается в очередь.
+
+    Без явного authkey ключ берётся из переменной окружения AUTHKEY_VARIABLE
+    """
+    units: List[WorkUnit]
+    max_retries: int
+    projections: Dict[str, NDArray[Float]]
+
+    def __init__(self, units: List[WorkUnit], address: Address = ('localhost', 0), authkey: Optional[bytes] = None, max_retries: int = 2) -> None:
+        self.units = units
+        self.max_retries = max_retries
+        self.projections = {}
+        self.failed: List[WorkUnit] = []
+        self._listener = Listener(address, authkey=resolve_authkey(authkey))
+        self._pending: Deque[int] = deque(range(len(units)))
+        self._running: Dict[int, str] = {}
+        self._condition = mt.Condition()
+
+    @property
+    def address(self) -> Address:
+        return self._listener.address
+
+    @property
+    def finished(self) -> bool:
+        return not self._pending and not self._running
+
+    def _next_unit(self, worker: str) -> Optional[int]:
+        with self._condition:
+            while not self._pending and self._running:
+                self._condition.wait()
+            if not self._pending:
+                return None
+            index = self._pending.popleft()
+            self._running[index] = worker
+            return index
+
+    def _return_unit(self, index: int) -> None:
+        with self._condition:
+            if self._running.pop(index, None) is not None:
+                self._pending.appendleft(index)
+            self._condition.notify_all()
+
+    def _complete_unit(self, index: int, projections: Optional[Dict[str, NDArray[Float]]]) -> None:
+        with self._condition:
+            self._running.pop(index, None)
+            if projections is not None:
+                merge_projections(self.projections, projections)
+            self._condition.notify_all()
+
+    def _handle(self, connection: Connection) -> None:
+        index = None
+        worker = 'unknown'
+        try:
+            while True:
+                message = json.loads(connection.recv_bytes())
+                if message['type'] == 'ready':
+                    worker = message.get('worker', worker)
+                    index = self._next_unit(worker)
+                    if index is None:
+                        connection.send_bytes(json.dumps({'type': 'stop'}).encode())
+                        return
+                    unit = self.units[index]
+                    connection.send_bytes(json.dumps({'type': 'unit', 'id': index, 'key': unit.key, 'config': unit.args[0]}).encode())
+                elif message['type'] == 'result':
+                    projections = projections_from_bytes(connection.recv_bytes())
+                    self._complete_unit(message['id'], projections)
+                    _logger.warning(f'{self.units[message["id"]]} finished by {worker}')
+                    index = None
+                elif message['type'] == 'error':
+                    unit = self.units[message['id']]
+                    unit.attempts += 1
+                    _logger.error(f'{unit} failed on {worker} (attempt {unit.attempts}):\n{message["traceback"]}')
+                    if unit.attempts <= self.max_retries:
+                        self._return_unit(message['id'])
+                    else:
+                        self.failed.append(unit)
+                        self._complete_unit(message['id'], None)
+                    index = None
+        except (EOFError, OSError):
+            if index is not None:
+                _logger.error(f'{worker} disconnected, {self.units[index]} returned to the queue')
+                self._return_unit(index)
+        finally:
+            connection.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self.finished:
+                    return
+                continue
+            mt.Thread(target=self._handle, args=(connection, ), daemon=True).start()
+
+    def serve(self) -> Dict[str, NDArray[Float]]:
+        """ Раздавать единицы работы до их завершения, возвращает суммарные проекции """
+        _logger.warning(f'Coordinator listening on {self.address}, {len(self.units)} units')
+        mt.Thread(target=self._accept, daemon=True).start()
+        with self._condition:
+            while not self.finished:
+                self._condition.wait()
+        self._listener.close()
+        if self.failed:
+            raise RuntimeError(f'Не удалось выполнить {len(self.failed)} единиц работы: {self.failed}')
+        return self.projections
+
+
+class Worker:
+    """ Исполнитель единиц работы распределённого запуска """
+    address: Address
+    name: str
+
+    def __init__(self, address: Address, authkey: Optional[bytes] = None, name: Optional[str] = None) -> None:
+        self.address = address
+        self.name = f'{socket.gethostname()}:{os.getpid()}' if name is None else name
+        self._authkey = resolve_authkey(authkey)
+
+    def run(self) -> None:
+        """ Получать и выполнять единицы работы, пока координатор их выдаёт """
+        warmup()
+        with Client(self.address, authkey=self._authkey) as connection:
+            while True:
+                connection.send_bytes(json.dumps({'type': 'ready', 'worker': self.name}).encode())
+                message = json.loads(connection.recv_bytes())
+                if message['type'] == 'stop':
+                    return
+                config = message['config']
+                _logger.warning(f'{self.name} started {message["key"]}')
+                try:
+                    projections = resolve_task(config['task'])(**config['kwargs'])
+                except Exception:
+                    connection.send_bytes(json.dumps({'type': 'error', 'id': message['id'], 'traceback': traceback.format_exc()}).encode())
+                    continue
+                connection.send_bytes(json.dumps({'type': 'result', 'id': message['id']}).encode())
+                connection.send_bytes(projections_to_bytes(projections))
+
+
+def _run_worker(address: Address, authkey: bytes) -> None:
+    Worker(address, authkey).run()
+
+
+def run_local(units: List[WorkUnit], workers: int, authkey: Optional[bytes] = None, max_retries: int = 2) -> Dict[str, NDArray[Float]]:
+    """ Выполнить единицы работы координатором и исполнителями в процессах одной машины (по умолчанию со случайным ключом) """
+    authkey = secrets.token_bytes(32) if authkey is None else authkey
+    coordinator = Coordinator(units, ('localhost', 0), authkey, max_retries)
+    processes = [Process(target=_run_worker, args=(coordinator.address, authkey), daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        return coordinator.serve()
+    finally:
+        for process in processes:
+            process.join()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Распределённый запуск моделирования')
+    parser.add_argument('role', choices=['coordinator', 'worker'])
+    parser.add_argument('study', nargs='?', type=Path, help='JSON-файл исследования (для координатора)')
+    parser.add_argument('--address', default='localhost:6000')
+    parser.add_argument('--output', type=Path, default=None, help='npz-файл для суммарных проекций')
+    args = parser.parse_args()
+
+    logging.basicConfig(format='[%(asctime)s: %(levelname)s] %(message)s')
+
+    if args.role == 'worker':
+        Worker(parse_address(args.address)).run()
+    else:
+        if args.study is None:
+            parser.error('coordinator requires a study file')
+        coordinator = Coordinator(load_study(args.study), parse_address(args.address))
+        projections = coordinator.serve()
+        output = args.study.with_suffix('.npz') if args.output is None else args.output
+        output.write_bytes(projections_to_bytes(projections))
+        _logger.warning(f'Projections saved to {output}')
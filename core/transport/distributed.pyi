@@ -0,0 +1,36 @@
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from numpy.typing import NDArray
+from core.other.typing_definitions import Float
+from core.transport.schedulers import WorkUnit
+
+Address = Tuple[str, int]
+AUTHKEY_VARIABLE: str
+TASKS: Tuple[str, ...]
+
+def resolve_task(name: str) -> Callable[..., Dict[str, NDArray[Float]]]: ...
+def resolve_authkey(authkey: Optional[bytes] = None) -> bytes: ...
+def parse_address(address: str) -> Address: ...
+def load_study(path: Path) -> List[WorkUnit]: ...
+
+class Coordinator:
+    units: List[WorkUnit]
+    max_retries: int
+    projections: Dict[str, NDArray[Float]]
+    failed: List[WorkUnit]
+    def __init__(self, units: List[WorkUnit], address: Address = ..., authkey: Optional[bytes] = ..., max_retries: int = 2) -> None: ...
+    @property
+    def address(self) -> Address: ...
+    @property
+    def finished(self) -> bool: ...
+    def _handle(self, connection: Connection) -> None: ...
+    def serve(self) -> Dict[str, NDArray[Float]]: ...
+
+class Worker:
+    address: Address
+    name: str
+    def __init__(self, address: Address, authkey: Optional[bytes] = ..., name: Optional[str] = None) -> None: ...
+    def run(self) -> None: ...
+
+def run_local(units: List[WorkUnit], workers: int, authkey: Optional[bytes] = ..., max_retries: int = 2) -> Dict[str, NDArray[Float]]: ...
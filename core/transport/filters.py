@@ -0,0 +1,110 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+from numpy.lib.recfunctions import repack_fields
+from numpy.typing import NDArray
+
+from core.data.interaction_data import InteractionArray
+from core.geometry.volumes import ElementaryVolume, TransformableVolume
+from core.other.typing_definitions import Float
+from core.particles.particles import ParticleArray
+
+
+class InteractionFilter(ABC):
+    """
+    Базовый класс фильтра взаимодействий
+
+    Фильтр возвращает маску событий, передаваемых потребителю.
+    Фильтры применяются в потоке переноса до постановки данных в очередь
+    """
+
+    @abstractmethod
+    def __call__(self, interaction_data: InteractionArray) -> NDArray[np.bool_]:
+        pass
+
+
+class VolumeFilter(InteractionFilter):
+    """ Фильтр по объёму, в котором произошло взаимодействие """
+    volumes: List[ElementaryVolume]
+
+    def __init__(self, volumes: Iterable[ElementaryVolume]) -> None:
+        self.volumes = list(volumes)
+
+    def __call__(self, interaction_data: InteractionArray) -> NDArray[np.bool_]:
+        volume_id = interaction_data['volume_id']
+        return np.isin(volume_id, np.array([volume.ID for volume in self.volumes], dtype=volume_id.dtype))
+
+
+class EnergyWindowFilter(InteractionFilter):
+    """
+    Фильтр по энергетическому окну [energy_min, energy_max)
+
+    [field] = 'emission_energy' | 'energy_deposit'
+    """
+    energy_min: Float
+    energy_max: Float
+    field: str
+
+    def __init__(self, energy_min: Float, energy_max: Float, field: str = 'emission_energy') -> None:
+        self.energy_min = energy_min
+        self.energy_max = energy_max
+        self.field = field
+
+    def __call__(self, interaction_data: InteractionArray) -> NDArray[np.bool_]:
+        energy = interaction_data[self.field]
+        return (energy >= self.energy_min) & (energy < self.energy_max)
+
+
+class ProcessFilter(InteractionFilter):
+    """ Фильтр по имени процесса взаимодействия """
+    processes: List[str]
+
+    def __init__(self, processes: Iterable[str]) -> None:
+        self.processes = list(processes)
+
+    def __call__(self, interaction_data: InteractionArray) -> NDArray[np.bool_]:
+        return np.isin(interaction_data['process_name'], [process.encode() for process in self.processes])
+
+
+class EnergyDepositFilter(InteractionFilter):
+    """ Фильтр событий с энерговыделением больше min_deposit """
+    min_deposit: Float
+
+    def __init__(self, min_deposit: Float = Float(0.)) -> None:
+        self.min_deposit = min_deposit
+
+    def __call__(self, interaction_data: InteractionArray) -> NDArray[np.bool_]:
+        return interaction_data['energy_deposit'] > self.min_deposit
+
+
+class PrimaryRejectionFilter:
+    """
+    Фильтр допустимых частиц гибридного режима
+
+    Нерассеянные фотоны, попавшие в объёмы volumes (головки гамма-камер),
+    прекращают перенос: их вклад считается аналитически, методом
+    Монте-Карло моделируется только рассеянное излучение
+    """
+    volumes: List[TransformableVolume]
+
+    def __init__(self, volumes: Iterable[TransformableVolume]) -> None:
+        self.volumes = list(volumes)
+
+    def __call__(self, particles: ParticleArray) -> NDArray[np.bool_]:
+        primary = (particles.scatter_order == 0).nonzero()[0]
+        valid = np.ones(particles.size, dtype=np.bool_)
+        if primary.size == 0:
+            return valid
+        position = particles.position[primary]
+        for volume in self.volumes:
+            matrix = volume.total_transformation_matrix
+            valid[primary[volume.geometry.check_inside(position@matrix[:3, :3].T + matrix[:3, 3])]] = False
+        return valid
+
+
+def select_fields(interaction_data: InteractionArray, fields: Optional[Sequence[str]]) -> InteractionArray:
+    """ Компактный массив только с полями fields (None - все поля) """
+    if fields is None:
+        return interaction_data
+    return repack_fields(interaction_data[list(fields)])
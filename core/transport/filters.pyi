@@ -0,0 +1,37 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence
+from numpy.typing import NDArray
+from core.data.interaction_data import InteractionArray
+from core.geometry.volumes import ElementaryVolume, TransformableVolume
+from core.other.typing_definitions import Float
+from core.particles.particles import ParticleArray
+
+class InteractionFilter(ABC):
+    @abstractmethod
+    def __call__(self, interaction_data: InteractionArray) -> NDArray[np.bool_]: ...
+
+class VolumeFilter(InteractionFilter):
+    volumes: List[ElementaryVolume]
+    def __init__(self, volumes: Iterable[ElementaryVolume]) -> None: ...
+
+class EnergyWindowFilter(InteractionFilter):
+    energy_min: Float
+    energy_max: Float
+    field: str
+    def __init__(self, energy_min: Float, energy_max: Float, field: str = ...) -> None: ...
+
+class ProcessFilter(InteractionFilter):
+    processes: List[str]
+    def __init__(self, processes: Iterable[str]) -> None: ...
+
+class EnergyDepositFilter(InteractionFilter):
+    min_deposit: Float
+    def __init__(self, min_deposit: Float = ...) -> None: ...
+
+class PrimaryRejectionFilter:
+    volumes: List[TransformableVolume]
+    def __init__(self, volumes: Iterable[TransformableVolume]) -> None: ...
+    def __call__(self, particles: ParticleArray) -> NDArray[np.bool_]: ...
+
+def select_fields(interaction_data: InteractionArray, fields: Optional[Sequence[str]]) -> InteractionArray: ...
@@ -0,0 +1,185 @@
+import logging
+import math
+import os
+import threading as mt
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Mapping, Tuple, Union
+
+from core.other.typing_definitions import Float
+
+_logger = logging.getLogger(__name__)
+
+STAGES = ('geometry', 'attenuation', 'processes', 'refill', 'send', 'save')
+
+PROGRESS_HELP = {
+    'simulated_seconds_per_wall_second': 'Simulated source time per wall-clock second',
+    'photons_per_second': 'Emitted photons per wall-clock second',
+    'events_sent': 'Interaction events handed over to the data manager',
+    'events_written': 'Interaction events written by the data manager',
+    'eta_seconds': 'Estimated wall-clock time to the end of the job',
+    'queue_depth': 'Interaction arrays waiting in the handoff queue',
+    'particles_alive': 'Particles in the transport loop',
+    'source_timer_seconds': 'Source timer'
+}
+
+
+@dataclass
+class TransportMetrics:
+    """
+    Время этапов и счётчики переноса одного менеджера моделирования
+
+    Этапы: geometry - поиск объёмов и расстояний (и материалов вудкоковских объёмов),
+    attenuation - вычисление ЛКО, processes - розыгрыш процессов, refill - проверка
+    и замена выбывших частиц, send - передача данных потребителю, save - обработка
+    и запись данных потребителем
+
+    [path_length] = units.mm
+    """
+    stage_time: Dict[str, Float] = field(default_factory=lambda: dict.fromkeys(STAGES, Float(0.)))
+    interactions: Dict[str, int] = field(default_factory=dict)
+    steps: int = 0
+    particle_steps: int = 0
+    collisions: int = 0
+    null_collisions: int = 0
+    emitted: int = 0
+    alive: int = 0
+    events_sent: int = 0
+    events_written: int = 0
+    path_length: Float = Float(0.)
+    start_time: Float = field(default_factory=perf_counter)
+
+    def record_time(self, stage: str, start: Float) -> Float:
+        """ Добавить к этапу время с момента start, возвращает текущий момент """
+        now = perf_counter()
+        self.stage_time[stage] += now - start
+        return now
+
+    def count_interactions(self, process: str, number: int) -> None:
+        self.interactions[process] = self.interactions.get(process, 0) + number
+
+    @property
+    def null_collision_ratio(self) -> Float:
+        """ Доля фиктивных столкновений вудкоковского переноса среди всех столкновений """
+        return Float(self.null_collisions/self.collisions) if self.collisions > 0 else Float(0.)
+
+    @property
+    def mean_step_length(self) -> Float:
+        return Float(self.path_length/self.particle_steps) if self.particle_steps > 0 else Float(0.)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ Сводка для структурированного лога или файла метрик """
+        wall_time = perf_counter() - self.start_time
+        stage_time = dict(self.stage_time)
+        return {
+            'wall_time': wall_time,
+            'steps': int(self.steps),
+            'particle_steps': int(self.particle_steps),
+            'alive': int(self.alive),
+            'emitted': int(self.emitted),
+            'events_sent': int(self.events_sent),
+            'events_written': int(self.events_written),
+            'interactions': {process: int(number) for process, number in self.interactions.items()},
+            'null_collision_ratio': float(self.null_collision_ratio),
+            'mean_step_length': float(self.mean_step_length),
+            'stage_time': {stage: float(time) for stage, time in stage_time.items()},
+            'stage_share': {stage: float(time/wall_time) for stage, time in stage_time.items()} if wall_time > 0 else {}
+        }
+
+
+def _format_value(value: Float) -> str:
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(samples: Mapping[str, Float], labels: Mapping[str, str], prefix: str = 'nmsim_') -> str:
+    """ Текстовый формат Prometheus для набора значений с общими метками """
+    label_text = ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    lines = []
+    for name, value in samples.items():
+        if name in PROGRESS_HELP:
+            lines.append(f'# HELP {prefix}{name} {PROGRESS_HELP[name]}')
+        lines.append(f'# TYPE {prefix}{name} gauge')
+        lines.append(f'{prefix}{name}{{{label_text}}} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(filename: Union[str, Path], text: str) -> None:
+    """ Атомарно заменить файл метрик (для textfile-коллектора или MetricsServer) """
+    filename = Path(filename)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    temporary = filename.with_name(f'.{filename.name}.{os.getpid()}')
+    temporary.write_text(text, encoding='utf-8')
+    os.replace(temporary, filename)
+
+
+class MetricsServer:
+    """
+    HTTP-сервер метрик: по запросу /metrics отдаёт содержимое всех *.prom файлов каталога
+
+    Файлы пишут задания моделирования (write_prometheus), сервер работает в фоновом потоке
+    """
+    directory: Path
+
+    def __init__(self, directory: Union[str, Path], address: Tuple[str, int] = ('localhost', 9100)) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = server.collect().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(address, Handler)
+        self._thread = mt.Thread(target=self._server.serve_forever, name='MetricsServer', daemon=True)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def collect(self) -> str:
+        """ Метрики всех заданий, сгруппированные по именам метрик """
+        metrics: Dict[str, Tuple[List[str], List[str]]] = {}
+        for filename in sorted(self.directory.glob('*.prom')):
+            try:
+                text = filename.read_text(encoding='utf-8')
+            except OSError:
+                continue
+            for line in text.splitlines():
+                if line.startswith('# '):
+                    name = line.split()[2]
+                    comments, _ = metrics.setdefault(name, ([], []))
+                    if line not in comments:
+                        comments.append(line)
+                elif line:
+                    name = line.split('{')[0].split()[0]
+                    metrics.setdefault(name, ([], []))[1].append(line)
+        return ''.join('\n'.join(comments + samples) + '\n' for comments, samples in metrics.values())
+
+    def start(self) -> None:
+        self._thread.start()
+        _logger.warning(f'Metrics served at http://{self.address[0]}:{self.address[1]}/metrics')
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Tuple, Union
+from core.other.typing_definitions import Float
+
+STAGES: Tuple[str, ...]
+PROGRESS_HELP: Dict[str, str]
+
+@dataclass
+class TransportMetrics:
+    stage_time: Dict[str, Float] = ...
+    interactions: Dict[str, int] = ...
+    steps: int = ...
+    particle_steps: int = ...
+    collisions: int = ...
+    null_collisions: int = ...
+    emitted: int = ...
+    alive: int = ...
+    events_sent: int = ...
+    events_written: int = ...
+    path_length: Float = ...
+    start_time: Float = ...
+
+    def record_time(self, stage: str, start: Float) -> Float: ...
+    def count_interactions(self, process: str, number: int) -> None: ...
+    @property
+    def null_collision_ratio(self) -> Float: ...
+    @property
+    def mean_step_length(self) -> Float: ...
+    def snapshot(self) -> Dict[str, Any]: ...
+
+def _format_value(value: Float) -> str: ...
+def _escape_label(value: Any) -> str: ...
+def prometheus_text(samples: Mapping[str, Float], labels: Mapping[str, str], prefix: str = 'nmsim_') -> str: ...
+def write_prometheus(filename: Union[str, Path], text: str) -> None: ...
+
+class MetricsServer:
+    directory: Path
+    def __init__(self, directory: Union[str, Path], address: Tuple[str, int] = ...) -> None: ...
+    @property
+    def address(self) -> Tuple[str, int]: ...
+    def collect(self) -> str: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
@@ -0,0 +1,190 @@
+import logging
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import hepunits as units
+from numba import njit, prange
+from numpy.typing import NDArray
+
+from core.geometry.gamma_cameras import GammaCamera
+from core.geometry.voxel_volumes import WoodcockVoxelVolume
+from core.materials.materials import Material
+from core.other.typing_definitions import Energy, Float, Length, Time
+from core.physics.processes import Process
+from core.transport.schedulers import expected_decays
+
+_logger = logging.getLogger(__name__)
+
+FWHM_TO_SIGMA = 1/(2*np.sqrt(2*np.log(2)))
+
+erf = np.vectorize(math.erf, otypes=[Float])
+
+
+@njit(parallel=True, cache=True)
+def attenuation_integrals(position: NDArray[Float], direction: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], LAC: NDArray[Float]) -> NDArray[Float]:
+    """ Интегралы ЛКО от точек вдоль направления до выхода из воксельной сетки (локальные координаты сетки) """
+    nx, ny, nz = LAC.shape
+    step = min(voxel_size[0], min(voxel_size[1], voxel_size[2]))/2
+    result = np.zeros(position.shape[0], dtype=Float)
+    for i in prange(position.shape[0]):
+        distance = step/2
+        total = 0.
+        while True:
+            x = position[i, 0] + direction[0]*distance + size[0]/2
+            y = position[i, 1] + direction[1]*distance + size[1]/2
+            z = position[i, 2] + direction[2]*distance + size[2]/2
+            if x < 0 or y < 0 or z < 0 or x >= size[0] or y >= size[1] or z >= size[2]:
+                break
+            ix = min(int(x/voxel_size[0]), nx - 1)
+            iy = min(int(y/voxel_size[1]), ny - 1)
+            iz = min(int(z/voxel_size[2]), nz - 1)
+            total += LAC[ix, iy, iz]*step
+            distance += step
+        result[i] = total
+    return result
+
+
+@njit(cache=True)
+def deposit_gaussians(image: NDArray[Float], position: NDArray[Float], sigma: NDArray[Float], weight: NDArray[Float], size: NDArray[Float], pixel_size: Float) -> None:
+    """ Добавить в изображение (y, x) гауссианы с центрами position и шириной sigma, проинтегрированные по пикселям """
+    ny, nx = image.shape
+    wx = np.empty(nx, dtype=Float)
+    wy = np.empty(ny, dtype=Float)
+    for i in range(position.shape[0]):
+        reach = 4*sigma[i]
+        scale = 1/(math.sqrt(2.)*sigma[i])
+        ix0 = max(int(math.floor((position[i, 0] - reach + size[0]/2)/pixel_size)), 0)
+        ix1 = min(int(math.floor((position[i, 0] + reach + size[0]/2)/pixel_size)), nx - 1)
+        iy0 = max(int(math.floor((position[i, 1] - reach + size[1]/2)/pixel_size)), 0)
+        iy1 = min(int(math.floor((position[i, 1] + reach + size[1]/2)/pixel_size)), ny - 1)
+        if ix0 > ix1 or iy0 > iy1:
+            continue
+        for ix in range(ix0, ix1 + 1):
+            lower = ix*pixel_size - size[0]/2 - position[i, 0]
+            wx[ix] = 0.5*(math.erf((lower + pixel_size)*scale) - math.erf(lower*scale))
+        for iy in range(iy0, iy1 + 1):
+            lower = iy*pixel_size - size[1]/2 - position[i, 1]
+            wy[iy] = 0.5*(math.erf((lower + pixel_size)*scale) - math.erf(lower*scale))
+        for iy in range(iy0, iy1 + 1):
+            for ix in range(ix0, ix1 + 1):
+                image[iy, ix] += weight[i]*wx[ix]*wy[iy]
+
+
+class AnalyticProjector:
+    """
+    Аналитический проектор первичного (нерассеянного) излучения
+
+    Для каждого вокселя источника считается ослабление вдоль оси каналов
+    коллиматора через воксельную карту ЛКО фантома, геометрическая
+    эффективность параллельного коллиматора и поглощение в кристалле.
+    Вклад распределяется по пикселям гауссианой с шириной, растущей
+    с расстоянием до коллиматора (геометрическое разрешение каналов
+    и собственное разрешение детектора). Ослабление вне фантома не учитывается
+
+    Результат в формате ProjectionAccumulator: {имя детектора: (окно, y, x)}
+
+    [pixel_size, intrinsic_resolution] = units.mm
+
+    [energy_resolution] - относительное FWHM при reference_energy (0 - без размытия по энергии)
+
+    [energy_windows = ((E_min, E_max), ...)] = units.keV
+    """
+    phantom: WoodcockVoxelVolume
+    source: Any
+    processes: List[Process]
+    pixel_size: Length
+    energy_windows: NDArray[Float]
+    intrinsic_resolution: Length
+    energy_resolution: Float
+    reference_energy: Energy
+
+    def __init__(self, phantom: WoodcockVoxelVolume, source: Any, processes: Sequence[Process], pixel_size: Length = Float(4*units.mm), energy_windows: Sequence[Tuple[Energy, Energy]] = ((Float(126*units.keV), Float(154*units.keV)), ), intrinsic_resolution: Length = Float(0.), energy_resolution: Float = Float(0.), reference_energy: Energy = Float(140.5*units.keV)) -> None:
+        if phantom.label_distribution is None:
+            raise TypeError('Аналитическому проектору нужна карта меток воксельного объёма')
+        self.phantom = phantom
+        self.source = source
+        self.processes = list(processes)
+        self.pixel_size = pixel_size
+        self.energy_windows = np.asarray(energy_windows, dtype=Float).reshape(-1, 2)
+        self.intrinsic_resolution = intrinsic_resolution
+        self.energy_resolution = energy_resolution
+        self.reference_energy = reference_energy
+
+    def total_LAC(self, material: Material, energy: Energy) -> Float:
+        """ Полный линейный коэффициент ослабления материала """
+        total = Float(0.)
+        for process in self.processes:
+            if material in process.attenuation_function:
+                total += process.attenuation_function(material, energy)
+        return total
+
+    def window_fractions(self, energy: Energy) -> NDArray[Float]:
+        """ Доли фотопика энергии energy в энергетических окнах """
+        if self.energy_resolution <= 0:
+            return ((energy >= self.energy_windows[:, 0]) & (energy < self.energy_windows[:, 1])).astype(Float)
+        scale = 1/(np.sqrt(2)*self.energy_resolution*np.sqrt(energy*self.reference_energy)*FWHM_TO_SIGMA)
+        return 0.5*(erf((self.energy_windows[:, 1] - energy)*scale) - erf((self.energy_windows[:, 0] - energy)*scale))
+
+    def _emission_points(self, source: Any) -> Tuple[NDArray[Float], NDArray[Float]]:
+        """ Центры вокселей источника в глобальных координатах и их вероятности """
+        position, probability = source.emission_table
+        position = source.convert_to_global_position(position + source.voxel_size/2)
+        return position, probability/np.sum(probability)
+
+    def _collimator_constants(self, gamma_camera: GammaCamera, energy: Energy) -> Tuple[Float, Float, Float, Float]:
+        """ Диаметр канала, длина и эффективная длина канала, геометрическая эффективность коллиматора """
+        collimator = gamma_camera.collimator
+        hole_diameter = collimator.hole_diameter
+        length = collimator.size[2]
+        effective_length = max(length - 2/self.total_LAC(collimator.material, energy), length/2)
+        efficiency = (collimator.shape_factor*hole_diameter**2/(effective_length*(hole_diameter + collimator.septa)))**2
+        return hole_diameter, length, effective_length, efficiency
+
+    def project(self, gamma_camera: GammaCamera, time_interval: Tuple[Time, Time]) -> NDArray[Float]:
+        """ Ожидаемая проекция первичного излучения за интервал времени: (окно, y, x) """
+        detector = gamma_camera.detector
+        size = np.asarray(detector.size[:2], dtype=Float)
+        nx, ny = np.round(size/self.pixel_size).astype(int)
+        projection = np.zeros((self.energy_windows.shape[0], ny, nx), dtype=Float)
+
+        detector_matrix = detector.total_transformation_matrix
+        # Фотоны, попадающие в каналы, летят вдоль -z детектора
+        direction = -detector_matrix[2, :3]
+        phantom_matrix = self.phantom.total_transformation_matrix
+        phantom_direction = np.ascontiguousarray(phantom_matrix[:3, :3]@direction, dtype=Float)
+
+        # Компоненты составного источника проецируются независимо и складываются
+        for source in self.source.components:
+            position, probability = self._emission_points(source)
+            decays = expected_decays(source.initial_activity, time_interval, source.half_life)
+            local_position = position@detector_matrix[:3, :3].T + detector_matrix[:3, 3]
+            phantom_position = np.ascontiguousarray(position@phantom_matrix[:3, :3].T + phantom_matrix[:3, 3], dtype=Float)
+
+            for energy, line_probability in zip(source.energy['energy'], source.energy['probability']):
+                fractions = self.window_fractions(energy)
+                if not fractions.any():
+                    continue
+                material_LAC = np.array([self.total_LAC(material, energy) for material in self.phantom.material_list], dtype=Float)
+                LAC = material_LAC[self.phantom.material_lut][self.phantom.label_distribution]
+                attenuation = attenuation_integrals(
+                    phantom_position,
+                    phantom_direction,
+                    np.asarray(self.phantom.size, dtype=Float),
+                    np.asarray(self.phantom.voxel_size, dtype=Float),
+                    np.ascontiguousarray(LAC)
+                )
+                hole_diameter, length, effective_length, efficiency = self._collimator_constants(gamma_camera, energy)
+                absorption = 1 - np.exp(-self.total_LAC(detector.material, energy)*detector.size[2])
+                # Расстояние до середины кристалла: L_eff + z + c = L_eff + (z_local - L)
+                collimator_resolution = hole_diameter*np.maximum(effective_length + local_position[:, 2] - length, effective_length)/effective_length
+                sigma = np.sqrt(collimator_resolution**2 + self.intrinsic_resolution**2)*FWHM_TO_SIGMA
+                weight = decays*line_probability*probability*efficiency*absorption*np.exp(-attenuation)
+                image = np.zeros((ny, nx), dtype=Float)
+                deposit_gaussians(image, np.ascontiguousarray(local_position[:, :2]), sigma, weight, size, Float(self.pixel_size))
+                projection += fractions[:, np.newaxis, np.newaxis]*image
+        return projection
+
+    def __call__(self, gamma_cameras: Sequence[GammaCamera], time_interval: Tuple[Time, Time]) -> Dict[str, NDArray[Float]]:
+        """ Проекции всех головок в формате ProjectionAccumulator """
+        return {gamma_camera.detector.name: self.project(gamma_camera, time_interval) for gamma_camera in gamma_cameras}
@@ -0,0 +1,30 @@
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+from numpy.typing import NDArray
+from core.geometry.gamma_cameras import GammaCamera
+from core.geometry.voxel_volumes import WoodcockVoxelVolume
+from core.materials.materials import Material
+from core.other.typing_definitions import Energy, Float, Length, Time
+from core.physics.processes import Process
+
+FWHM_TO_SIGMA: float
+
+def attenuation_integrals(position: NDArray[Float], direction: NDArray[Float], size: NDArray[Float], voxel_size: NDArray[Float], LAC: NDArray[Float]) -> NDArray[Float]: ...
+def deposit_gaussians(image: NDArray[Float], position: NDArray[Float], sigma: NDArray[Float], weight: NDArray[Float], size: NDArray[Float], pixel_size: Float) -> None: ...
+
+class AnalyticProjector:
+    phantom: WoodcockVoxelVolume
+    source: Any
+    processes: List[Process]
+    pixel_size: Length
+    energy_windows: NDArray[Float]
+    intrinsic_resolution: Length
+    energy_resolution: Float
+    reference_energy: Energy
+    def __init__(self, phantom: WoodcockVoxelVolume, source: Any, processes: Sequence[Process], pixel_size: Length = ..., energy_windows: Sequence[Tuple[Energy, Energy]] = ..., intrinsic_resolution: Length = ..., energy_resolution: Float = ..., reference_energy: Energy = ...) -> None: ...
+    def window_fractions(self, energy: Energy) -> NDArray[Float]: ...
+    def total_LAC(self, material: Material, energy: Energy) -> Float: ...
+    def _emission_points(self, source: Any) -> Tuple[NDArray[Float], NDArray[Float]]: ...
+    def _collimator_constants(self, gamma_camera: GammaCamera, energy: Energy) -> Tuple[Float, Float, Float, Float]: ...
+    def project(self, gamma_camera: GammaCamera, time_interval: Tuple[Time, Time]) -> NDArray[Float]: ...
+    def __call__(self, gamma_cameras: Sequence[GammaCamera], time_interval: Tuple[Time, Time]) -> Dict[str, NDArray[Float]]: ...
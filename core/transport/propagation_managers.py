@@ -1,3 +1,4 @@
+from time import perf_counter
 from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
@@ -11,29 +12,39 @@ from core.geometry.woodcoock_volumes import WoodcockVolume
 from core.other.typing_definitions import Float
 from core.particles.particles import ParticleArray
 from core.physics.processes import Process
+from core.transport.metrics import TransportMetrics
 
 
 class PropagationWithInteraction:
     """ Класс распространения частиц с взаимодействием """
     processes: List[Process]
     rng: np.random.Generator
+    metrics: TransportMetrics
 
     def __init__(self, processes_list: Optional[List[type]] = None, attenuation_database: Optional[Any] = None, rng: Optional[np.random.Generator] = None) -> None:
         processes_list = processes_settings.processes_list if processes_list is None else processes_list
         self.attenuation_database = database_setting.attenuation_database if attenuation_database is None else attenuation_database
         self.rng = np.random.default_rng() if rng is None else rng
         self.processes = [process(self.attenuation_database, rng) for process in processes_list]
+        self.metrics = TransportMetrics()
 
     def __call__(self, particles: ParticleArray, volume: ElementaryVolume) -> Optional[InteractionArray]:
         """ Сделать шаг """
+        metrics = self.metrics
+        start = perf_counter()
         distance, current_volume  = volume.cast_path(particles.position, particles.direction)
         materials = current_volume.material
+        start = metrics.record_time('geometry', start)
         processes_LAC = self.get_processes_LAC(particles, materials)
         total_LAC = processes_LAC.sum(axis=0)
+        start = metrics.record_time('attenuation', start)
         free_path = self.rng.exponential(1/total_LAC)
         interacted = (free_path < distance).nonzero()[0]
         distance[interacted] = free_path[interacted]
         particles.move(distance)
+        metrics.particle_steps += particles.size
+        metrics.path_length += distance.sum()
+        metrics.collisions += interacted.size
         if interacted.size > 0:
             current_volume = current_volume[interacted]
             materials = materials[interacted]
@@ -42,14 +53,30 @@ class PropagationWithInteraction:
             total_LAC = total_LAC[interacted]
             woodcock_volume = current_volume.type_matching(WoodcockVolume)
             if woodcock_volume.any():
+                start = perf_counter()
                 materials[woodcock_volume] = volume.get_material_by_position(interacted_particles.position[woodcock_volume])
+                start = metrics.record_time('geometry', start)
                 processes_LAC[:, woodcock_volume] = self.get_processes_LAC(interacted_particles[woodcock_volume], materials[woodcock_volume])
+                metrics.record_time('attenuation', start)
+            start = perf_counter()
+            volume_id = current_volume.ID
+            material_id = materials.ID
+            material_density = materials.density
             interaction_data = []
+            null_collisions = interacted.size
             for process, indices in self.choose_process(processes_LAC, total_LAC):
+                metrics.count_interactions(process.name, indices.size)
+                null_collisions -= indices.size
                 processing_particles = interacted_particles[indices]
-                interaction_data.append(process(processing_particles, materials[indices]))
+                process_data = process(processing_particles, materials[indices])
+                process_data.volume_id = volume_id[indices]
+                process_data.material_id = material_id[indices]
+                process_data.material_density = material_density[indices]
+                interaction_data.append(process_data)
                 interacted_particles[indices] = processing_particles
             particles[interacted] = interacted_particles
+            metrics.null_collisions += null_collisions
+            metrics.record_time('processes', start)
             return np.concatenate(interaction_data).view(InteractionArray)
 
     def get_processes_LAC(self, particles: ParticleArray, materials: Union[Any, Any]) -> NDArray[Float]:
@@ -6,10 +6,12 @@ from core.physics.processes import Process
 from core.materials.materials import Material, MaterialArray
 from core.other.typing_definitions import Float
 from core.data.interaction_data import InteractionArray
+from core.transport.metrics import TransportMetrics
 
 class PropagationWithInteraction:
     processes: List[Process]
     rng: np.random.Generator
+    metrics: TransportMetrics
     attenuation_database: Any
     def __init__(self, processes_list: Optional[List[type]] = None, attenuation_database: Optional[Any] = None, rng: Optional[np.random.Generator] = None) -> None: ...
     def __call__(self, particles: ParticleArray, volume: ElementaryVolume) -> Optional[InteractionArray]: ...
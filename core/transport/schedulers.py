@@ -0,0 +1,292 @@
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import hepunits as units
+from numpy.typing import NDArray
+
+from core.data.data_manager import read_source_timer
+from core.other.log_pipeline import PROGRESS
+from core.other.typing_definitions import Activity, Float, Time
+
+_logger = logging.getLogger(__name__)
+
+
+def split_time_interval(time_start: Time, time_stop: Time, steps: int, half_life: Time = Float(np.inf)) -> NDArray[Float]:
+    """ Разбить интервал времени на отрезки с равным ожидаемым числом распадов """
+    fractions = np.linspace(0., 1., steps + 1)
+    if np.isinf(half_life):
+        time_points = time_start + fractions*(time_stop - time_start)
+    else:
+        remaining = np.exp2(-(time_stop - time_start)/half_life)
+        time_points = time_start - half_life*np.log2(1. - fractions*(1. - remaining))
+    time_points[0] = time_start
+    time_points[-1] = time_stop
+    return np.column_stack([time_points[:-1], time_points[1:]])
+
+
+def expected_decays(activity: Activity, time_interval: Tuple[Time, Time], half_life: Time = Float(np.inf)) -> Float:
+    """ Ожидаемое число распадов за интервал времени при активности activity в момент 0 """
+    time_start, time_stop = time_interval
+    if np.isinf(half_life):
+        return Float(activity*(time_stop - time_start))
+    decay_constant = np.log(2)/half_life
+    return Float(activity/decay_constant*(np.exp(-decay_constant*time_start) - np.exp(-decay_constant*time_stop)))
+
+
+@dataclass
+class WorkUnit:
+    """ Единица работы: один временной отрезок одной проекции """
+    key: str
+    time_interval: Tuple[Time, Time]
+    args: Tuple[Any, ...]
+    filename: Optional[Path] = None
+    cost: Float = Float(1.)
+    attempts: int = 0
+
+    def __repr__(self) -> str:
+        return f'{self.key} [{self.time_interval[0]/units.s:g} s, {self.time_interval[1]/units.s:g} s]'
+
+
+@dataclass
+class StudyDescription:
+    """
+    Описание исследования для планировщика
+
+    [angles] = units.rad
+
+    [time_start, time_stop, half_life] = units.s
+
+    [activity] = Bq
+
+    rotations - динамическая регистрация: головки делают rotations оборотов
+    за время регистрации, проекция angle получает отрезки стояния на своём угле
+    в каждом обороте (steps при этом не используется)
+    """
+    name: str
+    angles: Sequence[Float]
+    time_start: Time
+    time_stop: Time
+    activity: Activity
+    half_life: Time = Float(np.inf)
+    steps: Optional[int] = None
+    decays_per_unit: Float = Float(10**8)
+    sharded: bool = False
+    rotations: Optional[int] = None
+
+    def unit_key(self, angle: Float) -> str:
+        return f'{round(angle/units.degree, 1)} deg'
+
+    def unit_filename(self, angle: Float, index: Optional[int] = None) -> Path:
+        """ Файл проекции или, если исследование разбито на фрагменты, файл фрагмента index """
+        if index is None or not self.sharded:
+            return Path(f'output data/{self.name}/{self.unit_key(angle)}.hdf')
+        return Path(f'output data/{self.name}/{self.unit_key(angle)}/slice {index:04d}.hdf')
+
+    def shard_filenames(self, angle: Float) -> List[Path]:
+        """ Файлы фрагментов проекции в порядке временных отрезков """
+        return [self.unit_filename(angle, index) for index in range(len(self.time_intervals(angle)))]
+
+    def time_intervals(self, angle: Optional[Float] = None) -> NDArray[Float]:
+        """ Временные отрезки проекции angle (без rotations одинаковые для всех проекций) """
+        if self.rotations is not None and angle is not None:
+            views = len(self.angles)
+            dwell = (self.time_stop - self.time_start)/(self.rotations*views)
+            view = int(np.argmin(np.abs(np.asarray(self.angles) - angle)))
+            starts = self.time_start + (np.arange(self.rotations)*views + view)*dwell
+            return np.column_stack([starts, starts + dwell])
+        steps = self.steps
+        if steps is None:
+            total_decays = expected_decays(self.activity, (self.time_start, self.time_stop), self.half_life)
+            steps = max(int(np.ceil(total_decays/self.decays_per_unit)), 1)
+        return split_time_interval(self.time_start, self.time_stop, steps, self.half_life)
+
+    def work_units(self, make_args: Callable[[Float, Tuple[Time, Time], Path], Tuple[Any, ...]]) -> List[WorkUnit]:
+        """
+        Разбить исследование на единицы работы, make_args формирует аргументы задачи
+        по углу, временному отрезку и файлу единицы
+
+        Фрагменты разбитого исследования пишут в отдельные файлы и получают
+        отдельные ключи, поэтому выполняются параллельно
+        """
+        units_list = []
+        for angle in self.angles:
+            for index, (time_start, time_stop) in enumerate(self.time_intervals(angle)):
+                time_interval = (Float(time_start), Float(time_stop))
+                filename = self.unit_filename(angle, index)
+                units_list.append(WorkUnit(
+                    key=f'{self.unit_key(angle)} slice {index}' if self.sharded else self.unit_key(angle),
+                    time_interval=time_interval,
+                    args=make_args(angle, time_interval, filename),
+                    filename=filename,
+                    cost=expected_decays(self.activity, time_interval, self.half_life)
+                ))
+        return units_list
+
+
+@dataclass
+class _SchedulerStatistics:
+    start_timepoint: datetime = field(default_factory=datetime.now)
+    total_cost: Float = Float(0.)
+    completed_cost: Float = Float(0.)
+    simulated_time: Time = Float(0.)
+    completed_units: int = 0
+    failed_units: int = 0
+    retried_units: int = 0
+
+
+class JobScheduler:
+    """
+    Динамический планировщик единиц работы
+
+    Единицы с одинаковым ключом (одна проекция пишет в один файл) выполняются
+    последовательно в порядке времени, свободный процесс забирает следующую
+    единицу той проекции, у которой осталось больше всего работы.
+    """
+    task: Callable[..., Any]
+    pool_size: int
+    max_retries: int
+    resume: bool
+    initializer: Optional[Callable[..., Any]]
+    initargs: Tuple[Any, ...]
+
+    def __init__(self, task: Callable[..., Any], pool_size: int, max_retries: int = 2, resume: bool = True,
+                 initializer: Optional[Callable[..., Any]] = None, initargs: Tuple[Any, ...] = ()) -> None:
+        self.task = task
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.resume = resume
+        self.initializer = initializer
+        self.initargs = initargs
+        self.failed: List[WorkUnit] = []
+        self._statistics = _SchedulerStatistics()
+
+    def _skip_completed(self, units_list: List[WorkUnit]) -> List[WorkUnit]:
+        progress: Dict[Path, Optional[Time]] = {}
+        remaining = []
+        for unit in units_list:
+            if unit.filename is not None:
+                if unit.filename not in progress:
+                    progress[unit.filename] = read_source_timer(unit.filename)
+                last_time = progress[unit.filename]
+                if last_time is not None and unit.time_interval[1] <= last_time*(1 + 1e-12):
+                    _logger.info(f'{unit} already completed, skipped')
+                    continue
+            remaining.append(unit)
+        return remaining
+
+    def _group_units(self, units_list: List[WorkUnit]) -> Dict[str, Deque[WorkUnit]]:
+        pending: Dict[str, Deque[WorkUnit]] = {}
+        for unit in sorted(units_list, key=lambda unit: unit.time_interval[0]):
+            pending.setdefault(unit.key, deque()).append(unit)
+        return pending
+
+    def _report(self, unit: WorkUnit, wall_time: Float) -> None:
+        statistics = self._statistics
+        elapsed = (datetime.now() - statistics.start_timepoint).total_seconds()
+        rate = statistics.completed_cost/elapsed if elapsed > 0 else 0.
+        remaining_cost = statistics.total_cost - statistics.completed_cost
+        eta = remaining_cost/rate if rate > 0 else np.inf
+        unit_simulated_time = (unit.time_interval[1] - unit.time_interval[0])/units.s
+        _logger.info(
+            f'{unit} finished in {wall_time:.1f} s '
+            f'({unit_simulated_time/wall_time if wall_time > 0 else np.inf:.3g} simulated s per wall s); '
+            f'{statistics.completed_units} units done, '
+            f'throughput {rate:.3g} decays/s, '
+            f'{statistics.simulated_time/units.s/elapsed if elapsed > 0 else 0.:.3g} simulated s per wall s, '
+            f'ETA {eta:.0f} s',
+            extra=PROGRESS
+        )
+
+    def _executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(self.pool_size, initializer=self.initializer, initargs=self.initargs)
+
+    def _finish(self, unit: WorkUnit, result: Any, error: Optional[BaseException], wall_time: Float,
+                pending: Dict[str, Deque[WorkUnit]], remaining_cost: Dict[str, Float], results: List[Tuple[WorkUnit, Any]]) -> None:
+        """ Учесть завершение единицы работы: результат, повторная попытка или отказ от проекции """
+        if error is None:
+            self._statistics.completed_units += 1
+            self._statistics.completed_cost += unit.cost
+            self._statistics.simulated_time += unit.time_interval[1] - unit.time_interval[0]
+            remaining_cost[unit.key] -= unit.cost
+            results.append((unit, result))
+            self._report(unit, wall_time)
+            return
+        unit.attempts += 1
+        _logger.error(f'{unit} failed (attempt {unit.attempts}): {error!r}', exc_info=error)
+        if unit.attempts <= self.max_retries:
+            self._statistics.retried_units += 1
+            pending.setdefault(unit.key, deque()).appendleft(unit)
+            return
+        dropped = [unit, *pending.pop(unit.key, [])]
+        self._statistics.failed_units += len(dropped)
+        self.failed.extend(dropped)
+        remaining_cost[unit.key] = Float(0.)
+        _logger.error(f'{unit.key} abandoned after {unit.attempts} attempts, {len(dropped)} units not simulated')
+
+    def run(self, units_list: List[WorkUnit]) -> List[Tuple[WorkUnit, Any]]:
+        """
+        Выполнить единицы работы, возвращает результаты завершённых единиц
+
+        Если процесс пула завершился аварийно (OOM, сбой в ядре numba), пул
+        пересоздаётся, а выполнявшиеся в нём единицы считаются неудачной попыткой
+        """
+        if self.resume:
+            units_list = self._skip_completed(units_list)
+        pending = self._group_units(units_list)
+        remaining_cost = {key: Float(sum(unit.cost for unit in key_units)) for key, key_units in pending.items()}
+        self._statistics = _SchedulerStatistics(total_cost=Float(sum(remaining_cost.values())))
+        self.failed = []
+        running: Dict[str, datetime] = {}
+        futures: Dict[Future, WorkUnit] = {}
+        results: List[Tuple[WorkUnit, Any]] = []
+
+        executor = self._executor()
+        try:
+            while pending or running:
+                free_keys = sorted(
+                    (key for key in pending if key not in running),
+                    key=lambda key: remaining_cost[key],
+                    reverse=True
+                )
+                broken = False
+                for key in free_keys[:self.pool_size - len(running)]:
+                    unit = pending[key].popleft()
+                    if not pending[key]:
+                        del pending[key]
+                    try:
+                        futures[executor.submit(self.task, *unit.args)] = unit
+                    except BrokenProcessPool:
+                        pending.setdefault(key, deque()).appendleft(unit)
+                        broken = True
+                        break
+                    running[key] = datetime.now()
+                if broken:
+                    done = set()
+                else:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    broken = any(isinstance(future.exception(), BrokenProcessPool) for future in done)
+                if broken:
+                    # Задачи сломанного пула не завершатся: все выполнявшиеся единицы - неудачная попытка
+                    _logger.error(f'Worker process terminated abruptly, restarting the pool ({len(futures)} units interrupted)')
+                    done = set(futures)
+                for future in done:
+                    unit = futures.pop(future)
+                    wall_time = (datetime.now() - running.pop(unit.key)).total_seconds()
+                    error = future.exception() if future.done() else BrokenProcessPool('Worker pool terminated')
+                    self._finish(unit, None if error is not None else future.result(), error, wall_time, pending, remaining_cost, results)
+                if broken:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = self._executor()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        if self.failed:
+            raise RuntimeError(f'Не удалось выполнить {len(self.failed)} единиц работы: {self.failed}')
+        return results
@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from numpy.typing import NDArray
+from core.other.typing_definitions import Activity, Float, Time
+
+def split_time_interval(time_start: Time, time_stop: Time, steps: int, half_life: Time = ...) -> NDArray[Float]: ...
+def expected_decays(activity: Activity, time_interval: Tuple[Time, Time], half_life: Time = ...) -> Float: ...
+
+@dataclass
+class WorkUnit:
+    key: str
+    time_interval: Tuple[Time, Time]
+    args: Tuple[Any, ...]
+    filename: Optional[Path] = ...
+    cost: Float = ...
+    attempts: int = ...
+
+@dataclass
+class StudyDescription:
+    name: str
+    angles: Sequence[Float]
+    time_start: Time
+    time_stop: Time
+    activity: Activity
+    half_life: Time = ...
+    steps: Optional[int] = ...
+    decays_per_unit: Float = ...
+    sharded: bool = ...
+    rotations: Optional[int] = ...
+    def unit_key(self, angle: Float) -> str: ...
+    def unit_filename(self, angle: Float, index: Optional[int] = None) -> Path: ...
+    def shard_filenames(self, angle: Float) -> List[Path]: ...
+    def time_intervals(self, angle: Optional[Float] = None) -> NDArray[Float]: ...
+    def work_units(self, make_args: Callable[[Float, Tuple[Time, Time], Path], Tuple[Any, ...]]) -> List[WorkUnit]: ...
+
+class JobScheduler:
+    task: Callable[..., Any]
+    pool_size: int
+    max_retries: int
+    resume: bool
+    initializer: Optional[Callable[..., Any]]
+    initargs: Tuple[Any, ...]
+    failed: List[WorkUnit]
+    def __init__(self, task: Callable[..., Any], pool_size: int, max_retries: int = 2, resume: bool = True,
+                 initializer: Optional[Callable[..., Any]] = None, initargs: Tuple[Any, ...] = ()) -> None: ...
+    def _skip_completed(self, units_list: List[WorkUnit]) -> List[WorkUnit]: ...
+    def _group_units(self, units_list: List[WorkUnit]) -> Dict[str, Deque[WorkUnit]]: ...
+    def _report(self, unit: WorkUnit, wall_time: Float) -> None: ...
+    def _executor(self) -> ProcessPoolExecutor: ...
+    def _finish(self, unit: WorkUnit, result: Any, error: Optional[BaseException], wall_time: Float,
+                pending: Dict[str, Deque[WorkUnit]], remaining_cost: Dict[str, Float], results: List[Tuple[WorkUnit, Any]]) -> None: ...
+    def run(self, units_list: List[WorkUnit]) -> List[Tuple[WorkUnit, Any]]: ...
@@ -1,23 +1,29 @@
+import json
 import logging
 import queue
 import threading as mt
 from cProfile import runctx
 from datetime import datetime
+from pathlib import Path
 from signal import SIGINT, signal
-from typing import Any, Callable, List, Optional, Tuple, Union
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import hepunits as units
 from numpy.typing import NDArray
 
+from core.data.interaction_data import InteractionArray
 from core.geometry.volumes import ElementaryVolume
 from core.other.typing_definitions import Float
 from core.other.utils import datetime_from_seconds
 from core.particles.particles import ParticleArray
+from core.transport.buffers import InteractionBufferRing
+from core.transport.filters import select_fields
+from core.transport.metrics import TransportMetrics, prometheus_text, write_prometheus
 from core.transport.propagation_managers import PropagationWithInteraction
 
 _logger = logging.getLogger(__name__)
-_logger.setLevel(logging.DEBUG)
 
 Queue = queue.Queue
 Thread = mt.Thread
@@ -31,11 +37,18 @@ class SimulationManager(Thread):
     stop_time: Float
     particles_number: int
     valid_filters: List[Callable[[ParticleArray], NDArray[np.bool_]]]
+    interaction_filters: List[Callable[[InteractionArray], NDArray[np.bool_]]]
+    interaction_fields: Optional[List[str]]
     min_energy: Float
-    queue: Queue
+    queue: Union[Queue, InteractionBufferRing]
     particles: ParticleArray
+    metrics: TransportMetrics
+    metrics_interval: Float
+    metrics_filename: Optional[Path]
+    prometheus_filename: Optional[Path]
+    metrics_labels: Dict[str, str]
 
-    def __init__(self, source: Any, simulation_volume: ElementaryVolume, propagation_manager: Optional[PropagationWithInteraction] = None, stop_time: Float = 1*units.s, particles_number: Union[int, Float] = 10**3, queue: Optional[queue.Queue] = None) -> None:
+    def __init__(self, source: Any, simulation_volume: ElementaryVolume, propagation_manager: Optional[PropagationWithInteraction] = None, stop_time: Float = 1*units.s, particles_number: Union[int, Float] = 10**3, queue: Optional[Union[queue.Queue, InteractionBufferRing]] = None) -> None:
         super().__init__()
         self.source = source
         self.simulation_volume = simulation_volume
@@ -43,10 +56,20 @@ class SimulationManager(Thread):
         self.stop_time = stop_time
         self.particles_number = int(particles_number)
         self.valid_filters = []
+        self.interaction_filters = []
+        self.interaction_fields = None
         self.min_energy = 1*units.keV
         self.queue = Queue(maxsize=1) if queue is None else queue
         self.step = 1
         self.profile = False
+        self.metrics = self.propagation_manager.metrics
+        self.metrics_interval = Float(60.)
+        self.metrics_filename = None
+        self.prometheus_filename = None
+        self.metrics_labels = {}
+        self._next_report = Float(0.)
+        self._start_timer = Float(0.)
+        self._start_time = perf_counter()
         self.daemon = True
         signal(SIGINT, self.sigint_handler)
 
@@ -57,6 +80,15 @@ class SimulationManager(Thread):
             result *= filter(particles)
         return result
 
+    def filter_interactions(self, interaction_data: InteractionArray) -> InteractionArray:
+        """ Оставить только взаимодействия, прошедшие все фильтры """
+        if not self.interaction_filters:
+            return interaction_data
+        result = np.ones(interaction_data.size, dtype=np.bool_)
+        for filter in self.interaction_filters:
+            result &= filter(interaction_data)
+        return interaction_data[result]
+
     def sigint_handler(self, signal, frame):
         _logger.error(f'{self.name} interrupted at {datetime_from_seconds(self.source.timer/units.second)}')
         self.stop_time = 0
@@ -64,18 +96,73 @@ class SimulationManager(Thread):
     def send_data(self, data):
         self.queue.put(data)
 
+    @property
+    def queue_depth(self) -> int:
+        return self.queue.depth if isinstance(self.queue, InteractionBufferRing) else self.queue.qsize()
+
+    def progress(self) -> Dict[str, Float]:
+        """ Скорость моделирования и оценка оставшегося времени задания """
+        wall_time = perf_counter() - self._start_time
+        simulated_time = (self.source.timer - self._start_timer)/units.s
+        remaining_time = max(self.stop_time - self.source.timer, 0.)/units.s
+        speed = simulated_time/wall_time if wall_time > 0 else 0.
+        return {
+            'simulated_seconds_per_wall_second': speed,
+            'photons_per_second': self.metrics.emitted/wall_time if wall_time > 0 else 0.,
+            'events_sent': self.metrics.events_sent,
+            'events_written': self.metrics.events_written,
+            'eta_seconds': remaining_time/speed if speed > 0 else (0. if remaining_time == 0 else np.inf),
+            'queue_depth': self.queue_depth,
+            'particles_alive': self.particles.size if hasattr(self, 'particles') else 0,
+            'source_timer_seconds': self.source.timer/units.s
+        }
+
+    def report_metrics(self) -> None:
+        """ Вывести сводку метрик переноса в лог, файл метрик и файл Prometheus """
+        progress = self.progress()
+        snapshot = {'name': self.name, 'source_timer': float(self.source.timer), **self.metrics.snapshot()}
+        snapshot['progress'] = {name: float(value) for name, value in progress.items()}
+        line = json.dumps(snapshot)
+        _logger.info('%s transport metrics %s', self.name, line)
+        if self.metrics_filename is not None:
+            with open(self.metrics_filename, 'a', encoding='utf-8') as file:
+                file.write(line + '\n')
+        if self.prometheus_filename is not None:
+            write_prometheus(self.prometheus_filename, prometheus_text(progress, {'unit': self.name, **self.metrics_labels}))
+
     def next_step(self):
+        metrics = self.metrics
         propagation_data = self.propagation_manager(self.particles, self.simulation_volume)
+        start = perf_counter()
         invalid_particles = ~self.check_valid(self.particles)
-        if self.source.timer <= self.stop_time:
-            newParticles = self.source.generate_particles(np.count_nonzero(invalid_particles))
-            self.particles[invalid_particles] = newParticles
+        if self.source.timer < self.stop_time:
+            refill = invalid_particles.nonzero()[0]
+            newParticles = self.source.generate_particles(refill.size)
+            self.particles[refill[:newParticles.size]] = newParticles
+            if newParticles.size < refill.size:
+                # Распады окна источника исчерпаны: лишние места освобождаются
+                keep = np.ones(self.particles.size, dtype=np.bool_)
+                keep[refill[newParticles.size:]] = False
+                self.particles = self.particles[keep]
+            metrics.emitted += newParticles.size
         else:
             self.particles = self.particles[~invalid_particles]
+        start = metrics.record_time('refill', start)
+        metrics.alive = self.particles.size
+        metrics.steps += 1
         self.step += 1
-        if propagation_data is not None:
-            _logger.debug(f'{self.name} generated {propagation_data.size} events')
-            self.send_data(propagation_data)
+        if start >= self._next_report:
+            if metrics.steps > 1:
+                self.report_metrics()
+            self._next_report = start + self.metrics_interval
+        if propagation_data is None:
+            return
+        _logger.debug('%s generated %d events', self.name, propagation_data.size)
+        propagation_data = self.filter_interactions(propagation_data)
+        if propagation_data.size > 0:
+            self.send_data(select_fields(propagation_data, self.interaction_fields))
+            metrics.events_sent += propagation_data.size
+        metrics.record_time('send', start)
 
     def run(self):
         if self.profile:
@@ -90,10 +177,18 @@ class SimulationManager(Thread):
         """ Реализация работы потока частиц """
         _logger.warning(f'{self.name} started from {datetime_from_seconds(self.source.timer/units.second)} to {datetime_from_seconds(self.stop_time/units.second)}')
         start_timepoint = datetime.now()
+        self._start_timer = self.source.timer
+        if self.source.time_stop is None:
+            self.source.set_time_window(self.source.timer, self.stop_time)
+        self._start_time = perf_counter()
         self.particles = self.source.generate_particles(self.particles_number)
+        self.metrics.emitted += self.particles.size
+        debug = _logger.isEnabledFor(logging.DEBUG)
         while self.particles.size > 0:
                 self.next_step()
-                _logger.debug(f'Source timer of {self.name} at {datetime_from_seconds(self.source.timer/units.second)}')
+                if debug:
+                    _logger.debug('Source timer of %s at %s', self.name, datetime_from_seconds(self.source.timer/units.second))
+        # Итоговые метрики выводит потребитель очереди после последней записи
         self.queue.put('stop')
         stop_timepoint = datetime.now()
         _logger.warning(f'{self.name} finished at {datetime_from_seconds(self.source.timer/units.second)}')
@@ -1,7 +1,10 @@
 import numpy as np
 import threading as mt
 import queue
-from typing import List, Optional, Any, Union, Tuple, Callable
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable
+from core.transport.buffers import InteractionBufferRing
+from core.transport.metrics import TransportMetrics
 from core.transport.propagation_managers import PropagationWithInteraction
 from core.particles.particles import ParticleArray
 from core.geometry.volumes import ElementaryVolume
@@ -17,14 +20,26 @@ class SimulationManager(mt.Thread):
     stop_time: Float
     particles_number: int
     valid_filters: List[Callable[[ParticleArray], np.ndarray]]
+    interaction_filters: List[Callable[[InteractionArray], np.ndarray]]
+    interaction_fields: Optional[List[str]]
     min_energy: Float
-    queue: Queue
+    queue: Union[Queue, InteractionBufferRing]
     particles: ParticleArray
     step: int
     profile: bool
+    metrics: TransportMetrics
+    metrics_interval: Float
+    metrics_filename: Optional[Path]
+    prometheus_filename: Optional[Path]
+    metrics_labels: Dict[str, str]
 
-    def __init__(self, source: Any, simulation_volume: ElementaryVolume, propagation_manager: Optional[PropagationWithInteraction] = None, stop_time: Float = ..., particles_number: Union[int, Float] = ..., queue: Optional[Queue] = None) -> None: ...
+    def __init__(self, source: Any, simulation_volume: ElementaryVolume, propagation_manager: Optional[PropagationWithInteraction] = None, stop_time: Float = ..., particles_number: Union[int, Float] = ..., queue: Optional[Union[Queue, InteractionBufferRing]] = None) -> None: ...
     def check_valid(self, particles: ParticleArray) -> np.ndarray: ...
+    def filter_interactions(self, interaction_data: InteractionArray) -> InteractionArray: ...
+    @property
+    def queue_depth(self) -> int: ...
+    def progress(self) -> Dict[str, Float]: ...
+    def report_metrics(self) -> None: ...
     def sigint_handler(self, signal: Any, frame: Any) -> None: ...
     def send_data(self, data: Union[InteractionArray, str]) -> None: ...
     def next_step(self) -> None: ...
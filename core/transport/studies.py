@@ -0,0 +1,837 @@
+import argparse
+import hashlib
+import json
+import logging
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import hepunits as units
+from numpy.random import SeedSequence
+from numpy.typing import NDArray
+
+from core.other.log_pipeline import FORMAT, LogPipeline, ProgressFilter, UnitFileHandler, set_unit
+from core.other.typing_definitions import Activity, Energy, Float, Length, Time
+from core.transport.schedulers import JobScheduler, StudyDescription
+from core.transport.warmup import warmup
+
+_logger = logging.getLogger(__name__)
+
+Seed = Union[int, SeedSequence]
+
+
+def quantity(value: Any) -> Float:
+    """
+    Перевести значение из конфигурации в единицы hepunits
+
+    Числа считаются заданными во внутренних единицах, строки вида "233 mm" или "300*MBq"
+    умножаются на соответствующую единицу
+    """
+    if not isinstance(value, str):
+        return Float(value)
+    number, _, unit = value.replace('*', ' ').strip().partition(' ')
+    unit = unit.strip()
+    if not unit:
+        return Float(number)
+    if not hasattr(units, unit):
+        raise ValueError(f'Неизвестная единица измерения "{unit}" в значении "{value}"')
+    return Float(float(number)*getattr(units, unit))
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+# Ключи [source], общие для компонент составного источника
+SHARED_SOURCE_KEYS = ('distribution', 'voxel_size', 'remap')
+
+
+def _parse_tacs(source: Dict[str, Any]) -> Optional[Dict[int, Tuple[NDArray[Float], NDArray[Float]]]]:
+    """ Кривые активность-время областей из [source.tacs] (метка = [[время, активность], ...]) """
+    tacs = source.get('tacs')
+    if tacs is None:
+        return None
+    return {
+        int(label): (
+            np.array([quantity(time) for time, _ in points], dtype=Float),
+            np.array([quantity(activity) for _, activity in points], dtype=Float)
+        )
+        for label, points in tacs.items()
+    }
+
+
+def _source_half_life(source: Dict[str, Any]) -> Time:
+    """
+    Период полураспада источника [source] из его класса
+
+    У изотопов (Tc99m_MIBI, I123, ...) период полураспада задан в классе, ключ half_life
+    допускается только совпадающим с ним. Для классов без своего периода
+    полураспада (Source) используется half_life конфигурации, по умолчанию 6 часов
+    """
+    import core.source.sources as sources
+
+    source_class = getattr(sources, source['type'])
+    half_life = getattr(source_class, 'half_life', None)
+    if half_life is None:
+        return quantity(source.get('half_life', '6 hour'))
+    if 'half_life' in source and not np.isclose(quantity(source['half_life']), half_life):
+        raise ValueError(
+            f'Период полураспада {source["half_life"]} не совпадает с периодом полураспада '
+            f'{source_class.__name__} ({half_life/units.hour:g} hour), уберите ключ half_life'
+        )
+    return Float(half_life)
+
+
+def _source_activity(source: Dict[str, Any]) -> Tuple[Activity, Time]:
+    """ Активность и период полураспада источника для оценки стоимости единиц работы """
+    tacs = _parse_tacs(source)
+    if tacs is None:
+        return quantity(source['activity']), _source_half_life(source)
+    # Для кривых активность-время - наибольшая суммарная активность, распад учтён в кривых
+    times = np.unique(np.concatenate([times for times, _ in tacs.values()]))
+    return Float(np.max(sum(np.interp(times, *tac) for tac in tacs.values()))), Float(np.inf)
+
+
+def _scene_source_keys(index: int) -> Tuple[str, str]:
+    """ Ключи распределения и размера вокселя компоненты источника в сцене """
+    if index == 0:
+        return 'source', 'source_voxel_size'
+    return f'source_{index}', f'source_voxel_size_{index}'
+
+
+def _read_toml(path: Path) -> Dict[str, Any]:
+    with open(path, 'rb') as file:
+        data = tomllib.load(file)
+    base = data.pop('base', None)
+    if base is None:
+        return data
+    return _merge(_read_toml(path.parent/base), data)
+
+
+@dataclass
+class StudyConfig:
+    """
+    Конфигурация исследования из TOML-файла
+
+    Файл может наследовать другой через ключ base, вложенные таблицы при этом сливаются
+    """
+    path: Path
+    data: Dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        return self.data['name']
+
+    @property
+    def output_directory(self) -> str:
+        return self.data.get('output', {}).get('directory', self.name)
+
+    @property
+    def scene_filename(self) -> Path:
+        return Path(f'output data/{self.output_directory}/scene.npz')
+
+    @property
+    def angles(self) -> NDArray[Float]:
+        """ Углы первой головки для каждой позиции кольца камер """
+        acquisition = self.data['acquisition']
+        views = acquisition['views']
+        angles = np.linspace(
+            quantity(acquisition['angle_start']),
+            quantity(acquisition['angle_stop']),
+            views,
+            endpoint=acquisition.get('endpoint', False)
+        )
+        return angles[:views//acquisition['gamma_cameras']]
+
+    @property
+    def hybrid(self) -> bool:
+        """ Гибридный режим: Монте-Карло только для рассеянного излучения, первичное - аналитически """
+        return bool(self.data['acquisition'].get('hybrid', False))
+
+    @property
+    def delta_angle(self) -> Float:
+        """ Угол между соседними головками, по умолчанию 90 градусов с поправкой до шага проекций """
+        acquisition = self.data['acquisition']
+        if 'delta_angle' in acquisition:
+            return quantity(acquisition['delta_angle'])
+        angles = self.angles
+        if angles.size < 2:
+            return Float(np.pi/2)
+        angle_step = angles[1] - angles[0]
+        remainder = (np.pi/2) % angle_step
+        if np.isclose(remainder, 0.) or np.isclose(remainder, angle_step):
+            remainder = 0.
+        return Float(np.pi/2 + remainder)
+
+    @property
+    def source_components(self) -> List[Dict[str, Any]]:
+        """
+        Конфигурации источников: компоненты [[source.components]] составного источника
+        (с общими ключами SHARED_SOURCE_KEYS из [source]) или сам [source]
+        """
+        source = self.data['source']
+        if source['type'] != 'CompositeSource':
+            return [source]
+        shared = {key: source[key] for key in SHARED_SOURCE_KEYS if key in source}
+        return [_merge(shared, component) for component in source['components']]
+
+    def description(self) -> StudyDescription:
+        acquisition = self.data['acquisition']
+        activities, half_lives = np.array([_source_activity(source) for source in self.source_components]).T
+        activity = Float(activities.sum())
+        # Период полураспада смеси - по средней постоянной распада, взвешенной по активности
+        with np.errstate(divide='ignore'):
+            half_life = Float(activity/np.sum(activities/half_lives))
+        return StudyDescription(
+            name=self.output_directory,
+            angles=self.angles,
+            time_start=quantity(acquisition.get('time_start', 0.)),
+            time_stop=quantity(acquisition['time_stop']),
+            activity=activity,
+            half_life=half_life,
+            steps=acquisition.get('steps'),
+            sharded=bool(self.data.get('output', {}).get('shards', True)),
+            rotations=acquisition.get('rotations')
+        )
+
+
+def read_study_config(path: Union[str, Path]) -> StudyConfig:
+    """ Прочитать конфигурацию исследования """
+    path = Path(path)
+    return StudyConfig(path, _read_toml(path))
+
+
+def _scene_key(config: StudyConfig) -> str:
+    phantom = config.data['phantom']
+    source = config.data['source']
+    key = hashlib.sha256(json.dumps([phantom, source], sort_keys=True, default=str).encode())
+    for filename in [phantom['labels']] + [component['distribution'] for component in config.source_components]:
+        key.update(Path(filename).read_bytes())
+    return key.hexdigest()
+
+
+def compile_scene(config: StudyConfig) -> Dict[str, NDArray[Any]]:
+    """
+    Построить и проверить неизменную часть сцены: фантом и распределение источника
+
+    Карта меток фантома переводится в метки uint8 по списку материалов, таблица remap
+    источника применяется к распределению
+    """
+    from settings.database_setting import material_database
+
+    phantom = config.data['phantom']
+    labels = np.load(phantom['labels'])
+    if np.any(labels < 0) or np.any(labels != np.round(labels)):
+        raise ValueError('Метки фантома должны быть неотрицательными целыми числами')
+    labels = labels.astype(np.int64)
+    mapping = {int(label): name for label, name in phantom['materials'].items()}
+    unknown = sorted(set(mapping.values()) - set(material_database))
+    if unknown:
+        raise ValueError(f'Материалы {unknown} отсутствуют в базе данных материалов')
+    unmapped = sorted(set(np.unique(labels).tolist()) - set(mapping))
+    if unmapped:
+        raise ValueError(f'Метки фантома {unmapped} не сопоставлены материалам')
+    material_names = sorted(set(mapping.values()))
+    lut = np.zeros(max(max(mapping), int(labels.max())) + 1, dtype=np.uint8)
+    for label, name in mapping.items():
+        lut[label] = material_names.index(name)
+
+    scene = {
+        'key': np.array(_scene_key(config)),
+        'labels': lut[labels],
+        'materials': np.array(material_names),
+        'voxel_size': np.array(quantity(phantom['voxel_size']))
+    }
+    for index, source in enumerate(config.source_components):
+        distribution = np.load(source['distribution'])
+        remapped = distribution.copy()
+        for value, new_value in source.get('remap', {}).items():
+            remapped[distribution == float(value)] = new_value
+        if np.any(remapped < 0) or not np.any(remapped > 0):
+            raise ValueError(f'Распределение источника {index} должно быть неотрицательным и ненулевым')
+        distribution_key, voxel_size_key = _scene_source_keys(index)
+        scene[distribution_key] = remapped.astype(Float)
+        scene[voxel_size_key] = np.array(quantity(source.get('voxel_size', phantom['voxel_size'])))
+    return scene
+
+
+def prepare_scene(config: StudyConfig) -> Path:
+    """ Построить сцену исследования один раз, повторно используя актуальный кэш """
+    filename = config.scene_filename
+    key = _scene_key(config)
+    if filename.exists():
+        with np.load(filename) as scene:
+            if str(scene['key']) == key:
+                _logger.info(f'Scene cache {filename} is up to date')
+                return filename
+    scene = compile_scene(config)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    with open(filename, 'wb') as file:
+        np.savez_compressed(file, **scene)
+    _logger.warning(f'Scene compiled to {filename}')
+    return filename
+
+
+def load_scene(config: StudyConfig) -> Dict[str, NDArray[Any]]:
+    with np.load(config.scene_filename) as scene:
+        return {name: scene[name] for name in scene.files}
+
+
+def build_detector_response(config: StudyConfig, rng: Optional[np.random.Generator] = None) -> Optional[Any]:
+    """ Отклик детектора из секции [gamma_camera.response], None - запись взаимодействий без обработки """
+    from core.data.detector_response import DetectorResponse
+
+    response = config.data['gamma_camera'].get('response')
+    if response is None:
+        return None
+    return DetectorResponse(
+        energy_resolution=Float(response.get('energy_resolution', 0.099)),
+        reference_energy=quantity(response.get('reference_energy', '140.5 keV')),
+        intrinsic_resolution=quantity(response.get('intrinsic_resolution', '3.6 mm')),
+        coincidence_window=quantity(response.get('coincidence_window', '10 ns')),
+        rng=rng
+    )
+
+
+def build_gamma_cameras(config: StudyConfig, angle: Float, rng: Optional[np.random.Generator] = None) -> List[Any]:
+    """ Построить кольцо гамма-камер для угла первой головки, rng - генератор отклика детекторов """
+    from core.geometry.gamma_cameras import GammaCamera
+    from core.geometry.geometries import Box
+    from core.geometry.parametric_collimators import ParametricParallelCollimator
+    from core.geometry.volumes import TransformableVolume
+    from settings.database_setting import material_database
+
+    camera = config.data['gamma_camera']
+    acquisition = config.data['acquisition']
+    radius = quantity(acquisition['radius'])
+    delta_angle = config.delta_angle
+    detector_size = [quantity(size) for size in camera['detector_size']]
+    gamma_cameras = []
+    for i in range(acquisition['gamma_cameras']):
+        head_angle = angle + delta_angle*i
+        detector = TransformableVolume(
+            geometry=Box(*detector_size),
+            material=material_database[camera['detector_material']],
+            name=f'Detector at {round(head_angle/units.degree, 1)} deg'
+        )
+
+        collimator = ParametricParallelCollimator(
+            size=(detector.size[0], detector.size[1], quantity(camera['collimator_thickness'])),
+            hole_diameter=quantity(camera['hole_diameter']),
+            septa=quantity(camera['septa']),
+            material=material_database[camera['collimator_material']],
+            name=f'Collimator at {round(head_angle/units.degree, 1)} deg'
+        )
+
+        spect_head = GammaCamera(
+            collimator=collimator,
+            detector=detector,
+            shielding_thickness=quantity(camera['shielding_thickness']),
+            glass_backend_thickness=quantity(camera['glass_backend_thickness']),
+            name=f'Gamma_camera at {round(head_angle/units.degree, 1)} deg',
+            response=build_detector_response(config, rng)
+        )
+        spect_head.rotate(gamma=np.pi/2)
+        spect_head.translate(y=radius + spect_head.size[2]/2)
+        spect_head.rotate(alpha=head_angle)
+        gamma_cameras.append(spect_head)
+    return gamma_cameras
+
+
+def build_phantom(config: StudyConfig, scene: Dict[str, Any], bricks: bool = True) -> Any:
+    """ Воксельный фантом из скомпилированной сцены (блочный, если задан brick_size и bricks) """
+    from core.geometry.voxel_volumes import WoodcockBrickVolume, WoodcockVoxelVolume
+    from settings.database_setting import material_database
+
+    phantom_kwargs = {
+        'voxel_size': Float(scene['voxel_size']),
+        'material_distribution': scene['labels'],
+        'material_mapping': {label: material_database[str(name)] for label, name in enumerate(scene['materials'])},
+        'name': 'Phantom'
+    }
+    brick_size = config.data['phantom'].get('brick_size')
+    if brick_size is None or not bricks:
+        return WoodcockVoxelVolume(**phantom_kwargs)
+    return WoodcockBrickVolume(brick_size=brick_size, **phantom_kwargs)
+
+
+def _build_source_component(source: Dict[str, Any], distribution: NDArray[Float], voxel_size: Length) -> Any:
+    import core.source.sources as sources
+
+    source_class = getattr(sources, source['type'])
+    half_life = _source_half_life(source)
+    if issubclass(source_class, sources.DynamicSource):
+        return source_class(
+            labels=np.rint(distribution).astype(np.int64),
+            tacs=_parse_tacs(source),
+            voxel_size=voxel_size
+        )
+    # Период полураспада изотопа задан классом, остальным классам передаётся из конфигурации
+    kwargs = {} if getattr(source_class, 'half_life', None) is not None else {'half_life': half_life}
+    return source_class(
+        distribution=distribution,
+        activity=quantity(source['activity']),
+        voxel_size=voxel_size,
+        **kwargs
+    )
+
+
+def build_source(config: StudyConfig, scene: Dict[str, Any]) -> Any:
+    """ Источник из скомпилированной сцены, для составного источника - CompositeSource из компонент """
+    from core.source.sources import CompositeSource
+
+    components = []
+    for index, source in enumerate(config.source_components):
+        distribution_key, voxel_size_key = _scene_source_keys(index)
+        components.append(_build_source_component(source, scene[distribution_key], Float(scene[voxel_size_key])))
+    if config.data['source']['type'] == 'CompositeSource':
+        return CompositeSource(components)
+    return components[0]
+
+
+def slice_decays(config: StudyConfig, source: Any, time_interval: Tuple[Time, Time]) -> Optional[int]:
+    """
+    Число распадов отрезка при заданном [acquisition] decays - числе распадов за время регистрации
+
+    Доли отрезков округляются по накопленному числу распадов источника от начала
+    регистрации, поэтому отрезки любого разбиения получают в сумме ровно decays распадов
+    """
+    decays = config.data['acquisition'].get('decays')
+    if decays is None:
+        return None
+    description = config.description()
+    total = source.decays(description.time_start, description.time_stop)
+
+    def cumulative(time: Time) -> int:
+        return int(np.rint(int(decays)*source.decays(description.time_start, time)/total))
+
+    return cumulative(time_interval[1]) - cumulative(time_interval[0])
+
+
+def build_simulation(config: StudyConfig, angle: Float, time_interval: Tuple[Time, Time], seed: Seed) -> Tuple[Any, List[Any]]:
+    """
+    Собрать моделирование одной проекции из скомпилированной сцены
+
+    Отклик детекторов вызывается в потоке потребителя и получает собственный
+    поток случайных чисел (дочерний от seed), иначе порядок выборок зависел бы
+    от чередования потоков и запуски с одним seed различались бы
+    """
+    from core.geometry.geometries import Box
+    from core.geometry.volumes import VolumeWithChilds
+    from core.transport.buffers import InteractionBufferRing
+    from core.transport.propagation_managers import PropagationWithInteraction
+    from core.transport.simulation_managers import SimulationManager
+    from settings.database_setting import attenuation_database, material_database
+
+    seed_sequence = seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+    rng = np.random.default_rng(seed_sequence)
+    response_rng = np.random.default_rng(seed_sequence.spawn(1)[0])
+    start_time, stop_time = time_interval
+    scene = load_scene(config)
+
+    world = config.data['world']
+    simulation_volume = VolumeWithChilds(
+        geometry=Box(*[quantity(size) for size in world['size']]),
+        material=material_database[world['material']],
+        name='Simulation_volume'
+    )
+
+    phantom = build_phantom(config, scene)
+    phantom.set_parent(simulation_volume)
+
+    gamma_cameras = build_gamma_cameras(config, angle, response_rng)
+    detector_list = []
+    for spect_head in gamma_cameras:
+        simulation_volume.add_child(spect_head)
+        detector_list.append(spect_head.detector)
+
+    source = build_source(config, scene)
+    source.rng = rng
+    source.set_time_window(start_time, stop_time, slice_decays(config, source, time_interval))
+
+    propagation_manager = PropagationWithInteraction(
+        attenuation_database=attenuation_database,
+        rng=rng
+    )
+
+    simulation_manager = SimulationManager(
+        source=source,
+        simulation_volume=simulation_volume,
+        propagation_manager=propagation_manager,
+        particles_number=int(config.data.get('particles_number', 10**6)),
+        stop_time=stop_time,
+        queue=InteractionBufferRing(buffer_count=int(config.data.get('output', {}).get('handoff_buffers', 2)))
+    )
+    simulation_manager.name = f'{round(angle/units.degree, 1)} deg'
+    simulation_manager.metrics_interval = quantity(config.data.get('output', {}).get('metrics_interval', '60 s'))/units.s
+    simulation_manager.interaction_filters = build_interaction_filters(config, detector_list)
+    if config.hybrid:
+        from core.transport.filters import PrimaryRejectionFilter
+
+        simulation_manager.valid_filters.append(PrimaryRejectionFilter(gamma_cameras))
+    return simulation_manager, detector_list
+
+
+def build_interaction_filters(config: StudyConfig, detector_list: List[Any]) -> List[Any]:
+    """ Фильтры взаимодействий из секции [filters], события вне детекторов отбрасываются всегда """
+    from core.transport.filters import EnergyDepositFilter, EnergyWindowFilter, ProcessFilter, VolumeFilter
+
+    filters = config.data.get('filters', {})
+    interaction_filters = [VolumeFilter(detector_list), ]
+    if 'emission_energy' in filters:
+        energy_min, energy_max = filters['emission_energy']
+        interaction_filters.append(EnergyWindowFilter(quantity(energy_min), quantity(energy_max)))
+    if 'processes' in filters:
+        interaction_filters.append(ProcessFilter(filters['processes']))
+    if 'min_deposit' in filters:
+        interaction_filters.append(EnergyDepositFilter(quantity(filters['min_deposit'])))
+    return interaction_filters
+
+
+def metrics_directory(config: StudyConfig) -> Path:
+    """ Каталог файлов метрик Prometheus заданий исследования """
+    return Path(f'output data/{config.output_directory}/metrics')
+
+
+def log_pipeline(config: StudyConfig) -> LogPipeline:
+    """
+    Журналирование исследования через очередь родительского процесса
+
+    Секция [logging]: level - уровень логгеров core (по умолчанию INFO),
+    console_level - уровень вывода в консоль (по умолчанию WARNING, ход работы
+    планировщика выводится в консоль и Telegram независимо от уровня),
+    [logging.levels] - уровни отдельных модулей, например "core.transport.simulation_managers" = "DEBUG".
+    Записи единиц работы пишутся в logs/<каталог>/<проекция>.log, остальные - в study.log
+    """
+    settings = config.data.get('logging', {})
+    file_handler = UnitFileHandler(f'logs/{config.output_directory}')
+    file_handler.setFormatter(logging.Formatter(FORMAT))
+    console_handler = logging.StreamHandler()
+    console_handler.addFilter(ProgressFilter(settings.get('console_level', 'WARNING')))
+    console_handler.setFormatter(logging.Formatter(FORMAT))
+    handlers: List[logging.Handler] = [file_handler, console_handler]
+    if config.data.get('output', {}).get('telegram', False):
+        from core.other.telegram_bot import TeleBotHandler
+        telebot_handler = TeleBotHandler()
+        telebot_handler.addFilter(ProgressFilter(logging.WARNING))
+        telebot_handler.setFormatter(logging.Formatter('[%(asctime)s: %(levelname)s]\n%(message)s'))
+        handlers.append(telebot_handler)
+    return LogPipeline(handlers, settings.get('level', 'INFO'), settings.get('levels', {}))
+
+
+def _log_handoff(simulation_manager: Any) -> None:
+    metrics = getattr(simulation_manager.queue, 'metrics', None)
+    if metrics is None:
+        return
+    _logger.info(
+        f'{simulation_manager.name} handoff: {metrics.gets} arrays, {metrics.reallocations} reallocations, '
+        f'transport blocked {metrics.producer_blocked_time:.2f} s, consumer blocked {metrics.consumer_blocked_time:.2f} s'
+    )
+
+
+def modeling(study: Union[str, Path], angle: Float, time_interval: Tuple[Time, Time], seed: Seed, filename: Optional[Union[str, Path]] = None) -> None:
+    """
+    Задача планировщика: моделирование отрезка времени одной проекции с записью событий
+
+    filename - файл событий единицы работы (по умолчанию файл проекции)
+    """
+    from core.data.data_manager import SimulationDataManager
+
+    config = read_study_config(study)
+    set_unit(config.description().unit_key(angle))
+    start_time, stop_time = time_interval
+    simulation_manager, detector_list = build_simulation(config, angle, time_interval, seed)
+
+    output = config.data.get('output', {})
+    if filename is None:
+        filename = config.description().unit_filename(angle)
+    simulation_data_manager = SimulationDataManager(
+        filename=str(Path(filename).relative_to('output data')),
+        sensitive_volumes=detector_list,
+        interaction_buffer_size=int(output.get('interaction_buffer_size', 10**4)),
+        **{arg: output[arg] for arg in ('compression', 'compression_opts', 'shuffle') if arg in output}
+    )
+    simulation_data_manager.restore_progress()
+    simulation_manager.interaction_fields = simulation_data_manager.required_fields
+    if output.get('metrics_file', False):
+        simulation_manager.metrics_filename = Path(filename).with_suffix('.metrics.jsonl')
+    if output.get('prometheus', False) or 'metrics_port' in output:
+        unit = ' '.join(Path(filename).relative_to(f'output data/{config.output_directory}').with_suffix('').parts)
+        simulation_manager.prometheus_filename = metrics_directory(config)/f'{unit}.prom'
+        simulation_manager.metrics_labels = {'study': config.name, 'unit': unit}
+    simulation_manager.start()
+
+    while True:
+        data = simulation_manager.queue.get()
+        if isinstance(data, np.ndarray):
+            start = perf_counter()
+            simulation_data_manager.add_interaction_data(data)
+            simulation_manager.metrics.record_time('save', start)
+            simulation_manager.metrics.events_written = simulation_data_manager.writer.metrics.events
+        elif data == 'stop':
+            simulation_manager.join()
+            _log_handoff(simulation_manager)
+            simulation_data_manager.flush_detector_responses()
+            simulation_data_manager.save_interaction_data()
+            simulation_data_manager.save_progress(stop_time)
+            simulation_manager.metrics.events_written = simulation_data_manager.writer.metrics.events
+            simulation_manager.report_metrics()
+            simulation_data_manager.close()
+            break
+        else:
+            raise ValueError("Неверное значение Propagation Manager")
+
+
+def projection(study: Union[str, Path], angle: Float, time_interval: Tuple[Time, Time], seed: Seed) -> Dict[str, NDArray[Float]]:
+    """ Задача распределённого запуска: возвращает проекции вместо записи событий """
+    from core.data.data_manager import SimulationDataManager
+    from core.data.projections import ProjectionAccumulator
+
+    config = read_study_config(study)
+    simulation_manager, detector_list = build_simulation(config, angle, time_interval, seed)
+
+    pixel_size, energy_windows = projection_settings(config)
+    projection_accumulator = ProjectionAccumulator(
+        size=detector_list[0].size[:2],
+        pixel_size=pixel_size,
+        energy_windows=energy_windows,
+        frames=acquisition_frames(config)
+    )
+    simulation_data_manager = SimulationDataManager(
+        filename=f'{config.output_directory}/{simulation_manager.name}.hdf',
+        sensitive_volumes=detector_list,
+        save_events=False,
+        projection_accumulator=projection_accumulator
+    )
+    simulation_manager.interaction_fields = simulation_data_manager.required_fields
+    simulation_manager.start()
+
+    while True:
+        data = simulation_manager.queue.get()
+        if isinstance(data, np.ndarray):
+            start = perf_counter()
+            simulation_data_manager.add_interaction_data(data)
+            simulation_manager.metrics.record_time('save', start)
+        elif data == 'stop':
+            simulation_manager.join()
+            _log_handoff(simulation_manager)
+            simulation_data_manager.flush_detector_responses()
+            simulation_manager.report_metrics()
+            break
+        else:
+            raise ValueError("Неверное значение Propagation Manager")
+    return projection_accumulator.projections
+
+
+def merge_study(config: StudyConfig) -> None:
+    """ Объединить файлы фрагментов каждой проекции в файл проекции в порядке временных отрезков """
+    from core.data.writers import merge_shards
+
+    description = config.description()
+    output = config.data.get('output', {})
+    for angle in description.angles:
+        filename = description.unit_filename(angle)
+        last_time = merge_shards(
+            description.shard_filenames(angle),
+            filename,
+            virtual=output.get('merge', 'virtual') == 'virtual',
+            **{arg: output[arg] for arg in ('compression', 'compression_opts', 'shuffle') if arg in output}
+        )
+        if last_time is None:
+            _logger.error(f'{filename} not merged: no completed slices')
+        else:
+            _logger.warning(f'{filename} merged up to {last_time/units.s:g} s')
+
+
+def projection_settings(config: StudyConfig) -> Tuple[Length, List[Tuple[Energy, Energy]]]:
+    """ Размер пикселя и энергетические окна проекций из секции [projections] """
+    projections = config.data.get('projections', {})
+    return (
+        quantity(projections.get('pixel_size', '4 mm')),
+        [
+            (quantity(energy_min), quantity(energy_max))
+            for energy_min, energy_max in projections.get('energy_windows', [['126 keV', '154 keV']])
+        ]
+    )
+
+
+def acquisition_frames(config: StudyConfig) -> Optional[List[Time]]:
+    """ Границы временных кадров: [acquisition] frames или, при rotations, границы оборотов """
+    acquisition = config.data['acquisition']
+    if 'frames' in acquisition:
+        return [quantity(time) for time in acquisition['frames']]
+    if 'rotations' in acquisition:
+        description = config.description()
+        return list(np.linspace(description.time_start, description.time_stop, int(acquisition['rotations']) + 1))
+    return None
+
+
+def analytic_projection(study: Union[str, Path], angle: Float, time_interval: Optional[Tuple[Time, Time]] = None) -> Dict[str, NDArray[Float]]:
+    """ Первичные проекции головок для угла первой головки аналитическим проектором """
+    from core.physics.processes import Process
+    from core.transport.projectors import AnalyticProjector
+    from settings.database_setting import attenuation_database
+    import settings.processes_settings as processes_settings
+
+    config = read_study_config(study)
+    if any(_parse_tacs(source) is not None for source in config.source_components) or acquisition_frames(config) is not None:
+        raise ValueError('Аналитический проектор не поддерживает кривые активность-время и временные кадры')
+    prepare_scene(config)
+    scene = load_scene(config)
+    if time_interval is None:
+        description = config.description()
+        time_interval = (description.time_start, description.time_stop)
+    pixel_size, energy_windows = projection_settings(config)
+    response = config.data['gamma_camera'].get('response', {})
+    processes: List[Process] = [process(attenuation_database) for process in processes_settings.processes_list]
+    projector = AnalyticProjector(
+        phantom=build_phantom(config, scene, bricks=False),
+        source=build_source(config, scene),
+        processes=processes,
+        pixel_size=pixel_size,
+        energy_windows=energy_windows,
+        intrinsic_resolution=quantity(response.get('intrinsic_resolution', 0.)),
+        energy_resolution=Float(response.get('energy_resolution', 0.)),
+        reference_energy=quantity(response.get('reference_energy', '140.5 keV'))
+    )
+    return projector(build_gamma_cameras(config, angle), time_interval)
+
+
+def analytic_projections(config: StudyConfig) -> Dict[str, NDArray[Float]]:
+    """ Первичные проекции всех углов исследования """
+    from core.data.projections import merge_projections
+
+    projections: Dict[str, NDArray[Float]] = {}
+    for angle in config.angles:
+        merge_projections(projections, analytic_projection(config.path, angle))
+    return projections
+
+
+def run_analytic(study: Union[str, Path]) -> Path:
+    """ Аналитические первичные проекции всего исследования в формате core.data.listmode """
+    from core.data.listmode import save_projections
+
+    config = read_study_config(study)
+    output = Path(f'output data/{config.output_directory}/analytic projections.npz')
+    output.parent.mkdir(parents=True, exist_ok=True)
+    save_projections(output, analytic_projections(config), *projection_settings(config))
+    _logger.warning(f'Analytic projections saved to {output}')
+    return output
+
+
+def save_hybrid(config: StudyConfig, scatter: Dict[str, NDArray[Float]]) -> Path:
+    """
+    Сложить рассеянную составляющую Монте-Карло с аналитической первичной
+
+    Сохраняются суммарные проекции и составляющие primary и scatter
+    """
+    from core.data.listmode import save_projections
+
+    primary = analytic_projections(config)
+    scatter = {name: scatter.get(name, np.zeros_like(projection)) for name, projection in primary.items()}
+    output = Path(f'output data/{config.output_directory}/projections.npz')
+    output.parent.mkdir(parents=True, exist_ok=True)
+    save_projections(
+        output,
+        {name: primary[name] + scatter[name] for name in primary},
+        *projection_settings(config),
+        components={'primary': primary, 'scatter': scatter}
+    )
+    _logger.warning(f'Hybrid projections saved to {output}')
+    return output
+
+
+def run_study(study: Union[str, Path], address: Optional[str] = None) -> None:
+    """
+    Запустить исследование: локально планировщиком с записью событий
+    или координатором распределённого запуска по адресу address с накоплением проекций
+    """
+    config = read_study_config(study)
+    prepare_scene(config)
+    description = config.description()
+    seed_sequence = SeedSequence(config.data.get('seed'))
+
+    if address is None:
+        def make_args(angle: Float, time_interval: Tuple[Time, Time], filename: Path) -> Tuple[Any, ...]:
+            return (str(config.path), angle, time_interval, seed_sequence.spawn(1)[0], str(filename))
+
+        output = config.data.get('output', {})
+        metrics_server = None
+        if 'metrics_port' in output:
+            from core.transport.metrics import MetricsServer
+
+            metrics_server = MetricsServer(metrics_directory(config), (output.get('metrics_host', 'localhost'), int(output['metrics_port'])))
+            metrics_server.start()
+        pipeline = log_pipeline(config)
+        pipeline.start()
+        initializer, initargs = pipeline.initializer
+        scheduler = JobScheduler(modeling, config.data.get('pool_size', 1), initializer=initializer, initargs=initargs)
+        try:
+            # Ядра компилируются один раз: процессы пула наследуют их или читают кэш numba
+            warmup()
+            scheduler.run(description.work_units(make_args))
+        finally:
+            if metrics_server is not None:
+                metrics_server.stop()
+            pipeline.stop()
+        if description.sharded:
+            merge_study(config)
+        if config.hybrid:
+            from core.data.listmode import projections_from_listmode
+
+            pixel_size, energy_windows = projection_settings(config)
+            scatter = projections_from_listmode(
+                [description.unit_filename(angle) for angle in description.angles],
+                [quantity(size) for size in config.data['gamma_camera']['detector_size'][:2]],
+                pixel_size,
+                energy_windows,
+                processes=config.data.get('pool_size'),
+                component='scatter'
+            )
+            save_hybrid(config, scatter)
+        return
+
+    from core.data.projections import projections_to_bytes
+    from core.transport.distributed import Coordinator, parse_address
+
+    def make_config(angle: Float, time_interval: Tuple[Time, Time], filename: Path) -> Tuple[Any, ...]:
+        kwargs = {
+            'study': str(config.path),
+            'angle': float(angle),
+            'time_interval': [float(time) for time in time_interval],
+            'seed': int(seed_sequence.spawn(1)[0].generate_state(1)[0])
+        }
+        return ({'task': 'core.transport.studies:projection', 'kwargs': kwargs}, )
+
+    coordinator = Coordinator(description.work_units(make_config), parse_address(address))
+    projections = coordinator.serve()
+    if config.hybrid:
+        save_hybrid(config, projections)
+        return
+    output = Path(f'output data/{config.output_directory}/projections.npz')
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(projections_to_bytes(projections))
+    _logger.warning(f'Projections saved to {output}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Запуск исследования по TOML-конфигурации')
+    parser.add_argument('study', type=Path)
+    parser.add_argument('--distributed', metavar='HOST:PORT', default=None, help='запустить координатор распределённого запуска')
+    parser.add_argument('--analytic', action='store_true', help='только первичные проекции аналитическим проектором')
+    args = parser.parse_args()
+
+    logging.basicConfig(format=FORMAT)
+    if args.analytic:
+        run_analytic(args.study)
+    else:
+        run_study(args.study, args.distributed)
@@ -0,0 +1,75 @@
+import numpy as np
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from numpy.random import SeedSequence
+from numpy.typing import NDArray
+from core.data.detector_response import DetectorResponse
+from core.geometry.gamma_cameras import GammaCamera
+from core.geometry.volumes import TransformableVolume
+from core.geometry.voxel_volumes import WoodcockVoxelVolume
+from core.source.sources import Source
+from core.other.log_pipeline import LogPipeline
+from core.other.typing_definitions import Activity, Energy, Float, Length, Time
+from core.transport.schedulers import StudyDescription
+from core.transport.filters import InteractionFilter
+from core.transport.simulation_managers import SimulationManager
+
+Seed = Union[int, SeedSequence]
+
+def quantity(value: Any) -> Float: ...
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]: ...
+SHARED_SOURCE_KEYS: Tuple[str, ...]
+
+def _parse_tacs(source: Dict[str, Any]) -> Optional[Dict[int, Tuple[NDArray[Float], NDArray[Float]]]]: ...
+def _source_half_life(source: Dict[str, Any]) -> Time: ...
+def _source_activity(source: Dict[str, Any]) -> Tuple[Activity, Time]: ...
+def _scene_source_keys(index: int) -> Tuple[str, str]: ...
+def _read_toml(path: Path) -> Dict[str, Any]: ...
+
+@dataclass
+class StudyConfig:
+    path: Path
+    data: Dict[str, Any]
+    @property
+    def name(self) -> str: ...
+    @property
+    def output_directory(self) -> str: ...
+    @property
+    def scene_filename(self) -> Path: ...
+    @property
+    def angles(self) -> NDArray[Float]: ...
+    @property
+    def hybrid(self) -> bool: ...
+    @property
+    def delta_angle(self) -> Float: ...
+    @property
+    def source_components(self) -> List[Dict[str, Any]]: ...
+    def description(self) -> StudyDescription: ...
+
+def read_study_config(path: Union[str, Path]) -> StudyConfig: ...
+def _scene_key(config: StudyConfig) -> str: ...
+def compile_scene(config: StudyConfig) -> Dict[str, NDArray[Any]]: ...
+def prepare_scene(config: StudyConfig) -> Path: ...
+def load_scene(config: StudyConfig) -> Dict[str, NDArray[Any]]: ...
+def build_detector_response(config: StudyConfig, rng: Optional[np.random.Generator] = None) -> Optional[DetectorResponse]: ...
+def build_gamma_cameras(config: StudyConfig, angle: Float, rng: Optional[np.random.Generator] = None) -> List[GammaCamera]: ...
+def build_phantom(config: StudyConfig, scene: Dict[str, Any], bricks: bool = True) -> WoodcockVoxelVolume: ...
+def _build_source_component(source: Dict[str, Any], distribution: NDArray[Float], voxel_size: Length) -> Source: ...
+def build_source(config: StudyConfig, scene: Dict[str, Any]) -> Source: ...
+def slice_decays(config: StudyConfig, source: Source, time_interval: Tuple[Time, Time]) -> Optional[int]: ...
+def build_simulation(config: StudyConfig, angle: Float, time_interval: Tuple[Time, Time], seed: Seed) -> Tuple[SimulationManager, List[TransformableVolume]]: ...
+def build_interaction_filters(config: StudyConfig, detector_list: List[TransformableVolume]) -> List[InteractionFilter]: ...
+def metrics_directory(config: StudyConfig) -> Path: ...
+def log_pipeline(config: StudyConfig) -> LogPipeline: ...
+def _log_handoff(simulation_manager: SimulationManager) -> None: ...
+def modeling(study: Union[str, Path], angle: Float, time_interval: Tuple[Time, Time], seed: Seed, filename: Optional[Union[str, Path]] = None) -> None: ...
+def projection(study: Union[str, Path], angle: Float, time_interval: Tuple[Time, Time], seed: Seed) -> Dict[str, NDArray[Float]]: ...
+def merge_study(config: StudyConfig) -> None: ...
+def projection_settings(config: StudyConfig) -> Tuple[Length, List[Tuple[Energy, Energy]]]: ...
+def acquisition_frames(config: StudyConfig) -> Optional[List[Time]]: ...
+def analytic_projection(study: Union[str, Path], angle: Float, time_interval: Optional[Tuple[Time, Time]] = None) -> Dict[str, NDArray[Float]]: ...
+def analytic_projections(config: StudyConfig) -> Dict[str, NDArray[Float]]: ...
+def run_analytic(study: Union[str, Path]) -> Path: ...
+def save_hybrid(config: StudyConfig, scatter: Dict[str, NDArray[Float]]) -> Path: ...
+def run_study(study: Union[str, Path], address: Optional[str] = None) -> None: ...
@@ -0,0 +1,92 @@
+"""
+Прогрев ядер numba переноса
+
+Все ядра компилируются с cache=True: первый вызов на узле компилирует ядро
+и пишет его в кэш numba (__pycache__ или NUMBA_CACHE_DIR), следующие процессы
+загружают машинный код из кэша. Прогрев вызывает ядра на малых массивах
+с теми же типами аргументов, что и при переносе
+
+    python -m core.transport.warmup
+"""
+import argparse
+import logging
+from time import perf_counter
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+
+from core.other.typing_definitions import Float
+
+_logger = logging.getLogger(__name__)
+
+
+def _samplers() -> None:
+    import core.physics.g4coherent as g4coherent
+    import core.physics.g4compton as g4compton
+
+    rng = np.random.default_rng(0)
+    energy, Z = np.array([140.5e-3]), np.array([8], dtype=np.int64)
+    g4compton.sample_theta(energy, Z, rng)
+    g4coherent.sample_theta(energy, Z, rng)
+    g4compton.compute_scattering_function(energy, Z)
+    g4coherent.form_factor_squared(energy, energy, Z)
+
+
+def _attenuation() -> None:
+    from core.materials.attenuation_functions import fast_interp
+
+    x = np.array([0., 1.])
+    fast_interp(np.array([0.5]), x, x)
+
+
+def _voxels() -> None:
+    from core.geometry.voxel_volumes import brick_material_indices, brick_traverse, voxel_material_indices
+
+    position = np.zeros((1, 3), dtype=Float)
+    direction = np.array([[0., 0., 1.]], dtype=Float)
+    size = np.ones(3, dtype=Float)
+    shape = np.ones(3, dtype=np.int64)
+    voxel_material_indices(position, size, size, np.zeros((1, 1, 1), dtype=np.uint8), np.zeros(256, dtype=np.int64))
+    brick_material_indices(position, size, size, shape, 1, np.zeros((1, 1, 1), dtype=np.int32), np.zeros((1, 1, 1, 1), dtype=np.uint8))
+    brick_traverse(position, direction, size, size, shape, 1, np.zeros((1, 1, 1), dtype=np.int32))
+
+
+def _projectors() -> None:
+    from core.transport.projectors import attenuation_integrals, deposit_gaussians
+
+    position = np.zeros((1, 3), dtype=Float)
+    size = np.ones(3, dtype=Float)
+    attenuation_integrals(position, np.array([0., 0., 1.], dtype=Float), size, size, np.zeros((1, 1, 1), dtype=Float))
+    deposit_gaussians(np.zeros((1, 1), dtype=Float), np.zeros((1, 2), dtype=Float), np.ones(1, dtype=Float), np.ones(1, dtype=Float), size, Float(1.))
+
+
+KERNELS: Dict[str, Callable[[], None]] = {
+    'samplers': _samplers,
+    'attenuation': _attenuation,
+    'voxels': _voxels,
+    'projectors': _projectors
+}
+
+# Ядра процессов пула. Параллельные ядра проекторов сюда не входят: запуск
+# пула потоков numba в родительском процессе до fork приводит к зависанию при выходе
+TRANSPORT = ('samplers', 'attenuation', 'voxels')
+
+
+def warmup(groups: Iterable[str] = TRANSPORT) -> Dict[str, Float]:
+    """ Скомпилировать или загрузить из кэша группы ядер, возвращает время по группам, с """
+    times = {}
+    for name in groups:
+        start = perf_counter()
+        KERNELS[name]()
+        times[name] = perf_counter() - start
+    _logger.info('Kernels ready in %.2f s: %s', sum(times.values()), ', '.join(f'{name} {time:.2f} s' for name, time in times.items()))
+    return times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Компиляция ядер numba в кэш узла')
+    parser.add_argument('--groups', nargs='+', choices=list(KERNELS), default=list(KERNELS))
+    args = parser.parse_args()
+
+    logging.basicConfig(format='[%(asctime)s: %(levelname)s] %(message)s', level=logging.INFO)
+    warmup(args.groups)
@@ -0,0 +1,7 @@
+from typing import Callable, Dict, Iterable, Tuple
+from core.other.typing_definitions import Float
+
+KERNELS: Dict[str, Callable[[], None]]
+TRANSPORT: Tuple[str, ...]
+
+def warmup(groups: Iterable[str] = ...) -> Dict[str, Float]: ...
@@ -1,7 +1,27 @@
+"""
+Базы данных материалов и коэффициентов ослабления
+
+Таблицы NIST читаются при первом обращении к material_database или
+attenuation_database (или явным вызовом load_databases), а не при импорте
+"""
+from typing import Any, Tuple
+
 from core.materials.attenuation_database import AttenuationDataBase
 from core.materials.material_database import MaterialDataBase
 
 
-material_database = MaterialDataBase()
-attenuation_database = AttenuationDataBase()
-attenuation_database.add_material(material_database.values())
+def load_databases() -> Tuple[MaterialDataBase, AttenuationDataBase]:
+    """ Загрузить базы данных (один раз на процесс) """
+    global material_database, attenuation_database
+    if 'attenuation_database' not in globals():
+        material_database = MaterialDataBase()
+        attenuation_database = AttenuationDataBase()
+        attenuation_database.add_material(material_database.values())
+    return material_database, attenuation_database
+
+
+def __getattr__(name: str) -> Any:
+    if name in ('material_database', 'attenuation_database'):
+        load_databases()
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
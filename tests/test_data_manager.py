@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from core.data.data_manager import SimulationDataManager, read_source_timer
+
+EVENTS = np.dtype([('energy_deposit', np.float64), ('emission_time', np.float64)])
+
+
+def _events(start: int, stop: int) -> np.ndarray:
+    data = np.zeros(stop - start, dtype=EVENTS)
+    data['energy_deposit'] = np.arange(start, stop)
+    data['emission_time'] = np.arange(start, stop)*10.
+    return data
+
+
+def test_restore_progress_removes_uncommitted_rows(tmp_path, monkeypatch):
+    """ После сбоя в файле остаются только данные до последней отметки прогресса """
+    monkeypatch.chdir(tmp_path)
+    manager = SimulationDataManager('run.hdf')
+    manager.writer.write_dict({'Detector': _events(0, 5)}, 'interaction_data')
+    manager.save_progress(1.5)
+    manager.writer.write_dict({'Detector': _events(5, 8)}, 'interaction_data')
+    manager.close()
+
+    resumed = SimulationDataManager('run.hdf')
+    assert resumed.restore_progress() == 1.5
+    resumed.writer.write_dict({'Detector': _events(5, 9)}, 'interaction_data')
+    resumed.save_progress(3.)
+    resumed.close()
+
+    assert read_source_timer(resumed.filename) == 3.
+    with resumed.writer.opened() as file:
+        group = file['interaction_data/Detector']
+        np.testing.assert_array_equal(group['energy_deposit'][()], np.arange(9))
+        np.testing.assert_array_equal(group['emission_time'][()], np.arange(9)*10.)
+        assert all(dataset.attrs['committed_size'] == 9 for dataset in group.values())
+    resumed.close()
+
+
+def test_restore_progress_without_mark_clears_data(tmp_path, monkeypatch):
+    """ Данные файла без отметки прогресса удаляются целиком """
+    monkeypatch.chdir(tmp_path)
+    manager = SimulationDataManager('run.hdf')
+    manager.writer.write_dict({'Detector': _events(0, 4)}, 'interaction_data')
+    manager.close()
+
+    resumed = SimulationDataManager('run.hdf')
+    assert resumed.restore_progress() is None
+    with resumed.writer.opened() as file:
+        assert file['interaction_data/Detector/energy_deposit'].shape[0] == 0
+    resumed.close()
+
+
+def test_restore_progress_of_missing_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = SimulationDataManager('run.hdf')
+    assert manager.restore_progress() is None
+    assert not manager.filename.exists()
+
+
+def test_failed_write_is_not_swallowed(tmp_path, monkeypatch):
+    """ Ошибка записи передаётся вызывающему, накопленные данные не удаляются """
+    monkeypatch.chdir(tmp_path)
+    manager = SimulationDataManager('run.hdf')
+    manager.interaction_data = {'Detector': [_events(0, 3)]}
+
+    def fail(*args, **kwds):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(manager.writer, 'write_dict', fail)
+    with pytest.raises(OSError):
+        manager.save_interaction_data()
+    np.testing.assert_array_equal(manager.interaction_data['Detector'][0]['energy_deposit'], np.arange(3))
+    manager.close()
@@ -0,0 +1,55 @@
+import shutil
+from pathlib import Path
+
+import h5py
+import hepunits as units
+import numpy as np
+import pytest
+from numpy.random import SeedSequence
+
+from core.transport.studies import modeling, prepare_scene, read_study_config
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def study(tmp_path, monkeypatch):
+    """ Малое исследование с откликом детектора (пути баз данных и фантомов - от корня репозитория) """
+    monkeypatch.chdir(ROOT)
+    directory = f'pytest_{tmp_path.name}'
+    study = tmp_path/'study.toml'
+    study.write_text(
+        f'base = "{(ROOT/"studies/brain_healthy.toml").as_posix()}"\n'
+        f'name = "pytest"\n'
+        f'particles_number = 3000\n'
+        f'[acquisition]\nviews = 2\ngamma_cameras = 2\ntime_stop = "0.001 s"\n'
+        f'[output]\ndirectory = "{directory}"\ntelegram = false\ninteraction_buffer_size = 200\n',
+        encoding='utf-8'
+    )
+    prepare_scene(read_study_config(study))
+    yield study
+    shutil.rmtree(ROOT/'output data'/directory, ignore_errors=True)
+
+
+def _read_events(filename):
+    with h5py.File(filename, 'r') as file:
+        return {
+            f'{volume_name}/{field}': volume_group[field][()]
+            for volume_name, volume_group in file['interaction_data'].items()
+            for field in ('energy_deposit', 'local_position', 'emission_time')
+        }
+
+
+def test_seeded_runs_with_response_are_identical(study):
+    """ Отклик детектора в потоке потребителя не нарушает воспроизводимость при одном seed """
+    config = read_study_config(study)
+    runs = []
+    for run in range(3):
+        filename = Path(f'output data/{config.output_directory}/run{run}.hdf')
+        modeling(study, 0., (0., 3e-4*units.s), SeedSequence(123), filename)
+        runs.append(_read_events(filename))
+    assert sum(data.shape[0] for name, data in runs[0].items() if name.endswith('energy_deposit')) > 0
+    for run in runs[1:]:
+        assert run.keys() == runs[0].keys()
+        for name, data in runs[0].items():
+            np.testing.assert_array_equal(data, run[name], err_msg=name)
@@ -0,0 +1,70 @@
+"""
+Бюджет времени импорта модулей ядра
+
+Каждый модуль импортируется в новом интерпретаторе (лучшее время из повторов).
+Импорт должен укладываться в бюджет, не читать базы данных NIST
+и не тянуть GUI и Telegram зависимости.
+На медленных машинах бюджеты умножаются на NMSIM_IMPORT_BUDGET_SCALE
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Бюджет, с. Модули с ядрами numba платят за импорт numba (около 0.3 с)
+BUDGETS: Dict[str, float] = {
+    'core.geometry.geometries': 0.3,
+    'core.geometry.volumes': 0.4,
+    'core.source.sources': 0.4,
+    'core.geometry.voxel_volumes': 0.8,
+    'core.geometry.gamma_cameras': 0.8,
+    'core.physics.processes': 0.8,
+    'core.transport.propagation_managers': 0.8,
+    'core.transport.simulation_managers': 0.8,
+    'core.transport.studies': 0.8,
+    'core.data.listmode': 0.8
+}
+
+FORBIDDEN = ('telebot', 'pyqtgraph', 'PyQt5')
+
+REPEATS = 3
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+database = sys.modules.get('settings.database_setting')
+print(json.dumps({{
+    'time': elapsed,
+    'databases_loaded': database is not None and 'attenuation_database' in vars(database),
+    'forbidden': [name for name in {forbidden!r} if name in sys.modules]
+}}))
+"""
+
+
+def _measure_import(module: str) -> Dict[str, Any]:
+    """ Лучшее время импорта модуля в новом интерпретаторе и побочные эффекты импорта """
+    results = []
+    for _ in range(REPEATS):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module, forbidden=FORBIDDEN)],
+            capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        results.append(json.loads(output.splitlines()[-1]))
+    return min(results, key=lambda result: result['time'])
+
+
+@pytest.mark.parametrize('module', list(BUDGETS))
+def test_import_is_cheap(module):
+    result = _measure_import(module)
+    assert not result['databases_loaded'], f'{module} читает базы данных NIST при импорте'
+    assert result['forbidden'] == [], f'{module} импортирует {", ".join(result["forbidden"])}'
+    budget = BUDGETS[module]*float(os.environ.get('NMSIM_IMPORT_BUDGET_SCALE', 1.))
+    assert result['time'] <= budget, f'{module}: {result["time"]*1e3:.0f} ms (бюджет {budget*1e3:.0f} ms)'
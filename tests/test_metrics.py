@@ -0,0 +1,48 @@
+import json
+import shutil
+from pathlib import Path
+
+import h5py
+import hepunits as units
+import pytest
+from numpy.random import SeedSequence
+
+from core.transport.studies import metrics_directory, modeling, prepare_scene, read_study_config
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def study(tmp_path, monkeypatch):
+    """ Короткое исследование с файлом метрик и файлом Prometheus """
+    monkeypatch.chdir(ROOT)
+    directory = f'pytest_{tmp_path.name}'
+    study = tmp_path/'study.toml'
+    study.write_text(
+        f'base = "{(ROOT/"studies/brain_healthy.toml").as_posix()}"\n'
+        f'name = "pytest"\n'
+        f'particles_number = 3000\n'
+        f'[acquisition]\nviews = 1\ngamma_cameras = 2\ntime_stop = "0.001 s"\n'
+        f'[output]\ndirectory = "{directory}"\ntelegram = false\ninteraction_buffer_size = 200\n'
+        f'metrics_file = true\nprometheus = true\n',
+        encoding='utf-8'
+    )
+    prepare_scene(read_study_config(study))
+    yield study
+    shutil.rmtree(ROOT/'output data'/directory, ignore_errors=True)
+
+
+def test_final_metrics_count_all_written_events(study):
+    """ Последняя запись метрик сделана после сохранения всех событий единицы работы """
+    config = read_study_config(study)
+    filename = Path(f'output data/{config.output_directory}/run.hdf')
+    modeling(study, 0., (0., 3e-4*units.s), SeedSequence(1), filename)
+    with h5py.File(filename, 'r') as file:
+        events = sum(volume_group['energy_deposit'].shape[0] for volume_group in file['interaction_data'].values())
+    assert events > 0
+    last = json.loads(filename.with_suffix('.metrics.jsonl').read_text(encoding='utf-8').splitlines()[-1])
+    assert last['events_written'] == events
+    assert last['progress']['events_written'] == events
+    prometheus = (metrics_directory(config)/'run.prom').read_text(encoding='utf-8')
+    written = [float(line.split()[-1]) for line in prometheus.splitlines() if line.startswith('nmsim_events_written{')]
+    assert written == [events]
@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from core.transport.schedulers import JobScheduler, WorkUnit
+
+
+def _task(value: int, crash_marker: str) -> int:
+    """ Задача, процесс которой аварийно завершается, пока существует crash_marker """
+    marker = Path(crash_marker)
+    if value == 1 and marker.exists():
+        marker.unlink()
+        os._exit(1)
+    return value*10
+
+
+def _always_crash(value: int, crash_marker: str) -> int:
+    if value == 1:
+        os._exit(1)
+    return value*10
+
+
+def _units(crash_marker: Path):
+    return [WorkUnit(key=f'{value} deg', time_interval=(0., 1.), args=(value, str(crash_marker))) for value in range(4)]
+
+
+def test_crashed_worker_is_retried(tmp_path):
+    """ Аварийное завершение процесса пула не подвешивает планировщик, единица выполняется повторно """
+    crash_marker = tmp_path/'crash'
+    crash_marker.touch()
+    results = JobScheduler(_task, 2, resume=False).run(_units(crash_marker))
+    assert sorted(result for _, result in results) == [0, 10, 20, 30]
+
+
+def test_always_crashing_unit_is_abandoned(tmp_path):
+    scheduler = JobScheduler(_always_crash, 2, max_retries=1, resume=False)
+    with pytest.raises(RuntimeError):
+        scheduler.run(_units(tmp_path/'crash'))
+    assert [unit.key for unit in scheduler.failed] == ['1 deg']
+    assert scheduler.failed[0].attempts == 2
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import hepunits as units
+import numpy as np
+import pytest
+
+from core.source.sources import CompositeSource, I123, Tc99m_MIBI
+from core.transport.studies import StudyConfig, slice_decays
+
+DECAYS = 100003
+
+
+def _config(source):
+    return StudyConfig(Path('test.toml'), {
+        'name': 'test',
+        'acquisition': {
+            'views': 1,
+            'gamma_cameras': 1,
+            'angle_start': 0.,
+            'angle_stop': 0.,
+            'time_start': '0 s',
+            'time_stop': '20 hour',
+            'decays': DECAYS
+        },
+        'source': source
+    })
+
+
+def _emit_window(source, time_start, time_stop, decays=None, batch=4096):
+    """ Испустить все распады окна пакетами, как SimulationManager """
+    source.set_time_window(time_start, time_stop, decays)
+    emission_time = []
+    while source.timer < time_stop:
+        particles = source.generate_particles(batch)
+        emission_time.append(particles.emission_time)
+    return np.concatenate(emission_time) if emission_time else np.empty(0)
+
+
+@pytest.fixture
+def distribution():
+    return np.random.default_rng(1).random((4, 5, 6))
+
+
+def test_time_slices_split_decays_exactly(distribution):
+    """ Отрезки получают в сумме ровно [acquisition] decays распадов, таймер заканчивает каждый отрезок на его конце """
+    config = _config({'type': 'Tc99m_MIBI', 'activity': '1 MBq'})
+    source = Tc99m_MIBI(distribution, 1*units.MBq)
+    source.rng = np.random.default_rng(2)
+    time_points = np.linspace(0., 20*units.hour, 8)
+    total = 0
+    expected_fraction = []
+    for time_start, time_stop in zip(time_points[:-1], time_points[1:]):
+        decays = slice_decays(config, source, (time_start, time_stop))
+        emission_time = _emit_window(source, time_start, time_stop, decays)
+        assert emission_time.size == decays
+        assert source.timer == time_stop
+        assert np.all(np.diff(emission_time) >= 0)
+        assert time_start <= emission_time[0] and emission_time[-1] <= time_stop
+        total += decays
+        expected_fraction.append(source.decays(time_start, time_stop)/source.decays(time_points[0], time_points[-1]))
+    assert total == DECAYS
+    # Распад Tc-99m за 20 часов: доли отрезков убывают по экспоненте
+    assert np.all(np.diff(expected_fraction) < 0)
+
+
+def test_poisson_window_ends_at_window_stop(distribution):
+    source = Tc99m_MIBI(distribution, 1*units.MBq)
+    source.rng = np.random.default_rng(3)
+    emission_time = _emit_window(source, 0., 0.01*units.s)
+    assert source.timer == 0.01*units.s
+    assert abs(emission_time.size - 10**4) < 5*np.sqrt(10**4)
+
+
+def test_empty_window(distribution):
+    source = Tc99m_MIBI(distribution, 1*units.MBq)
+    emission_time = _emit_window(source, units.s, 2*units.s, 0)
+    assert emission_time.size == 0
+    assert source.timer == 2*units.s
+
+
+def test_composite_slices_split_decays_exactly(distribution):
+    """ Составной источник делит распады отрезков между компонентами, сумма по отрезкам точна """
+    config = _config({
+        'type': 'CompositeSource',
+        'components': [{'type': 'Tc99m_MIBI', 'activity': '2 MBq'}, {'type': 'I123', 'activity': '1 MBq'}]
+    })
+    source = CompositeSource([Tc99m_MIBI(distribution, 2*units.MBq), I123(distribution, 1*units.MBq)], np.random.default_rng(4))
+    time_points = np.linspace(0., 20*units.hour, 4)
+    total = 0
+    for time_start, time_stop in zip(time_points[:-1], time_points[1:]):
+        decays = slice_decays(config, source, (time_start, time_stop))
+        emission_time = _emit_window(source, time_start, time_stop, decays)
+        assert emission_time.size == decays
+        assert source.timer == time_stop
+        total += decays
+    assert total == DECAYS
+
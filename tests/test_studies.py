@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from core.source.sources import I123
+from core.transport.studies import StudyConfig
+
+
+def _config(source):
+    return StudyConfig(Path('test.toml'), {
+        'name': 'test',
+        'acquisition': {'views': 1, 'gamma_cameras': 1, 'angle_start': 0., 'angle_stop': 0., 'time_stop': '1 hour'},
+        'source': source
+    })
+
+
+def test_half_life_comes_from_isotope_class():
+    assert _config({'type': 'I123', 'activity': '1 MBq'}).description().half_life == I123.half_life
+
+
+def test_half_life_key_must_match_isotope():
+    """ Ключ half_life, расходящийся с периодом полураспада изотопа, - ошибка конфигурации """
+    with pytest.raises(ValueError):
+        _config({'type': 'I123', 'activity': '1 MBq', 'half_life': '6 hour'}).description()
+    assert _config({'type': 'I123', 'activity': '1 MBq', 'half_life': '13.27 hour'}).description().half_life == I123.half_life
+
+
+def test_composite_half_life_checks_components():
+    with pytest.raises(ValueError):
+        _config({
+            'type': 'CompositeSource',
+            'components': [{'type': 'Tc99m_MIBI', 'activity': '1 MBq'}, {'type': 'I123', 'activity': '1 MBq', 'half_life': '6 hour'}]
+        }).description()
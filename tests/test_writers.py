@@ -0,0 +1,55 @@
+import h5py
+import numpy as np
+import pytest
+
+from core.data.writers import HDF5Writer, committed_size, merge_shards
+
+EVENTS = np.dtype([('energy_deposit', np.float64), ('local_position', np.float64, (3, ))])
+
+
+def _write_shard(filename, start, committed, written, timer):
+    """ Фрагмент с событиями start..start+written, из которых записаны полностью committed """
+    data = np.zeros(written, dtype=EVENTS)
+    data['energy_deposit'] = np.arange(start, start + written)
+    data['local_position'] = data['energy_deposit'][:, np.newaxis]
+    with HDF5Writer(filename, chunk_size=4) as writer:
+        writer.write_dict({'Detector': data}, 'interaction_data')
+        with writer.opened() as file:
+            for dataset in file['interaction_data/Detector'].values():
+                dataset.attrs['committed_size'] = committed
+            if timer is not None:
+                file.create_dataset('Source timer', data=timer)
+
+
+@pytest.fixture
+def shards(tmp_path):
+    filenames = [tmp_path/f'run.{index}.hdf' for index in range(4)]
+    _write_shard(filenames[0], 0, 5, 5, 1.)
+    _write_shard(filenames[1], 5, 3, 6, 2.)
+    _write_shard(filenames[2], 8, 4, 4, None)
+    _write_shard(filenames[3], 12, 2, 2, 4.)
+    return filenames
+
+
+@pytest.mark.parametrize('virtual', [True, False])
+def test_merge_shards_stops_at_incomplete_shard(tmp_path, shards, virtual):
+    """ Объединяются только завершённые фрагменты до первого незавершённого и только записанные строки """
+    filename = tmp_path/'run.hdf'
+    assert merge_shards(shards, filename, virtual=virtual, chunk_size=4) == 2.
+    with h5py.File(filename, 'r') as file:
+        assert float(np.array(file['Source timer'])) == 2.
+        group = file['interaction_data/Detector']
+        np.testing.assert_array_equal(group['energy_deposit'][()], np.arange(8))
+        np.testing.assert_array_equal(group['local_position'][()], np.repeat(np.arange(8.)[:, np.newaxis], 3, axis=1))
+        assert all(committed_size(dataset) == 8 for dataset in group.values())
+
+
+def test_merge_shards_without_complete_shards(tmp_path, shards):
+    filename = tmp_path/'run.hdf'
+    assert merge_shards(shards[2:], filename) is None
+    assert not filename.exists()
+
+
+def test_committed_size_of_legacy_dataset(tmp_path):
+    with h5py.File(tmp_path/'legacy.hdf', 'w') as file:
+        assert committed_size(file.create_dataset('energy_deposit', data=np.zeros(7))) == 7